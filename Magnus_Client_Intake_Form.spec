@@ -21,6 +21,27 @@ a = Analysis(
         'magnus_app.validation',
         'magnus_app.main_window',
         'magnus_app.app',
+        'magnus_app.perf',
+        'magnus_app.diagnostics',
+        'magnus_app.startup',
+        'magnus_app.logrotate',
+        'magnus_app.optional',
+        'magnus_app.pdf_generator_reportlab',
+        'magnus_app.splash',
+        'magnus_app.form_check',
+        'magnus_app.workers',
+        'magnus_app.async_checks',
+        'magnus_app.crd_snapshot',
+        'magnus_app.visibility',
+        'magnus_app.conditions',
+        'magnus_app.model',
+        'magnus_app.item_table',
+        'magnus_app.item_pool',
+        'magnus_app.countries',
+        'magnus_app.selects',
+        'magnus_app.spec_loader',
+        'magnus_app.page_cache',
+        'magnus_app.dates',
     ],
     hookspath=[],
     hooksconfig={},
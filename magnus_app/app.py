@@ -2,6 +2,12 @@ from __future__ import annotations
 import os, sys, io, platform, datetime, traceback
 from pathlib import Path
 
+from . import startup
+from .logrotate import LogRotator
+
+if startup.requested():
+    startup.install_import_profiler()
+
 _APP_NAME = "Magnus Client Intake"
 
 
@@ -33,6 +39,7 @@ def _user_log_dir() -> Path:
 
 _LOG_DIR = _user_log_dir()
 _LOG_PATH = _LOG_DIR / "crash.log"
+_ROTATOR = LogRotator.from_env(_LOG_PATH)
 
 
 def log_path() -> Path:
@@ -46,21 +53,19 @@ def _log(msg: str) -> None:
             if not msg.endswith("\n"):
                 f.write("\n")
             f.flush()
+            size = f.tell()
+        _ROTATOR.after_write(size)
     except Exception:
         # never raise from logger
         pass
 
 
-def _rotate_if_large(limit_mb: int = 5) -> None:
-    try:
-        if _LOG_PATH.exists() and _LOG_PATH.stat().st_size > limit_mb * 1024 * 1024:
-            ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
-            _LOG_PATH.rename(_LOG_PATH.with_name(f"crash-{ts}.log"))
-    except Exception:
-        pass
+def _boot(phase: str) -> None:
+    _log(f"[BOOT] {phase} +{startup.mark(phase):.1f}ms")
 
 
-_rotate_if_large()
+# Size/age rotation; gzip + retention run on a background thread
+_ROTATOR.start()
 
 
 # Capture ANY uncaught exception very early
@@ -132,12 +137,16 @@ _log(f"Python: {platform.python_version()}  OS: {platform.platform()}")
 _log(f"argv: {sys.argv}")
 
 install_qt_message_handler()
+_boot("logging ready")
 
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QPalette, QColor
 from PyQt6.QtWidgets import QApplication, QStyleFactory
 
-from .main_window import MagnusClientIntakeForm
+from .splash import BootSplash
+
+_boot("PyQt6 imported")
 
 
 def _load_qss(app: QApplication) -> None:
@@ -146,9 +155,17 @@ def _load_qss(app: QApplication) -> None:
         app.setStyleSheet(qss.read_text(encoding="utf-8"))
 
 
+def _finish_startup() -> None:
+    _boot("background init done")
+    if startup.is_profiling():
+        path = startup.write_report(_LOG_DIR)
+        _log(f"[BOOT] startup profile written to {path}")
+
+
 def main() -> None:
-    _log("[BOOT] main()")
+    _boot("main()")
     app = QApplication(sys.argv)
+    _boot("QApplication created")
 
     # Consistent, light baseline (prevents platform dark themes)
     app.setStyle(QStyleFactory.create("Fusion"))
@@ -159,9 +176,60 @@ def main() -> None:
     pal.setColor(QPalette.ColorRole.Button, QColor("#1677ff"))
     pal.setColor(QPalette.ColorRole.ButtonText, QColor("#ffffff"))
     app.setPalette(pal)
+
+    # Staged boot: splash first, then only what the first page needs.
+    # Remaining pages, the PDF generator and crypto follow on idle.
+    splash = BootSplash()
+    splash.show()
+    splash.step("Starting…")
+    _boot("splash shown")
+
     _load_qss(app)
+    _boot("theme applied")
+
+    splash.step("Loading form…")
+    from .validation import load_plugins
+
+    for name, err in load_plugins().items():
+        _log(f"[PLUGIN] {name}: {'loaded' if err is None else repr(err)}")
+
+    from .spec_loader import SpecError, dev_mode, install_pages, load_pages, spec_dir_from_env
+
+    spec_dir = spec_dir_from_env()
+    if spec_dir is not None:
+        try:
+            pages, cached = load_pages(spec_dir)
+            install_pages(pages)
+            _log(f"[SPEC] {len(pages)} pages from {spec_dir}{' (cached)' if cached else ''}")
+        except (SpecError, OSError) as e:
+            _log(f"[SPEC] {spec_dir}: {e}")
+            from PyQt6.QtWidgets import QMessageBox
+
+            QMessageBox.warning(
+                None, "Page specs",
+                f"The page specs in\n{spec_dir}\ncould not be loaded; using the built-in pages.\n\n{e}",
+            )
+            spec_dir = None
+        _boot("page specs loaded")
+    from .main_window import MagnusClientIntakeForm
+
+    _boot("main_window imported")
+
+    splash.step("Preparing first page…")
     form = MagnusClientIntakeForm()
+    _boot("first page built")
+    form.background_ready.connect(_finish_startup)
+    if spec_dir is not None and dev_mode():
+        form.watch_specs(spec_dir)
     form.show()
+    splash.finish(form)
+    _boot("window shown")
+
+    def _interactive() -> None:
+        _boot("first event-loop idle (interactive)")
+        form.start_background_init()
+
+    QTimer.singleShot(0, _interactive)
     sys.exit(app.exec())
 
 
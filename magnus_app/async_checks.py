@@ -0,0 +1,81 @@
+"""Background validators for the page on screen.
+
+A validator registered with ``background=True`` may block (a CRD snapshot
+lookup, a postal dataset), so the window never calls it inline.
+:meth:`AsyncChecks.status` answers from the last finished run when the
+field's value and dependencies are unchanged; otherwise it bumps the
+field's edit generation, submits a new run to the worker pool and reports
+"pending".  A result is only kept if its generation is still the field's
+latest, so a slow answer for an old value can never overwrite a newer one.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional
+
+from .validation import Validator
+from .workers import workers
+
+
+class _Entry:
+    __slots__ = ("generation", "fingerprint", "result", "future")
+
+    def __init__(self, generation: int, fingerprint: tuple) -> None:
+        self.generation = generation
+        self.fingerprint = fingerprint
+        self.result: Optional[bool] = None  # None while running
+        self.future: Optional[Future] = None
+
+
+class AsyncChecks:
+    def __init__(self, on_result: Callable[[], None]) -> None:
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._on_result = on_result
+
+    def status(
+        self, key: Hashable, validator: Validator, value: Any, data: Mapping[str, Any]
+    ) -> Optional[bool]:
+        """True/False once known for this value, None while a run is pending."""
+        deps = {dep: data.get(dep) for dep in validator.deps}
+        fingerprint = (validator.name, value, *deps.values())
+        entry = self._entries.get(key)
+        if entry is not None and entry.fingerprint == fingerprint:
+            return entry.result
+
+        generation = 1
+        if entry is not None:
+            generation = entry.generation + 1
+            if entry.future is not None:
+                entry.future.cancel()  # only helps if it has not started yet
+        entry = _Entry(generation, fingerprint)
+        self._entries[key] = entry
+        entry.future = workers().submit(
+            validator, value, deps,
+            on_done=lambda f: self._finished(key, generation, f),
+        )
+        return None
+
+    def _finished(self, key: Hashable, generation: int, future: Future) -> None:
+        entry = self._entries.get(key)
+        if entry is None or entry.generation != generation or future.cancelled():
+            return  # the field was edited again meanwhile
+        entry.future = None
+        try:
+            entry.result = bool(future.result())
+        except Exception as e:
+            # A broken lookup must not lock the user out of the form
+            from .app import _log
+
+            _log(f"[VALIDATE] background check {key!r} failed: {e!r}")
+            entry.result = True
+        self._on_result()
+
+    def pending(self) -> bool:
+        return any(entry.result is None for entry in self._entries.values())
+
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop entries (e.g. of a removed repeating-group item)."""
+        for key in [k for k in self._entries if predicate(k)]:
+            entry = self._entries.pop(key)
+            if entry.future is not None:
+                entry.future.cancel()
@@ -0,0 +1,352 @@
+"""Format sweep over saved drafts, for the nightly compliance run.
+
+Drafts are loaded into one column per field.  Each check then runs a
+compiled pattern over a whole column at once: the column is joined into a
+single string and scanned with ``MULTILINE`` anchors, so the per-value work
+happens inside the regex engine instead of a Python call per field per file.
+Only the few values that need more than a pattern (calendar dates,
+percentages above 100, cross-field rules) are re-checked one by one.
+
+The rules are the GUI's: every ``validate`` name in PAGES, plus the
+SSN/phone/email checks that EnhancedLineEdit picks by field name.  Empty
+values are skipped, as in the form.  Hidden (``show_if``) fields are
+checked too: a stored value is a stored value.
+
+    python -m magnus_app.batch_validation drafts/ [--json report.json]
+
+Exits with status 1 when any violation is found.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from itertools import compress
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+
+from magnus_app.pages import PAGES
+from magnus_app.validation import (
+    CRD_RE,
+    EMAIL_RE,
+    INVALID_SSNS,
+    PCT_RE,
+    TICKER_RE,
+    VALIDATORS,
+    iso_date,
+)
+
+
+class Violation(NamedTuple):
+    draft: str
+    field: str
+    item: Optional[int]  # index inside a repeating group, else None
+    value: str
+    message: str
+
+
+class _Rule(NamedTuple):
+    pattern: Pattern[str]  # must match the whole (stripped) value
+    message: str
+    strip: Optional[Pattern[str]] = None  # characters removed before matching
+    confirm: Optional[Callable[[str], bool]] = None  # exact check on matches
+    confirm_message: Optional[str] = None
+
+
+def _column(pattern: Pattern[str]) -> Pattern[str]:
+    return re.compile(f"^(?:{pattern.pattern})$", re.MULTILINE)
+
+
+def _pct_in_range(value: str) -> bool:
+    return float(value) <= 100
+
+
+# What a passing row is collapsed to during a column scan
+_MARK = "\x01"
+
+# Non-digits except the row separator
+_NON_DIGIT_ROW = re.compile(r"[^\d\n]")
+
+_DATE_RULE = _Rule(
+    re.compile(r"^\d{1,4}-\d{1,2}-\d{1,2}$", re.MULTILINE),
+    VALIDATORS["iso_date"].message,
+    confirm=iso_date,
+)
+
+RULES: Dict[str, _Rule] = {
+    "iso_date": _DATE_RULE,
+    "iso_date>=pep_start": _DATE_RULE,  # the ordering is checked afterwards
+    "ticker": _Rule(_column(TICKER_RE), VALIDATORS["ticker"].message),
+    "pct_0_100_two_dec": _Rule(
+        _column(PCT_RE),
+        VALIDATORS["pct_0_100_two_dec"].message,
+        confirm=_pct_in_range,
+    ),
+    "crd": _Rule(_column(CRD_RE), VALIDATORS["crd"].message),
+    "ssn": _Rule(
+        re.compile(r"^\d{9}$", re.MULTILINE),
+        "SSN must be 9 digits",
+        strip=_NON_DIGIT_ROW,
+        confirm=lambda v: _NON_DIGIT_ROW.sub("", v) not in INVALID_SSNS,
+        confirm_message="Please enter a valid SSN",
+    ),
+    "phone": _Rule(
+        re.compile(r"^\d{10}$", re.MULTILINE),
+        "Phone number must be 10 digits",
+        strip=_NON_DIGIT_ROW,
+    ),
+    "email": _Rule(_column(EMAIL_RE), "Please enter a valid email address"),
+}
+
+
+# ---------------------------------------------------------------- SPEC --
+def _rule_name(fld: Dict[str, Any]) -> Optional[str]:
+    if fld.get("validate"):
+        return fld["validate"]
+    if fld.get("type") != "text":
+        return None
+    name = fld.get("name", "").lower()
+    for key in ("ssn", "phone", "email"):
+        if key in name:
+            return key
+    return None
+
+
+def checked_fields(pages: List[Dict[str, Any]] = PAGES) -> Dict[Tuple[Optional[str], str], str]:
+    """Map (repeating group or None, field name) to the rule it gets."""
+    out: Dict[Tuple[Optional[str], str], str] = {}
+
+    def walk(fields, group):
+        for fld in fields:
+            ftype = fld.get("type")
+            if ftype == "group":
+                walk(fld.get("fields", []), group)
+            elif ftype == "repeating_group":
+                walk(fld.get("fields", []), fld.get("name"))
+            else:
+                rule = _rule_name(fld)
+                if rule:
+                    out[(group, fld["name"])] = rule
+
+    for page in pages:
+        for section in page.get("sections", []):
+            walk(section.get("fields", []), None)
+    return out
+
+
+# ------------------------------------------------------------- COLUMNS --
+class Column(NamedTuple):
+    values: List[str]  # "" where the draft has no value
+    rows: Optional[List[int]] = None  # draft index per value; None = position
+    items: Optional[List[int]] = None  # repeating-group item per value
+
+    def row(self, pos: int) -> int:
+        return pos if self.rows is None else self.rows[pos]
+
+    def item(self, pos: int) -> Optional[int]:
+        return None if self.items is None else self.items[pos]
+
+
+def _as_text(values: List[Any]) -> List[str]:
+    # None/False/0 count as empty, as in the form
+    return [v if v.__class__ is str else (str(v) if v else "") for v in values]
+
+
+def load_columns(
+    drafts: List[Dict[str, Any]], fields: Iterable[Tuple[Optional[str], str]]
+) -> Dict[Tuple[Optional[str], str], Column]:
+    """Pivot drafts into one column of string values per field.
+
+    Top-level fields get one value per draft.  Repeating-group subfields get
+    one value per item and carry the draft and item index alongside.
+    """
+    columns: Dict[Tuple[Optional[str], str], Column] = {}
+    nested: Dict[str, List[str]] = {}
+    for group, name in fields:
+        if group is None:
+            columns[(None, name)] = Column(_as_text([d.get(name) for d in drafts]))
+        else:
+            nested.setdefault(group, []).append(name)
+
+    for group, names in nested.items():
+        rows: List[int] = []
+        items: List[int] = []
+        entries: List[Dict[str, Any]] = []
+        for row, draft in enumerate(drafts):
+            group_items = draft.get(group)
+            if not isinstance(group_items, list):
+                continue
+            for i, entry in enumerate(group_items):
+                if isinstance(entry, dict):
+                    rows.append(row)
+                    items.append(i)
+                    entries.append(entry)
+        for name in names:
+            columns[(group, name)] = Column(
+                _as_text([e.get(name) for e in entries]), rows, items
+            )
+    return columns
+
+
+def scan_column(values: List[str], rule: _Rule) -> List[Tuple[int, str]]:
+    """Return (position, message) for every non-empty value failing ``rule``."""
+    if not values:
+        return []
+    text = "\n".join(values)
+    if text.count("\n") != len(values) - 1:
+        # A value spans lines; keep one row per value (it fails anyway)
+        text = "\n".join(v.replace("\n", "\x00") for v in values)
+    if "\x01" in text:
+        text = text.replace("\x01", "\x00")  # reserved for the pass marker
+    if rule.strip is not None:
+        text = rule.strip.sub("", text)
+    # Collapse every passing row to a marker, then read the rows back
+    rows = rule.pattern.sub("\x01", text).split("\n")
+    positions = range(len(rows))
+    bad = [
+        (pos, rule.message)
+        for pos in compress(positions, map(_MARK.__ne__, rows))
+        if values[pos]
+    ]
+    if rule.confirm is not None:
+        # Drafts share a lot of values; check each distinct one once
+        passed = set(compress(values, map(_MARK.__eq__, rows)))
+        rejected = {v for v in passed if not _safe(rule.confirm, v)}
+        if rejected:
+            message = rule.confirm_message or rule.message
+            bad.extend(
+                (pos, message) for pos in compress(positions, map(rejected.__contains__, values))
+            )
+            bad.sort()
+    return bad
+
+
+def _safe(check: Callable[[str], bool], value: str) -> bool:
+    try:
+        return bool(check(value))
+    except Exception:
+        return False
+
+
+# -------------------------------------------------------------- ENGINE --
+def validate_drafts(
+    drafts: List[Dict[str, Any]], names: List[str], pages: List[Dict[str, Any]] = PAGES
+) -> List[Violation]:
+    fields = checked_fields(pages)
+    columns = load_columns(drafts, fields)
+    violations: List[Violation] = []
+
+    for key, col in columns.items():
+        rule_name = fields[key]
+        group, name = key
+        label = f"{group}.{name}" if group else name
+        rule = RULES.get(rule_name)
+        validator = VALIDATORS.get(rule_name)
+
+        if rule is not None:
+            failed = scan_column(col.values, rule)
+        elif validator is not None:
+            # a validator with no column form yet: one call per value
+            failed = [
+                (pos, validator.message)
+                for pos, value in enumerate(col.values)
+                if value and not validator(value, drafts[col.row(pos)])
+            ]
+        else:
+            continue
+
+        for pos, message in failed:
+            violations.append(
+                Violation(names[col.row(pos)], label, col.item(pos), col.values[pos], message)
+            )
+
+        # Cross-field rules only make sense once the value's own format passed
+        if validator is not None and validator.deps and rule is not None:
+            failed_at = {pos for pos, _ in failed}
+            for pos, value in enumerate(col.values):
+                if not value or pos in failed_at:
+                    continue
+                if not validator(value, drafts[col.row(pos)]):
+                    violations.append(
+                        Violation(names[col.row(pos)], label, col.item(pos), value, validator.message)
+                    )
+
+    violations.sort(key=lambda v: (v.draft, v.field, -1 if v.item is None else v.item))
+    return violations
+
+
+def load_drafts(paths: Iterable[Path]) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    """Read draft JSON files; returns (drafts, names, unreadable)."""
+    drafts: List[Dict[str, Any]] = []
+    names: List[str] = []
+    unreadable: List[str] = []
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            unreadable.append(str(path))
+            continue
+        if isinstance(data, dict):
+            drafts.append(data)
+            names.append(str(path))
+        else:
+            unreadable.append(str(path))
+    return drafts, names, unreadable
+
+
+def _expand(targets: Iterable[str]) -> List[Path]:
+    out: List[Path] = []
+    for target in targets:
+        p = Path(target)
+        out.extend(sorted(p.rglob("*.json")) if p.is_dir() else [p])
+    return out
+
+
+# ----------------------------------------------------------------- CLI --
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m magnus_app.batch_validation",
+        description="Check saved intake drafts for format violations.",
+    )
+    parser.add_argument("paths", nargs="+", help="draft .json files or folders of them")
+    parser.add_argument("--json", metavar="FILE", help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    drafts, names, unreadable = load_drafts(_expand(args.paths))
+    violations = validate_drafts(drafts, names)
+    elapsed = time.perf_counter() - t0
+
+    current = None
+    for v in violations:
+        if v.draft != current:
+            current = v.draft
+            print(current)
+        where = v.field if v.item is None else f"{v.field} (item {v.item + 1})"
+        print(f"  {where}: {v.message} [{v.value!r}]")
+    for name in unreadable:
+        print(f"{name}: could not be read as a draft", file=sys.stderr)
+
+    flagged = len({v.draft for v in violations})
+    print(
+        f"{len(drafts)} drafts checked in {elapsed:.2f}s: "
+        f"{len(violations)} violations in {flagged} drafts, {len(unreadable)} unreadable"
+    )
+
+    if args.json:
+        report = {
+            "checked": len(drafts),
+            "unreadable": unreadable,
+            "violations": [v._asdict() for v in violations],
+        }
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    return 1 if violations or unreadable else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
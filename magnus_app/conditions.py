@@ -0,0 +1,323 @@
+"""``show_if`` conditions, compiled once into predicates.
+
+A condition is either the original mapping form, every pair of which must
+match::
+
+    {'employee_this_bd': 'Yes'}
+
+or an expression string::
+
+    "employee_this_bd == 'Yes' and not no_spouse"
+    "membership_type in ('FINRA', 'NYSE') or sro_member == 'Yes'"
+    "ownership_pct >= 10"
+    "item.relationship != 'Spouse'"
+
+Expressions support ``and``/``or``/``not``, ``==``, ``!=``, ``<``, ``<=``,
+``>``, ``>=``, ``in``/``not in`` against a ``(..)`` or ``[..]`` list, string
+and number literals, ``true``/``false`` and parentheses.  A bare name is
+true when its value is neither empty nor False.  Comparisons (``==``,
+``in`` and the ordering ones) against a number convert the field value
+with ``float()``; a value that does not convert equals no number and
+orders against none.  Names read form values; ``item.<name>``
+reads the current repeating-group item.  In a mapping condition placed on
+a repeating-group subfield, names read the item, as they always have.
+
+:func:`compile_condition` returns a :class:`Condition`: call it as
+``cond(values, item)``; ``cond.deps`` and ``cond.item_deps`` are the form
+and item fields it reads.  Compiled conditions are memoized per spec
+object, so the per-keystroke cost is one dict lookup plus the closures.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+Values = Mapping[str, Any]
+_Eval = Callable[[Values, Values], Any]
+
+_EMPTY: Values = {}
+
+
+class ConditionError(ValueError):
+    """A ``show_if`` expression that does not parse."""
+
+
+class Condition:
+    __slots__ = ("source", "deps", "item_deps", "_fn")
+
+    def __init__(self, source: Any, fn: _Eval, deps: FrozenSet[str], item_deps: FrozenSet[str]):
+        self.source = source
+        self.deps = deps
+        self.item_deps = item_deps
+        self._fn = fn
+
+    def __call__(self, values: Values, item: Optional[Values] = None) -> bool:
+        return bool(self._fn(values, item if item is not None else _EMPTY))
+
+    def __repr__(self) -> str:
+        return f"Condition({self.source!r})"
+
+
+# ----------------------------------------------------------------- LEXER --
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<num>-?\d+(?:\.\d+)?)
+      | (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<op>==|!=|<=|>=|<|>|\(|\)|\[|\]|,)
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?)
+    )""",
+    re.VERBOSE,
+)
+
+_KEYWORDS = {"and", "or", "not", "in", "true", "false", "True", "False"}
+
+
+def _tokenize(text: str) -> List[Tuple[str, str, int]]:
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = _TOKEN.match(text, pos)
+        if not m:
+            raise ConditionError(f"Unexpected {text[pos:].strip()[:10]!r} in show_if {text!r}")
+        kind = m.lastgroup
+        value = m.group(kind)
+        start = m.start(kind)
+        if kind == "name" and value in _KEYWORDS:
+            kind = "kw"
+        tokens.append((kind, value, start))
+        pos = m.end()
+    tokens.append(("end", "", len(text)))
+    return tokens
+
+
+# ---------------------------------------------------------------- PARSER --
+def _to_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _ordering(op: str) -> Callable[[Any, Any], bool]:
+    compare = {
+        "<": lambda a, b: a < b,
+        "<=": lambda a, b: a <= b,
+        ">": lambda a, b: a > b,
+        ">=": lambda a, b: a >= b,
+    }[op]
+
+    def check(a: Any, b: Any) -> bool:
+        if isinstance(a, (int, float)) or isinstance(b, (int, float)):
+            a, b = _to_number(a), _to_number(b)
+            if a is None or b is None:
+                return False
+        elif not (isinstance(a, str) and isinstance(b, str)):
+            return False
+        return compare(a, b)
+
+    return check
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _equal(a: Any, b: Any) -> bool:
+    if _is_number(a) or _is_number(b):
+        a, b = _to_number(a), _to_number(b)
+        return a is not None and a == b
+    return a == b
+
+
+def _member(value: Any, options: FrozenSet[Any]) -> bool:
+    if value in options:
+        return True
+    if isinstance(value, str) and any(_is_number(o) for o in options):
+        number = _to_number(value)
+        return number is not None and number in options
+    return False
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.deps: set = set()
+        self.item_deps: set = set()
+
+    # -- helpers
+    def peek(self) -> Tuple[str, str, int]:
+        return self.tokens[self.pos]
+
+    def take(self) -> Tuple[str, str, int]:
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def accept(self, value: str) -> bool:
+        kind, val, _ = self.peek()
+        if kind in ("kw", "op") and val == value:
+            self.pos += 1
+            return True
+        return False
+
+    def fail(self, what: str) -> ConditionError:
+        _, val, at = self.peek()
+        found = repr(val) if val else "end of expression"
+        return ConditionError(f"Expected {what} at {found} (column {at + 1}) in show_if {self.text!r}")
+
+    # -- grammar
+    def parse(self) -> _Eval:
+        fn = self.or_expr()
+        if self.peek()[0] != "end":
+            raise self.fail("'and', 'or' or end of expression")
+        return fn
+
+    def or_expr(self) -> _Eval:
+        parts = [self.and_expr()]
+        while self.accept("or"):
+            parts.append(self.and_expr())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda v, i: any(p(v, i) for p in parts)
+
+    def and_expr(self) -> _Eval:
+        parts = [self.not_expr()]
+        while self.accept("and"):
+            parts.append(self.not_expr())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda v, i: all(p(v, i) for p in parts)
+
+    def not_expr(self) -> _Eval:
+        if self.accept("not"):
+            inner = self.not_expr()
+            return lambda v, i: not inner(v, i)
+        return self.comparison()
+
+    def comparison(self) -> _Eval:
+        left = self.operand()
+        kind, val, _ = self.peek()
+        if kind == "op" and val in ("==", "!=", "<", "<=", ">", ">="):
+            self.take()
+            right = self.operand()
+            if val == "==":
+                return lambda v, i: _equal(left(v, i), right(v, i))
+            if val == "!=":
+                return lambda v, i: not _equal(left(v, i), right(v, i))
+            check = _ordering(val)
+            return lambda v, i: check(left(v, i), right(v, i))
+        negate = False
+        if kind == "kw" and val == "not" and self.tokens[self.pos + 1][1] == "in":
+            self.take()
+            negate = True
+        if self.accept("in"):
+            options = self.collection()
+            if negate:
+                return lambda v, i: not _member(left(v, i), options)
+            return lambda v, i: _member(left(v, i), options)
+        if negate:
+            raise self.fail("'in'")
+        return lambda v, i: left(v, i) not in ("", None, False)
+
+    def collection(self) -> FrozenSet[Any]:
+        close = ")" if self.accept("(") else "]" if self.accept("[") else None
+        if close is None:
+            raise self.fail("'(' or '['")
+        items = []
+        if not self.accept(close):
+            while True:
+                items.append(self.literal())
+                if self.accept(close):
+                    break
+                if not self.accept(","):
+                    raise self.fail(f"',' or '{close}'")
+        return frozenset(items)
+
+    def literal(self) -> Any:
+        kind, val, _ = self.peek()
+        if kind == "num":
+            self.take()
+            return float(val) if "." in val else int(val)
+        if kind == "str":
+            self.take()
+            return re.sub(r"\\(.)", r"\1", val[1:-1])
+        if kind == "kw" and val in ("true", "True"):
+            self.take()
+            return True
+        if kind == "kw" and val in ("false", "False"):
+            self.take()
+            return False
+        raise self.fail("a string, number, true or false")
+
+    def operand(self) -> _Eval:
+        kind, val, _ = self.peek()
+        if kind == "name":
+            self.take()
+            if val.startswith("item."):
+                key = val[5:]
+                self.item_deps.add(key)
+                return lambda v, i: i.get(key, "")
+            if "." in val:
+                raise ConditionError(f"Unknown scope in {val!r} in show_if {self.text!r}")
+            self.deps.add(val)
+            return lambda v, i: v.get(val, "")
+        if self.accept("("):
+            inner = self.or_expr()
+            if not self.accept(")"):
+                raise self.fail("')'")
+            return inner
+        value = self.literal()
+        return lambda v, i: value
+
+
+# ----------------------------------------------------------------- BUILD --
+def _from_mapping(cond: Mapping[str, Any], item_scope: bool) -> Condition:
+    pairs = tuple(cond.items())
+    if item_scope:
+        fn: _Eval = lambda v, i: all(i.get(k, "") == want for k, want in pairs)
+        return Condition(cond, fn, frozenset(), frozenset(cond))
+    if len(pairs) == 1:
+        (key, want), = pairs
+        fn = lambda v, i: v.get(key, "") == want
+    else:
+        fn = lambda v, i: all(v.get(k, "") == want for k, want in pairs)
+    return Condition(cond, fn, frozenset(cond), frozenset())
+
+
+def _build(cond: Union[str, Mapping[str, Any]], item_scope: bool) -> Condition:
+    if isinstance(cond, Mapping):
+        return _from_mapping(cond, item_scope)
+    if isinstance(cond, str):
+        parser = _Parser(cond)
+        fn = parser.parse()
+        return Condition(cond, fn, frozenset(parser.deps), frozenset(parser.item_deps))
+    raise ConditionError(f"show_if must be a mapping or a string, not {type(cond).__name__}")
+
+
+# id(spec object) -> (spec object, item_scope, compiled); holding the
+# object keeps its id from being reused
+_compiled: Dict[int, Tuple[Any, bool, Condition]] = {}
+
+
+def compile_condition(cond: Union[str, Mapping[str, Any]], item_scope: bool = False) -> Condition:
+    """Compile (or fetch the compiled) ``show_if`` condition.
+
+    ``item_scope`` marks a condition on a repeating-group subfield, whose
+    mapping form reads the item rather than the form.
+    """
+    entry = _compiled.get(id(cond))
+    if entry is not None and entry[0] is cond and entry[1] == item_scope:
+        return entry[2]
+    compiled = _build(cond, item_scope)
+    _compiled[id(cond)] = (cond, item_scope, compiled)
+    return compiled
+
+
+def clear_cache() -> None:
+    """Forget compiled conditions (after the page specs are replaced)."""
+    _compiled.clear()
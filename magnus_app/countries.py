@@ -0,0 +1,107 @@
+"""Named option lists for ``select`` fields (``'options': 'ISO_COUNTRIES'``).
+
+Names are the common English short names of ISO 3166-1 (and of the U.S.
+states and territories for ``US_STATES``), written in ASCII so they sort
+the same way in Python and in Qt's case-insensitive completer.  Each list
+is kept sorted case-insensitively; :func:`entry_index` finds an entry by
+binary search over that order instead of scanning.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+ISO_COUNTRIES: List[str] = [
+    'Afghanistan', 'Aland Islands', 'Albania', 'Algeria', 'American Samoa',
+    'Andorra', 'Angola', 'Anguilla', 'Antarctica', 'Antigua and Barbuda',
+    'Argentina', 'Armenia', 'Aruba', 'Australia', 'Austria', 'Azerbaijan',
+    'Bahamas', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium',
+    'Belize', 'Benin', 'Bermuda', 'Bhutan', 'Bolivia',
+    'Bonaire, Sint Eustatius and Saba', 'Bosnia and Herzegovina', 'Botswana',
+    'Bouvet Island', 'Brazil', 'British Indian Ocean Territory',
+    'British Virgin Islands', 'Brunei', 'Bulgaria', 'Burkina Faso', 'Burundi',
+    'Cabo Verde', 'Cambodia', 'Cameroon', 'Canada', 'Cayman Islands',
+    'Central African Republic', 'Chad', 'Chile', 'China', 'Christmas Island',
+    'Cocos (Keeling) Islands', 'Colombia', 'Comoros', 'Congo',
+    'Congo (Democratic Republic)', 'Cook Islands', 'Costa Rica',
+    "Cote d'Ivoire", 'Croatia', 'Cuba', 'Curacao', 'Cyprus', 'Czechia',
+    'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic', 'Ecuador',
+    'Egypt', 'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia',
+    'Eswatini', 'Ethiopia', 'Falkland Islands', 'Faroe Islands', 'Fiji',
+    'Finland', 'France', 'French Guiana', 'French Polynesia',
+    'French Southern Territories', 'Gabon', 'Gambia', 'Georgia', 'Germany',
+    'Ghana', 'Gibraltar', 'Greece', 'Greenland', 'Grenada', 'Guadeloupe',
+    'Guam', 'Guatemala', 'Guernsey', 'Guinea', 'Guinea-Bissau', 'Guyana',
+    'Haiti', 'Heard Island and McDonald Islands', 'Holy See', 'Honduras',
+    'Hong Kong', 'Hungary', 'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq',
+    'Ireland', 'Isle of Man', 'Israel', 'Italy', 'Jamaica', 'Japan', 'Jersey',
+    'Jordan', 'Kazakhstan', 'Kenya', 'Kiribati', 'Korea (North)',
+    'Korea (South)', 'Kuwait', 'Kyrgyzstan', 'Laos', 'Latvia', 'Lebanon',
+    'Lesotho', 'Liberia', 'Libya', 'Liechtenstein', 'Lithuania', 'Luxembourg',
+    'Macao', 'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Malta',
+    'Marshall Islands', 'Martinique', 'Mauritania', 'Mauritius', 'Mayotte',
+    'Mexico', 'Micronesia', 'Moldova', 'Monaco', 'Mongolia', 'Montenegro',
+    'Montserrat', 'Morocco', 'Mozambique', 'Myanmar', 'Namibia', 'Nauru',
+    'Nepal', 'Netherlands', 'New Caledonia', 'New Zealand', 'Nicaragua',
+    'Niger', 'Nigeria', 'Niue', 'Norfolk Island', 'North Macedonia',
+    'Northern Mariana Islands', 'Norway', 'Oman', 'Pakistan', 'Palau',
+    'Palestine', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru',
+    'Philippines', 'Pitcairn', 'Poland', 'Portugal', 'Puerto Rico', 'Qatar',
+    'Reunion', 'Romania', 'Russia', 'Rwanda', 'Saint Barthelemy',
+    'Saint Helena, Ascension and Tristan da Cunha', 'Saint Kitts and Nevis',
+    'Saint Lucia', 'Saint Martin (French part)', 'Saint Pierre and Miquelon',
+    'Saint Vincent and the Grenadines', 'Samoa', 'San Marino',
+    'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia',
+    'Seychelles', 'Sierra Leone', 'Singapore', 'Sint Maarten (Dutch part)',
+    'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa',
+    'South Georgia and the South Sandwich Islands', 'South Sudan', 'Spain',
+    'Sri Lanka', 'Sudan', 'Suriname', 'Svalbard and Jan Mayen', 'Sweden',
+    'Switzerland', 'Syria', 'Taiwan', 'Tajikistan', 'Tanzania', 'Thailand',
+    'Timor-Leste', 'Togo', 'Tokelau', 'Tonga', 'Trinidad and Tobago',
+    'Tunisia', 'Turkey', 'Turkmenistan', 'Turks and Caicos Islands', 'Tuvalu',
+    'U.S. Virgin Islands', 'Uganda', 'Ukraine', 'United Arab Emirates',
+    'United Kingdom', 'United States', 'United States Minor Outlying Islands',
+    'Uruguay', 'Uzbekistan', 'Vanuatu', 'Venezuela', 'Vietnam',
+    'Wallis and Futuna', 'Western Sahara', 'Yemen', 'Zambia', 'Zimbabwe',
+]
+
+US_STATES: List[str] = [
+    'Alabama', 'Alaska', 'American Samoa', 'Arizona', 'Arkansas',
+    'California', 'Colorado', 'Connecticut', 'Delaware',
+    'District of Columbia', 'Florida', 'Georgia', 'Guam', 'Hawaii', 'Idaho',
+    'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine',
+    'Maryland', 'Massachusetts', 'Michigan', 'Minnesota', 'Mississippi',
+    'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire',
+    'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota',
+    'Northern Mariana Islands', 'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania',
+    'Puerto Rico', 'Rhode Island', 'South Carolina', 'South Dakota',
+    'Tennessee', 'Texas', 'U.S. Virgin Islands', 'Utah', 'Vermont',
+    'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming',
+]
+
+# 'options' value in PAGES -> entries
+OPTION_LISTS: Dict[str, List[str]] = {
+    'ISO_COUNTRIES': ISO_COUNTRIES,
+    'US_STATES': US_STATES,
+}
+
+
+@lru_cache(maxsize=None)
+def _keys(list_name: str) -> Tuple[str, ...]:
+    keys = tuple(name.casefold() for name in OPTION_LISTS[list_name])
+    assert list(keys) == sorted(keys), f"{list_name} must stay sorted"
+    return keys
+
+
+def entry_index(list_name: str, text: str) -> Optional[int]:
+    """Index of the entry equal to ``text``, ignoring case and surrounding
+    spaces; None when there is none (a prefix does not count)."""
+    keys = _keys(list_name)
+    key = text.strip().casefold()
+    if not key:
+        return None
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        return i
+    return None
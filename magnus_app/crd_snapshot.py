@@ -0,0 +1,43 @@
+"""Example background validator plugin: CRD numbers against a local snapshot.
+
+Enable with::
+
+    MAGNUS_VALIDATOR_PLUGINS=magnus_app.crd_snapshot
+    MAGNUS_CRD_SNAPSHOT=C:\\path\\to\\crd_snapshot.csv
+
+The snapshot is a text or CSV file whose first column is a CRD number; a
+header row or blank lines are skipped.  It is read once, on the first check,
+on the worker thread.  Fields opt in with ``'validate_async': 'crd_snapshot'``.
+"""
+from __future__ import annotations
+
+import csv
+import os
+import threading
+from typing import FrozenSet, Optional
+
+from magnus_app.validation import register
+
+SNAPSHOT_ENV = "MAGNUS_CRD_SNAPSHOT"
+
+_known: Optional[FrozenSet[str]] = None
+_lock = threading.Lock()
+
+
+def _load() -> FrozenSet[str]:
+    global _known
+    with _lock:
+        if _known is None:
+            path = os.getenv(SNAPSHOT_ENV)
+            if not path:
+                raise RuntimeError(f"{SNAPSHOT_ENV} is not set")
+            with open(path, "r", encoding="utf-8", newline="") as fh:
+                _known = frozenset(
+                    row[0].strip() for row in csv.reader(fh) if row and row[0].strip().isdigit()
+                )
+        return _known
+
+
+@register("crd_snapshot", message="CRD number was not found in the CRD snapshot", background=True)
+def crd_snapshot(value: str) -> bool:
+    return value.strip() in _load()
@@ -0,0 +1,58 @@
+"""Date edits for ``date`` fields that can be left empty.
+
+A QDateEdit always holds a date (2000-01-01 when new), so reading an
+untouched one would store a date the user never entered.  :class:`DateEdit`
+treats its minimum date, Qt's own earliest (1752-09-14), as "no date": it
+is shown blank and read back as ``""``.  While blank, the calendar popup
+opens on the current month and the first arrow step jumps to today, so
+the user never scrolls up from the sentinel.  Use
+:func:`date_value`/:func:`set_date` rather than ``date()``/``setDate()``.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from PyQt6.QtCore import QDate, QEvent, QObject
+from PyQt6.QtWidgets import QDateEdit, QWidget
+
+BLANK_DATE = QDate(1752, 9, 14)
+
+
+class DateEdit(QDateEdit):
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setDisplayFormat("yyyy-MM-dd")
+        self.setCalendarPopup(True)
+        self.setMinimumDate(BLANK_DATE)
+        self.setSpecialValueText(" ")  # shown while the date is the minimum
+        self.setDate(BLANK_DATE)
+        self.calendarWidget().installEventFilter(self)
+
+    def is_blank(self) -> bool:
+        return self.date() == self.minimumDate()
+
+    def stepBy(self, steps: int) -> None:
+        if self.is_blank():
+            self.setDate(QDate.currentDate())
+            return
+        super().stepBy(steps)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Show and obj is self.calendarWidget() and self.is_blank():
+            today = QDate.currentDate()
+            obj.setCurrentPage(today.year(), today.month())
+        return super().eventFilter(obj, event)
+
+
+def make_date_edit(parent: Optional[QWidget] = None) -> DateEdit:
+    return DateEdit(parent)
+
+
+def date_value(edit: QDateEdit) -> str:
+    dt = edit.date()
+    return "" if dt == edit.minimumDate() else dt.toString("yyyy-MM-dd")
+
+
+def set_date(edit: QDateEdit, value: Any) -> None:
+    dt = QDate.fromString(value, "yyyy-MM-dd") if value else QDate()
+    edit.setDate(dt if dt.isValid() and dt > edit.minimumDate() else edit.minimumDate())
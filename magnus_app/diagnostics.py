@@ -0,0 +1,100 @@
+from typing import Optional
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from . import perf
+
+
+class PerformanceDialog(QDialog):
+    """Help > Performance Diagnostics: p50/p95 per instrumented operation."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Performance Diagnostics")
+        self.resize(620, 440)
+        layout = QVBoxLayout(self)
+
+        self.record_box = QCheckBox("Record timings")
+        self.record_box.setChecked(perf.is_enabled())
+        self.record_box.toggled.connect(self._toggle_recording)
+        layout.addWidget(self.record_box)
+
+        self.timings = QTableWidget(0, 5)
+        self.timings.setHorizontalHeaderLabels(
+            ["Operation", "Count", "p50 (ms)", "p95 (ms)", "Max (ms)"]
+        )
+        self.timings.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.timings.verticalHeader().setVisible(False)
+        self.timings.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.timings, 1)
+
+        self.counters_label = QLabel("Counters")
+        layout.addWidget(self.counters_label)
+        self.counters = QTableWidget(0, 3)
+        self.counters.setHorizontalHeaderLabels(["Source", "Counter", "Value"])
+        self.counters.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.counters.verticalHeader().setVisible(False)
+        self.counters.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.counters, 1)
+
+        path = QLabel(f"Timings file: {perf.timings_path()}")
+        path.setWordWrap(True)
+        path.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(path)
+
+        row = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh)
+        row.addWidget(refresh_btn)
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self._reset)
+        row.addWidget(reset_btn)
+        row.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        row.addWidget(close_btn)
+        layout.addLayout(row)
+
+        self.refresh()
+
+    def _toggle_recording(self, on: bool) -> None:
+        perf.enable(on)
+
+    def _reset(self) -> None:
+        perf.reset()
+        self.refresh()
+
+    def refresh(self) -> None:
+        perf.flush()
+        rows = perf.summary()
+        self.timings.setRowCount(len(rows))
+        for r, (name, count, p50, p95, worst) in enumerate(rows):
+            cells = [name, str(count), f"{p50:.2f}", f"{p95:.2f}", f"{worst:.2f}"]
+            for c, text in enumerate(cells):
+                self.timings.setItem(r, c, QTableWidgetItem(text))
+
+        flat = [
+            (source, key, value)
+            for source, values in perf.stats().items()
+            for key, value in values.items()
+        ]
+        self.counters.setRowCount(len(flat))
+        for r, (source, key, value) in enumerate(flat):
+            if isinstance(value, float):
+                value = f"{value:.2f}"
+            for c, text in enumerate((source, key, str(value))):
+                self.counters.setItem(r, c, QTableWidgetItem(text))
+        self.counters_label.setVisible(bool(flat))
+        self.counters.setVisible(bool(flat))
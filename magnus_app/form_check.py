@@ -0,0 +1,226 @@
+"""Whole-form check behind the Review page.
+
+``validate_current_page`` only decides whether Next is enabled on the page
+in front of the user.  This walks every page of PAGES against the saved
+state and lists each problem with the page and field it belongs to:
+required fields, the spec's ``validate`` rules, the FormValidator format
+checks picked by field name (SSN, phone, email, income) and ``sum_to``
+totals across repeating-group items.  It touches no widgets, so it can run
+on a worker thread against a :func:`snapshot` of the state.
+
+Validators registered with ``background=True`` may block, so they only run
+when the caller says it is off the GUI thread.  A validator that raises is
+logged and counted as passed, as :class:`AsyncChecks` does, so a broken
+lookup never stops the form from being checked.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from magnus_app.conditions import compile_condition
+from magnus_app.pages import PAGES
+from magnus_app.perf import span
+from magnus_app.state import FieldRef, default_value
+from magnus_app.validation import ValidationResult, Validator, field_validators, form_validator
+
+FieldIter = Callable[[List[Dict[str, Any]], Mapping[str, Any]], Iterator[FieldRef]]
+# (repeating group, subfield) -> (total, number of items with a value)
+Totals = Mapping[Tuple[str, str], Tuple[float, int]]
+
+
+REQUIRED = "This field is required"
+
+
+class Issue(NamedTuple):
+    page: int
+    name: str  # field name; the subfield's name inside a repeating group
+    group: Optional[str]  # repeating group the field belongs to
+    item: Optional[int]  # item index inside that group
+    label: str
+    message: str
+
+
+# FormValidator checks picked by field name, as EnhancedLineEdit does
+_FORMAT_CHECKS: Tuple[Tuple[str, Callable[[str, str], ValidationResult]], ...] = (
+    ("ssn", form_validator.validate_ssn),
+    ("phone", form_validator.validate_phone),
+    ("email", form_validator.validate_email),
+    ("income", form_validator.validate_annual_income),
+)
+
+
+def _format_check(field: FieldRef) -> Optional[Callable[[str, str], ValidationResult]]:
+    if field.get("type") != "text":
+        return None
+    name = field.get("name", "").lower()
+    for key, check in _FORMAT_CHECKS:
+        if key in name:
+            return check
+    return None
+
+
+def _passes(validator: Validator, value: Any, data: Mapping[str, Any]) -> bool:
+    try:
+        return bool(validator(value, data))
+    except Exception as e:
+        from magnus_app.app import _log
+
+        _log(f"[CHECK] validator {validator.name!r} failed: {e!r}")
+        return True
+
+
+def check_page(
+    index: int,
+    data: Mapping[str, Any],
+    iterate: FieldIter,
+    totals: Optional[Totals] = None,
+    background: bool = False,
+    pages: Optional[List[Dict[str, Any]]] = None,
+) -> Tuple[Issue, ...]:
+    """Return every problem on page ``index``; ``iterate`` is
+    ``PageRenderer.iterate_fields`` and decides which fields are visible.
+
+    ``totals`` are the renderer's maintained ``sum_to`` totals; groups not
+    in it (pages never built) are summed here.  Background validators are
+    skipped unless ``background`` is set (the caller is a worker thread).
+    A worker passes its own copy of the page list as ``pages``, as PAGES
+    can be replaced meanwhile (spec hot reload).
+    """
+    issues: List[Issue] = []
+    totals = totals or {}
+    # (group, field) -> [summed total, items with a value, target, label]
+    sums: Dict[Tuple[str, str], List[Any]] = {}
+
+    for section in (PAGES if pages is None else pages)[index].get("sections", []):
+        for field in iterate(section.get("fields", []), data):
+            name = field.name
+            group = field.group
+            item = field.index
+            label = field.get("label", name)
+            if group:
+                label = f"{label} (#{item + 1})"
+            value = field.value(data)
+
+            if value in ("", None, False):
+                if field.get("required"):
+                    issues.append(Issue(index, name, group, item, label, REQUIRED))
+                continue
+
+            failed = next(
+                (
+                    v for v in field_validators(field)
+                    if (background or not v.background) and not _passes(v, value, data)
+                ),
+                None,
+            )
+            if failed is not None:
+                issues.append(Issue(index, name, group, item, label, failed.message))
+                continue
+
+            check = _format_check(field)
+            if check is not None:
+                result = check(label, value)
+                if not result.ok:
+                    issues.append(Issue(index, name, group, item, label, result.errors[0]))
+                    continue
+
+            if group and "sum_to" in field:
+                entry = sums.setdefault(
+                    (group, name), [0.0, 0, field["sum_to"], field.get("label", name)]
+                )
+                entry[1] += 1
+                if (group, name) not in totals:
+                    try:
+                        entry[0] += float(value)
+                    except (TypeError, ValueError):
+                        pass
+
+    for key, (total, count, target, label) in sums.items():
+        if key in totals:
+            total, count = totals[key]
+        if not count:
+            continue
+        group, name = key
+        result = form_validator.validate_percentage_total(label, [round(total, 2)], target)
+        if not result.ok:
+            issues.append(Issue(index, name, group, None, f"{label} (total)", result.errors[0]))
+
+    return tuple(issues)
+
+
+class PageProgress(NamedTuple):
+    filled: int  # shown value fields holding a value
+    shown: int  # value fields shown
+    started: bool  # some field differs from a new draft's default
+
+
+def page_progress(index: int, data: Mapping[str, Any], iterate: FieldIter) -> PageProgress:
+    """How much of page ``index`` is filled in; no validators run, so it is
+    cheap enough for the GUI thread.  Preset values (a radio's "No") count
+    in ``filled``, so a page that is not ``started`` may still look filled."""
+    filled = shown = 0
+    started = False
+    for section in PAGES[index].get("sections", []):
+        for field in iterate(section.get("fields", []), data):
+            shown += 1
+            value = field.value(data)
+            if value not in ("", None, False):
+                filled += 1
+                started = started or value != default_value(field.spec)
+    return PageProgress(filled, shown, started)
+
+
+def check_pages(
+    indexes: Iterable[int],
+    data: Mapping[str, Any],
+    iterate: FieldIter,
+    totals: Optional[Totals] = None,
+    background: bool = False,
+    pages: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[int, Tuple[Issue, ...]]:
+    with span("form_check"):
+        return {i: check_page(i, data, iterate, totals, background, pages) for i in indexes}
+
+
+def snapshot(state: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy of ``state`` a worker can read while the form keeps editing;
+    repeating-group items are copied because widgets mutate them in place."""
+    return {
+        k: [dict(i) if isinstance(i, dict) else i for i in v] if isinstance(v, list) else v
+        for k, v in state.items()
+    }
+
+
+# ---------------------------------------------------------- DEPENDENCIES --
+def _walk(fields: List[Dict[str, Any]], names: Set[str], reads: Set[str]) -> None:
+    for fld in fields:
+        cond = fld.get("show_if")
+        if cond:
+            reads.update(compile_condition(cond).deps)
+        for validator in field_validators(fld):
+            reads.update(validator.deps)
+        if fld.get("type") == "group":
+            _walk(fld.get("fields", []), names, reads)
+        elif fld.get("name"):
+            names.add(fld["name"])
+
+
+@lru_cache(maxsize=None)
+def affected_pages(index: int) -> Tuple[int, ...]:
+    """Pages whose result can change when a field on page ``index`` does:
+    the page itself and any page whose conditions or validators read it."""
+    written: Set[str] = set()
+    _walk_page(index, written, set())
+    out = []
+    for j in range(len(PAGES)):
+        reads: Set[str] = set()
+        _walk_page(j, set(), reads)
+        if j == index or reads & written:
+            out.append(j)
+    return tuple(out)
+
+
+def _walk_page(index: int, names: Set[str], reads: Set[str]) -> None:
+    for section in PAGES[index].get("sections", []):
+        _walk(section.get("fields", []), names, reads)
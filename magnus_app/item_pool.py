@@ -0,0 +1,107 @@
+"""Reusable editors for repeating-group items.
+
+Adding an item used to build a whole QGroupBox subtree (labels, line edits,
+date edits, combos, the remove button) and removing it ``deleteLater``'d
+all of it.  An :class:`ItemEditor` is instead rebindable: :meth:`load`
+points it at another item dict and refreshes its widgets with signals
+blocked.  Each group keeps an :class:`ItemEditorPool` of released editors,
+bounded by ``max_free``, and tops it up on idle so the first Add is cheap.
+:meth:`ItemEditorPool.close` stops that and frees the spares when the
+group's page is torn down.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QGroupBox
+
+from magnus_app.perf import register_stats
+
+ITEM_POOL_SIZE = 8
+
+# Shared by every pool, for the diagnostics dialog
+_counts = {"created": 0, "reused": 0, "discarded": 0}
+
+
+def _pool_stats() -> Dict[str, Any]:
+    handed_out = _counts["created"] + _counts["reused"]
+    return {
+        **_counts,
+        "reuse rate %": 100.0 * _counts["reused"] / handed_out if handed_out else 0.0,
+    }
+
+
+register_stats("Item editor pool", _pool_stats)
+
+
+class ItemEditor:
+    """One item's group box; ``loaders[name](value)`` sets a subfield's
+    widget without emitting its change signals."""
+
+    __slots__ = ("box", "item", "loaders")
+
+    def __init__(self, box: QGroupBox) -> None:
+        self.box = box
+        self.item: Optional[Dict[str, Any]] = None
+        self.loaders: Dict[str, Callable[[Any], None]] = {}
+
+    def load(self, item: Dict[str, Any], title: str) -> None:
+        self.item = item
+        self.box.setTitle(title)
+        for name, load in self.loaders.items():
+            load(item.get(name))
+
+    def reset(self) -> None:
+        """Blank the widgets so a pooled editor holds no client data."""
+        self.item = None
+        for load in self.loaders.values():
+            load(None)
+
+
+class ItemEditorPool:
+    def __init__(self, factory: Callable[[], ItemEditor], max_free: int = ITEM_POOL_SIZE) -> None:
+        self._factory = factory
+        self.max_free = max_free
+        self._free: List[ItemEditor] = []
+        self._closed = False
+
+    def acquire(self) -> ItemEditor:
+        """A spare or new editor; the caller lays it out and shows it."""
+        if self._free:
+            _counts["reused"] += 1
+            return self._free.pop()
+        _counts["created"] += 1
+        return self._factory()
+
+    def release(self, editor: ItemEditor) -> None:
+        """Take back a removed item's editor (already out of its layout)."""
+        if len(self._free) >= self.max_free:
+            _counts["discarded"] += 1
+            editor.box.deleteLater()
+            return
+        editor.box.hide()
+        editor.reset()
+        self._free.append(editor)
+
+    def prewarm(self, count: int) -> None:
+        """Build up to ``count`` spare editors, one per event-loop pass."""
+        count = min(count, self.max_free)
+
+        def step() -> None:
+            if self._closed or len(self._free) >= count:
+                return
+            _counts["created"] += 1
+            editor = self._factory()
+            editor.box.hide()
+            self._free.append(editor)
+            QTimer.singleShot(0, step)
+
+        QTimer.singleShot(0, step)
+
+    def close(self) -> None:
+        """The page is going away: stop pre-warming and delete the spares."""
+        self._closed = True
+        for editor in self._free:
+            editor.box.deleteLater()
+        self._free.clear()
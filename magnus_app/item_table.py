@@ -0,0 +1,243 @@
+"""Table editor for large repeating groups.
+
+A repeating group normally renders one QGroupBox of editors per item,
+which stops being usable at a few hundred beneficiaries.  The table view
+instead shows one row per item over the same list of item dicts: cells are
+painted by the delegate and an editor widget exists only for the cell being
+edited, so the cost of a page no longer grows with the number of items.
+
+The renderer picks it for groups whose spec says ``'view': 'table'`` and
+for any group that already holds :data:`TABLE_MIN_ITEMS` items.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QDateEdit,
+    QHBoxLayout,
+    QHeaderView,
+    QLineEdit,
+    QPushButton,
+    QStyledItemDelegate,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from magnus_app.conditions import compile_condition
+from magnus_app.dates import date_value, make_date_edit, set_date
+from magnus_app.selects import make_select, select_signal, select_value, set_select
+
+TABLE_MIN_ITEMS = 25
+
+_ROLE = Qt.ItemDataRole
+
+
+class ItemTableModel(QAbstractTableModel):
+    """Rows are the group's item dicts (edited in place), columns its subfields."""
+
+    def __init__(
+        self,
+        items: List[Dict[str, Any]],
+        fields: List[Dict[str, Any]],
+        values: Mapping[str, Any],
+        item_label: str,
+        on_edit: Callable[[Dict[str, Any], str], None],
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.items = items
+        self.fields = [f for f in fields if f.get("type") != "label"]
+        self.values = values  # form values, for show_if conditions
+        self.item_label = item_label
+        self._on_edit = on_edit
+
+    # -- shape
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.fields)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _ROLE.DisplayRole) -> Any:
+        if role != _ROLE.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            spec = self.fields[section]
+            return spec.get("label", spec.get("name"))
+        return f"{self.item_label} {section + 1}"
+
+    # -- cells
+    def _shown(self, spec: Dict[str, Any], item: Dict[str, Any]) -> bool:
+        cond = spec.get("show_if")
+        return not cond or compile_condition(cond, item_scope=True)(self.values, item)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        spec = self.fields[index.column()]
+        if not self._shown(spec, self.items[index.row()]):
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if spec.get("type") == "checkbox":
+            return flags | Qt.ItemFlag.ItemIsUserCheckable
+        return flags | Qt.ItemFlag.ItemIsEditable
+
+    def data(self, index: QModelIndex, role: int = _ROLE.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        spec = self.fields[index.column()]
+        item = self.items[index.row()]
+        value = item.get(spec.get("name"), "")
+        if spec.get("type") == "checkbox":
+            if role == _ROLE.CheckStateRole:
+                return Qt.CheckState.Checked if value else Qt.CheckState.Unchecked
+            return None
+        if role in (_ROLE.DisplayRole, _ROLE.EditRole):
+            return value if self._shown(spec, item) else ""
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = _ROLE.EditRole) -> bool:
+        if not index.isValid():
+            return False
+        spec = self.fields[index.column()]
+        name = spec.get("name")
+        if spec.get("type") == "checkbox":
+            if role != _ROLE.CheckStateRole:
+                return False
+            value = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif role != _ROLE.EditRole:
+            return False
+        item = self.items[index.row()]
+        if item.get(name, "") == value:
+            return False
+        item[name] = value
+        # other cells of the row may be shown/hidden by this one
+        self.dataChanged.emit(self.index(index.row(), 0), self.index(index.row(), len(self.fields) - 1))
+        self._on_edit(item, name)
+        return True
+
+    # -- rows
+    def append(self, item: Dict[str, Any]) -> int:
+        row = len(self.items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.items.append(item)
+        self.endInsertRows()
+        return row
+
+    def remove(self, row: int) -> Dict[str, Any]:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        item = self.items.pop(row)
+        self.endRemoveRows()
+        return item
+
+    def column_of(self, name: str) -> int:
+        for col, spec in enumerate(self.fields):
+            if spec.get("name") == name:
+                return col
+        return 0
+
+
+class ItemDelegate(QStyledItemDelegate):
+    """Creates the subfield's editor only for the cell being edited."""
+
+    def __init__(self, model: ItemTableModel, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._model = model
+
+    def createEditor(self, parent: QWidget, option: Any, index: QModelIndex) -> QWidget:
+        spec = self._model.fields[index.column()]
+        ftype = spec.get("type")
+        if ftype in ("select", "radio"):
+            editor = make_select(spec, parent)
+            select_signal(editor).connect(lambda *_: self.commitData.emit(editor))
+            return editor
+        if ftype == "date":
+            return make_date_edit(parent)
+        editor = QLineEdit(parent)
+        # keep validation in step with typing, as the item boxes do
+        editor.textChanged.connect(lambda _: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        value = index.data(_ROLE.EditRole) or ""
+        if isinstance(editor, QComboBox):
+            if select_value(editor) != value:
+                set_select(editor, value)
+        elif isinstance(editor, QDateEdit):
+            set_date(editor, value)
+        elif isinstance(editor, QLineEdit):
+            if editor.text() != value:
+                editor.setText(value)
+
+    def setModelData(self, editor: QWidget, model: QAbstractTableModel, index: QModelIndex) -> None:
+        if isinstance(editor, QComboBox):
+            value = select_value(editor)
+        elif isinstance(editor, QDateEdit):
+            value = date_value(editor)
+        else:
+            value = editor.text()
+        model.setData(index, value, _ROLE.EditRole)
+
+
+class ItemTable(QWidget):
+    """The table plus its Add/Remove buttons."""
+
+    def __init__(
+        self, model: ItemTableModel, on_rows_changed: Callable[[Optional[Dict[str, Any]]], None]
+    ) -> None:
+        """``on_rows_changed(removed)`` follows an add (``removed`` None) or
+        the removal of item ``removed``."""
+        super().__init__()
+        self.model = model
+        self._on_rows_changed = on_rows_changed
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.view = QTableView()
+        self.view.setModel(model)
+        self.view.setItemDelegate(ItemDelegate(model, self.view))
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+            | QAbstractItemView.EditTrigger.AnyKeyPressed
+        )
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.view.setMinimumHeight(320)
+        layout.addWidget(self.view)
+
+        buttons = QHBoxLayout()
+        self.add_btn = QPushButton(f"Add Another {model.item_label}")
+        self.add_btn.clicked.connect(self.add_item)
+        self.remove_btn = QPushButton(f"Remove {model.item_label}")
+        self.remove_btn.setObjectName("btn-remove-item")
+        self.remove_btn.clicked.connect(self.remove_selected)
+        buttons.addWidget(self.add_btn)
+        buttons.addStretch()
+        buttons.addWidget(self.remove_btn)
+        layout.addLayout(buttons)
+
+    def add_item(self) -> None:
+        row = self.model.append({})
+        index = self.model.index(row, 0)
+        self.view.scrollTo(index)
+        self.view.setCurrentIndex(index)
+        self._on_rows_changed(None)
+
+    def remove_selected(self) -> None:
+        rows = sorted({i.row() for i in self.view.selectionModel().selectedRows()}, reverse=True)
+        if not rows and self.view.currentIndex().isValid():
+            rows = [self.view.currentIndex().row()]
+        for row in rows:
+            self._on_rows_changed(self.model.remove(row))
+
+    def focus_cell(self, row: int, name: str) -> None:
+        if not 0 <= row < self.model.rowCount():
+            return
+        index = self.model.index(row, self.model.column_of(name))
+        self.view.scrollTo(index)
+        self.view.setCurrentIndex(index)
+        self.view.setFocus(Qt.FocusReason.OtherFocusReason)
@@ -0,0 +1,206 @@
+"""Size- and age-based rotation for the files in the log folder.
+
+Writers call :meth:`LogRotator.after_write` with the size they just left
+the file at.  When the file is too large or too old it is renamed to
+``<stem>-<timestamp><suffix>`` right there (a rename is cheap and the
+writer already closed its handle); gzip compression of the rotated file and
+pruning of old archives happen on one daemon thread, so writers never wait
+on either.
+
+The live file's start time is kept in a ``<name>.started`` file next to it,
+written when the file is rotated or first seen.  Stat times cannot stand
+in for it: Linux has no creation time, and the last write time never ages
+a log that every session appends to.
+
+Limits come from the environment:
+
+* ``MAGNUS_LOG_MAX_MB`` (5) - rotate once the live file exceeds this size
+* ``MAGNUS_LOG_MAX_AGE_DAYS`` (7) - rotate once the live file is this old
+* ``MAGNUS_LOG_KEEP`` (10) - rotated archives to keep per log
+* ``MAGNUS_LOG_MAX_TOTAL_MB`` (50) - cap on the archives' combined size
+"""
+from __future__ import annotations
+
+import datetime
+import gzip
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class LogRotator:
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 5 * 1024 * 1024,
+        max_age_seconds: float = 7 * 86400,
+        keep: int = 10,
+        max_total_bytes: int = 50 * 1024 * 1024,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.keep = keep
+        self.max_total_bytes = max_total_bytes
+        self._started = self._file_started()
+        self._warned = False
+        self._lock = threading.Lock()
+        self._jobs: "queue.Queue[Optional[Path]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls, path: Path) -> "LogRotator":
+        mb = 1024 * 1024
+        return cls(
+            path,
+            max_bytes=int(_env_number("MAGNUS_LOG_MAX_MB", 5) * mb),
+            max_age_seconds=_env_number("MAGNUS_LOG_MAX_AGE_DAYS", 7) * 86400,
+            keep=int(_env_number("MAGNUS_LOG_KEEP", 10)),
+            max_total_bytes=int(_env_number("MAGNUS_LOG_MAX_TOTAL_MB", 50) * mb),
+        )
+
+    @property
+    def _started_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".started")
+
+    def _file_started(self) -> float:
+        try:
+            return float(self._started_path.read_text(encoding="ascii"))
+        except (OSError, ValueError):
+            pass
+        try:
+            st = self.path.stat()
+        except OSError:
+            started = time.time()
+        else:
+            # A log from before the marker existed: its oldest stat time
+            started = min(st.st_mtime, st.st_ctime, getattr(st, "st_birthtime", st.st_mtime))
+        self._record_started(started)
+        return started
+
+    def _record_started(self, started: float) -> None:
+        try:
+            self._started_path.write_text(repr(started), encoding="ascii")
+        except OSError:
+            pass  # the age is then taken from this run's start
+
+    # ------------------------------------------------------------ WRITERS --
+    def start(self) -> None:
+        """Rotate a file left over-limit by a previous run, then let the
+        worker archive rotated files that earlier runs did not compress."""
+        try:
+            self.after_write(self.path.stat().st_size)
+        except OSError:
+            pass
+        self._jobs.put(None)
+        self._ensure_worker()
+
+    def after_write(self, size: int) -> None:
+        if size > self.max_bytes or time.time() - self._started > self.max_age_seconds:
+            self.rotate()
+
+    def rotate(self) -> Optional[Path]:
+        # Whoever gets here first rotates; everyone else just keeps logging
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if not self.path.exists():
+                return None
+            ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            target = self.path.with_name(f"{self.path.stem}-{ts}{self.path.suffix}")
+            n = 1
+            while target.exists():
+                target = self.path.with_name(f"{self.path.stem}-{ts}-{n}{self.path.suffix}")
+                n += 1
+            try:
+                self.path.rename(target)
+            except OSError:
+                # e.g. still open elsewhere on Windows; retry on a later write
+                return None
+            self._started = time.time()
+            self._record_started(self._started)
+            self._jobs.put(target)
+            self._ensure_worker()
+            return target
+        finally:
+            self._lock.release()
+
+    # ------------------------------------------------------------- WORKER --
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name=f"log-rotate-{self.path.stem}", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            jobs = self._rotated(compressed=False) if job is None else [job]
+            # one bad file (locked, unreadable) must not hold up the rest
+            for path in jobs:
+                try:
+                    self._compress(path)
+                except Exception as e:
+                    self._report(f"could not compress {path.name}: {e!r}")
+            try:
+                self._prune()
+            except Exception as e:
+                self._report(f"could not prune archives: {e!r}")
+
+    def _report(self, message: str) -> None:
+        """Note the first failure in the crash log; never raises."""
+        if self._warned:
+            return
+        self._warned = True
+        app = sys.modules.get("magnus_app.app")  # never import the app from here
+        try:
+            if app is not None:
+                app._log(f"[LOG] {self.path.name}: {message}")
+            else:
+                print(f"[LOG] {self.path.name}: {message}", file=sys.stderr)
+        except Exception:
+            pass
+
+    def _rotated(self, compressed: bool) -> List[Path]:
+        pattern = f"{self.path.stem}-*{self.path.suffix}" + (".gz" if compressed else "")
+        return [p for p in self.path.parent.glob(pattern) if p != self.path]
+
+    @staticmethod
+    def _compress(src: Path) -> None:
+        dst = src.with_name(src.name + ".gz")
+        tmp = src.with_name(src.name + ".gz.tmp")
+        with open(src, "rb") as fin, gzip.open(tmp, "wb") as fout:
+            shutil.copyfileobj(fin, fout)
+        os.replace(tmp, dst)
+        src.unlink()
+
+    def _prune(self) -> None:
+        archives = []
+        for p in self._rotated(compressed=True):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            archives.append((st.st_mtime, st.st_size, p))
+        archives.sort(reverse=True)
+        total = 0
+        for i, (_mtime, size, p) in enumerate(archives):
+            total += size
+            if i >= self.keep or total > self.max_total_bytes:
+                try:
+                    p.unlink()
+                except OSError:
+                    pass
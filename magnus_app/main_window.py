@@ -1,33 +1,63 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from pathlib import Path
 import os, subprocess, sys
 
 from PyQt6.QtWidgets import (
     QHBoxLayout, QMainWindow, QProgressBar, QPushButton, QStackedWidget,
-    QVBoxLayout, QWidget, QScrollArea, QTextEdit, QLabel, QFileDialog, QMessageBox
+    QVBoxLayout, QWidget, QScrollArea, QTextEdit, QLabel, QFileDialog, QMessageBox,
+    QListWidget, QListWidgetItem, QStyle
 )
-from PyQt6.QtGui import QAction
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtCore import QFileSystemWatcher, Qt, QTimer, pyqtSignal
 from .pages import PAGES
-from .state import STATE_FILE, load_state, save_state
+from .state import STATE_FILE, load_state, migrate_state, save_state
+from .model import FormModel
 from .renderer import PageRenderer
-from .validation import VALIDATORS
+from .validation import VALIDATORS, field_validators
 from .app import log_path, _log
-# PDF generator (optional)
-try:
-    from . import pdf_generator_reportlab as pdfgen
-except Exception:
-    pdfgen = None
+from .perf import span, timed
+from .diagnostics import PerformanceDialog
+from .optional import OptionalModule
+from .form_check import REQUIRED, Issue, PageProgress, affected_pages, check_pages, page_progress, snapshot
+from .workers import workers
+from .async_checks import AsyncChecks
+from .spec_loader import SpecError, install_pages, load_pages, spec_files
+from .page_cache import resident_pages
+
+# ReportLab/python-docx are heavy; load the generator on first use
+PDFGEN = OptionalModule("magnus_app.pdf_generator_reportlab", "PDF generation")
 
 
 class MagnusClientIntakeForm(QMainWindow):
     """Simple wizard driven by PAGES specification."""
 
+    # Emitted once start_background_init() has built every page
+    background_ready = pyqtSignal()
+
     def __init__(self) -> None:
         super().__init__()
         self.state: Dict[str, Any] = load_state(STATE_FILE)
+        # Widgets bind to the model, which writes straight into self.state
+        self.model = FormModel(self.state, self)
+        self.model.valueChanged.connect(self.handle_field_change)
         self.current_page = 0
-        self.pages: List[Dict[str, Any]] = []
-        self.renderer = PageRenderer(self.state, VALIDATORS)
+        # One entry per PAGES item; None until the page is built
+        self.pages: List[Optional[Dict[str, Any]]] = [None] * len(PAGES)
+        # Whole-form check results per page; None = needs (re)checking.
+        # The version counter lets a late worker result for an edited page
+        # be dropped instead of cached.
+        self._issues: List[Optional[Tuple[Issue, ...]]] = [None] * len(PAGES)
+        self._issue_versions: List[int] = [0] * len(PAGES)
+        # Fill counts per page for the navigator; None = stale, invalidated
+        # along with the issues
+        self._progress: List[Optional[PageProgress]] = [None] * len(PAGES)
+        # Pages shown this session count as started even if left at defaults
+        self._visited: Set[int] = set()
+        self._check_running = False
+        self._async_checks = AsyncChecks(self._on_async_result)
+        # LRU of built pages when MAGNUS_RESIDENT_PAGES limits them
+        self._resident = resident_pages()
+        self.renderer = PageRenderer(self.model, VALIDATORS)
         self.init_ui()
 
     # ------------------------------------------------------------------ UI --
@@ -55,6 +85,10 @@ class MagnusClientIntakeForm(QMainWindow):
         helpMenu.addAction(actLog)
         actLog.triggered.connect(_open_log_dir)
 
+        actPerf = QAction("Performance Diagnostics", self)
+        actPerf.triggered.connect(lambda: PerformanceDialog(self).exec())
+        helpMenu.addAction(actPerf)
+
         central = QWidget()
         self.setCentralWidget(central)
         root_layout = QVBoxLayout(central)
@@ -63,23 +97,110 @@ class MagnusClientIntakeForm(QMainWindow):
         self.progress.setRange(0, 100)
         root_layout.addWidget(self.progress)
 
+        body = QHBoxLayout()
+        root_layout.addLayout(body, 1)
+
+        # Page navigator: every page with its completion/validity badge
+        self.nav = QListWidget()
+        self.nav.setObjectName("pageNav")
+        self.nav.setFixedWidth(240)
+        self.nav.currentRowChanged.connect(self._on_nav_row)
+        body.addWidget(self.nav)
+        # Badges refresh once typing pauses, not on every keystroke
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(250)
+        self._nav_timer.timeout.connect(self._refresh_nav)
+
         self.stack = QStackedWidget()
-        root_layout.addWidget(self.stack, 1)
+        body.addWidget(self.stack, 1)
 
-        for index, page_spec in enumerate(PAGES):
-            page_widget, meta = self.renderer.render_page_from_spec(
-                page_spec, index, self.handle_field_change, self.on_next, self.on_back
-            )
-            self.stack.addWidget(page_widget)
-            self.pages.append(meta)
+        # Only the first page is built up front; the others start as
+        # placeholders so stack indices keep matching PAGES.
+        for _ in PAGES:
+            self.stack.addWidget(QWidget())
 
         # Append Review page to the stack
         review = self._build_review_page()
         self.stack.addWidget(review)
 
+        self._fill_nav()
+        self._ensure_page(0)
+        self._visited.add(0)
         self.update_progress()
         self.update_groups(0)
         self.validate_current_page(0)
+        self._nav_timer.start()
+
+    # --------------------------------------------------------- BUILD PAGES --
+    def _ensure_page(self, index: int) -> Dict[str, Any]:
+        meta = self.pages[index]
+        if meta is None:
+            page_widget, meta = self.renderer.render_page_from_spec(
+                PAGES[index], index, self.on_next, self.on_back
+            )
+            placeholder = self.stack.widget(index)
+            self.stack.insertWidget(index, page_widget)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.pages[index] = meta
+            self._resident.built(index)
+        for old in self._resident.touch(index):
+            if old != self.current_page:
+                self._evict_page(old)
+        return meta
+
+    def _evict_page(self, index: int) -> None:
+        """Tear down a built page; its values are already in self.state
+        (the model writes there), so it can be rebuilt from the spec."""
+        meta = self.pages[index]
+        if meta is None:
+            return
+        self._release_inputs(meta)
+        groups = {name for name, info in meta["inputs"].items() if info["type"] == "repeating_group"}
+        for key in [key for key in self.renderer.totals if key[0] in groups]:
+            del self.renderer.totals[key]  # form_check sums unbuilt groups itself
+        self._async_checks.forget(lambda key: key[0] == index)
+
+        page = self.stack.widget(index)
+        widgets = len(page.findChildren(QWidget)) + 1
+        self.stack.insertWidget(index, QWidget())
+        self.stack.removeWidget(page)
+        page.deleteLater()
+        self.pages[index] = None
+        self._resident.evicted(index, widgets)
+
+    def _release_inputs(self, meta: Dict[str, Any]) -> None:
+        """Detach a page about to be destroyed from the model, and stop its
+        item pools pre-warming editors for it."""
+        self.model.unbind(meta["inputs"])
+        for info in meta["inputs"].values():
+            pool = info.get("pool")
+            if pool is not None:
+                pool.close()
+
+    def start_background_init(self) -> None:
+        """Build the remaining pages one per event-loop pass so input stays
+        responsive, then pre-warm the PDF generator off-thread."""
+        pending = [i for i, meta in enumerate(self.pages) if meta is None]
+        total = len(self.pages)
+
+        def step() -> None:
+            while pending and self.pages[pending[0]] is not None:
+                pending.pop(0)  # built meanwhile by navigation
+            if self._resident.full():
+                pending.clear()  # building more would only evict visited pages
+            if pending:
+                self._ensure_page(pending.pop(0))
+                built = total - len(pending)
+                self.statusBar().showMessage(f"Preparing pages… {built}/{total}")
+                QTimer.singleShot(0, step)
+                return
+            self.statusBar().clearMessage()
+            PDFGEN.prewarm()
+            self.background_ready.emit()
+
+        QTimer.singleShot(0, step)
 
     # ---------------------------------------------------------- NAVIGATION --
     def on_next(self) -> None:
@@ -87,31 +208,17 @@ class MagnusClientIntakeForm(QMainWindow):
         if self.current_page < len(self.pages):
             if not self.validate_current_page(self.current_page):
                 return
-            self.state.update(self.get_current_values(self.current_page))
-            save_state(STATE_FILE, self.state)
-            self.current_page += 1
-            self.stack.setCurrentIndex(self.current_page)
-            if self.current_page == len(self.pages):  # just entered Review
-                self._refresh_review()
-            self.update_progress()
-            if self.current_page < len(self.pages):
-                self.update_groups(self.current_page)
-                self.validate_current_page(self.current_page)
+            if self.current_page + 1 < len(self.pages):
+                self.go_to_page(self.current_page + 1)
+            else:
+                self.go_to_review()
         else:
             # On Review page: buttons handle actions
             pass
 
     def on_back(self) -> None:
         if self.current_page > 0:
-            if self.current_page <= len(self.pages) - 1:
-                self.state.update(self.get_current_values(self.current_page))
-                save_state(STATE_FILE, self.state)
-            self.current_page -= 1
-            self.stack.setCurrentIndex(self.current_page)
-            self.update_progress()
-            if self.current_page < len(self.pages):
-                self.update_groups(self.current_page)
-                self.validate_current_page(self.current_page)
+            self.go_to_page(self.current_page - 1)
 
     def _build_review_page(self) -> QWidget:
         page = QWidget()
@@ -131,6 +238,17 @@ class MagnusClientIntakeForm(QMainWindow):
         area.setWidget(inner)
         v = QVBoxLayout(inner)
 
+        self._issues_label = QLabel()
+        self._issues_label.setWordWrap(True)
+        v.addWidget(self._issues_label)
+
+        self._issues_list = QListWidget()
+        self._issues_list.setMaximumHeight(160)
+        self._issues_list.itemActivated.connect(self._on_issue_activated)
+        self._issues_list.itemClicked.connect(self._on_issue_activated)
+        self._issues_list.hide()
+        v.addWidget(self._issues_list)
+
         self._review_text = QTextEdit()
         self._review_text.setReadOnly(True)
         self._review_text.setMinimumHeight(360)
@@ -154,6 +272,7 @@ class MagnusClientIntakeForm(QMainWindow):
         outer.addLayout(row)
         return page
 
+    @timed("_refresh_review")
     def _refresh_review(self) -> None:
         def get(name: str, default: str = "Not provided") -> str:
             val = self.state.get(name)
@@ -337,105 +456,411 @@ class MagnusClientIntakeForm(QMainWindow):
         """
         self._review_text.setHtml(html)
 
-    
+    # --------------------------------------------------------------- SPECS --
+    def reload_pages(self) -> None:
+        """Rebuild the form after PAGES was replaced (spec hot reload)."""
+        on_review = self.current_page >= len(self.pages)
+        for meta in self.pages:
+            if meta is not None:
+                self._release_inputs(meta)
+        for _ in self.pages:
+            old = self.stack.widget(0)
+            self.stack.removeWidget(old)
+            old.deleteLater()
+        for i in range(len(PAGES)):
+            self.stack.insertWidget(i, QWidget())
+
+        migrate_state(self.state)  # defaults for fields the new specs add
+        self.pages = [None] * len(PAGES)
+        # Versions stay increasing so an in-flight check's results are dropped
+        version = max(self._issue_versions, default=0) + 1
+        self._issues = [None] * len(PAGES)
+        self._issue_versions = [version] * len(PAGES)
+        self._async_checks.forget(lambda key: True)
+        self.renderer.totals.clear()
+        self._resident.clear()
+        self._progress = [None] * len(PAGES)
+        self._visited.clear()
+        self._fill_nav()
+        self._nav_timer.start()
+
+        if on_review:
+            self.current_page = -1  # nothing built to save
+            self.go_to_review()
+        else:
+            self.go_to_page(min(self.current_page, len(self.pages) - 1))
+
+    def watch_specs(self, spec_dir: Path) -> None:
+        """Developer mode: reload the form whenever a spec file changes."""
+        self._spec_dir = spec_dir
+        self._spec_watcher = QFileSystemWatcher(self)
+        # Editors save in bursts (temp file, rename); reload once it settles
+        self._spec_timer = QTimer(self)
+        self._spec_timer.setSingleShot(True)
+        self._spec_timer.setInterval(300)
+        self._spec_timer.timeout.connect(self._reload_specs)
+        self._spec_watcher.directoryChanged.connect(lambda _: self._spec_timer.start())
+        self._spec_watcher.fileChanged.connect(lambda _: self._spec_timer.start())
+        self._watch_spec_files()
+
+    def _watch_spec_files(self) -> None:
+        watched = set(self._spec_watcher.files()) | set(self._spec_watcher.directories())
+        paths = [str(self._spec_dir)] + [str(p) for p in spec_files(self._spec_dir)]
+        missing = [p for p in paths if p not in watched]
+        if missing:
+            self._spec_watcher.addPaths(missing)  # replaced files drop out of the watch
+
+    def _reload_specs(self) -> None:
+        try:
+            self._watch_spec_files()
+            pages, _ = load_pages(self._spec_dir)
+        except (SpecError, OSError) as e:
+            _log(f"[SPEC] reload failed: {e}")
+            self.statusBar().showMessage(f"Specs not reloaded: {e}", 15000)
+            return
+        if pages == PAGES:
+            return
+        install_pages(pages)
+        self.reload_pages()
+        _log(f"[SPEC] reloaded {len(pages)} pages from {self._spec_dir}")
+        self.statusBar().showMessage(f"Reloaded {len(pages)} pages from {self._spec_dir}", 5000)
+
+    # --------------------------------------------------------- FORM CHECK --
+    def _invalidate_checks(self, index: int) -> None:
+        for i in affected_pages(index):
+            self._issues[i] = None
+            self._issue_versions[i] += 1
+            self._progress[i] = None
+        self._nav_timer.start()
+
+    def _start_form_check(self) -> None:
+        """Re-check the pages edited since the last pass on a worker thread;
+        pages that have not changed keep their cached result."""
+        dirty = [i for i, issues in enumerate(self._issues) if issues is None]
+        if not dirty:
+            self._show_issues()
+            return
+        if self._check_running:
+            return  # _on_form_checked starts another pass if still needed
+        self._check_running = True
+        self._issues_label.setText("Checking the form…")
+        versions = {i: self._issue_versions[i] for i in dirty}
+        workers().submit(
+            check_pages, dirty, snapshot(self.state), self.renderer.iterate_fields,
+            self._totals(), True,  # on the worker, so background checks run too
+            list(PAGES),  # a spec reload may replace PAGES while this runs
+            on_done=lambda f: self._on_form_checked(f, versions),
+        )
+
+    def _on_form_checked(self, future, versions: Dict[int, int]) -> None:
+        self._check_running = False
+        try:
+            results = future.result()
+        except Exception as e:
+            _log(f"[CHECK] form check failed: {e!r}")
+            self._issues_label.setText("The form could not be checked; see the crash log.")
+            return
+        for i, issues in results.items():
+            # pages may have been reloaded meanwhile (spec hot reload)
+            if i < len(self._issue_versions) and self._issue_versions[i] == versions[i]:
+                self._issues[i] = issues
+        self._refresh_nav(check=False)
+        if self.current_page == len(self.pages):
+            self._start_form_check()
+        elif any(issues is None for issues in self._issues):
+            self._nav_timer.start()  # edited while this pass ran
+
+    def _totals(self) -> Dict[Tuple[str, str], Tuple[float, int]]:
+        """The renderer's running 'sum_to' totals, as plain values."""
+        return {key: (t.total, len(t)) for key, t in self.renderer.totals.items()}
+
+    def _current_issues(self) -> List[Issue]:
+        """All issues; stale pages are checked right here without their
+        background validators, and not cached, so the next worker pass
+        still runs those."""
+        dirty = [i for i, issues in enumerate(self._issues) if issues is None]
+        checked = check_pages(dirty, self.state, self.renderer.iterate_fields, self._totals())
+        return [
+            issue
+            for i, issues in enumerate(self._issues)
+            for issue in (checked[i] if issues is None else issues)
+        ]
+
+    def _show_issues(self) -> None:
+        issues = [issue for page in self._issues for issue in (page or ())]
+        self._issues_list.clear()
+        if not issues:
+            self._issues_label.setText("No problems found.")
+            self._issues_list.hide()
+            return
+        for issue in issues:
+            title = PAGES[issue.page].get("title", f"Page {issue.page + 1}")
+            item = QListWidgetItem(f"{title} › {issue.label}: {issue.message}")
+            item.setData(Qt.ItemDataRole.UserRole, issue)
+            self._issues_list.addItem(item)
+        noun = "problem" if len(issues) == 1 else "problems"
+        self._issues_label.setText(f"{len(issues)} {noun} found; click one to go to it.")
+        self._issues_list.show()
+
+    def _on_issue_activated(self, item: QListWidgetItem) -> None:
+        issue: Issue = item.data(Qt.ItemDataRole.UserRole)
+        self.go_to_page(issue.page)
+        self._focus_field(issue)
+
+    def go_to_page(self, index: int) -> None:
+        """Show page ``index``, building it if needed; the pages in between
+        are neither built nor validated."""
+        if 0 <= self.current_page < len(self.pages) and self.pages[self.current_page] is not None:
+            save_state(STATE_FILE, self.state)
+        self._ensure_page(index)
+        self.current_page = index
+        if index not in self._visited:
+            self._visited.add(index)
+            self._nav_timer.start()  # its preset values now count as filled
+        self.stack.setCurrentIndex(index)
+        self.update_progress()
+        self.update_groups(index)
+        self.validate_current_page(index)
+
+    def go_to_review(self) -> None:
+        if 0 <= self.current_page < len(self.pages) and self.pages[self.current_page] is not None:
+            save_state(STATE_FILE, self.state)
+        self.current_page = len(self.pages)
+        self.stack.setCurrentIndex(self.current_page)
+        self._refresh_review()
+        self._start_form_check()
+        self.update_progress()
+
+    def _focus_field(self, issue: Issue) -> None:
+        meta = self.pages[issue.page]
+        info = meta["inputs"].get(issue.group or issue.name) or {}
+        if "table" in info:
+            meta["scroll"].ensureWidgetVisible(info["table"])
+            info["table"].focus_cell(issue.item or 0, issue.name)
+            return
+        if issue.group:
+            boxes = info.get("boxes") or []
+            index = issue.item if issue.item is not None else len(boxes) - 1
+            if not 0 <= index < len(boxes):
+                return
+            # subfield widgets carry their spec name as objectName
+            target = boxes[index].findChild(QWidget, issue.name) or boxes[index]
+        elif info.get("type") == "radio":
+            buttons = info["group"].buttons()
+            if not buttons:
+                return
+            target = buttons[0]
+        elif "widget" in info:
+            target = info["widget"]
+        else:
+            return
+        meta["scroll"].ensureWidgetVisible(target)
+        if target.focusPolicy() == Qt.FocusPolicy.NoFocus:
+            # a container (item box, radio row): focus its first input
+            target = next(
+                (w for w in target.findChildren(QWidget)
+                 if w.focusPolicy() != Qt.FocusPolicy.NoFocus),
+                target,
+            )
+        target.setFocus(Qt.FocusReason.OtherFocusReason)
+
     def _generate_pdf(self) -> None:
+        pdfgen = PDFGEN.load()
         if pdfgen is None or not hasattr(pdfgen, "generate"):
-            QMessageBox.warning(self, "PDF", "PDF generator module not available.")
+            QMessageBox.warning(self, "PDF", PDFGEN.unavailable_message())
             return
+        issues = self._current_issues()
+        if issues:
+            self._show_issues()
+            answer = QMessageBox.question(
+                self,
+                "PDF",
+                f"The form still has {len(issues)} problem(s) listed on the Review page.\n\n"
+                "Generate the PDF anyway?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No,
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                return
         path, _ = QFileDialog.getSaveFileName(
             self, "Save PDF", "Magnus_Client_Intake_Form.pdf", "PDF Files (*.pdf)"
         )
         if not path:
             return
         try:
-            pdfgen.generate(self.state, path)
+            with span("generate_pdf_report"):
+                ok = pdfgen.generate(self.state, path)
+            if ok is False:
+                QMessageBox.critical(
+                    self, "PDF Error", f"Failed to generate PDF.\n\nDetails in:\n{log_path()}"
+                )
+                return
             QMessageBox.information(self, "PDF", f"PDF generated successfully:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "PDF Error", f"Failed to generate PDF:\n{e}")
 
     def update_progress(self) -> None:
-        total = len(self.pages) + 1  # +1 for Review page
-        pct = round(((self.current_page + 1) / total) * 100)
-        self.progress.setValue(pct)
+        """Share of the shown value fields filled, form-wide."""
+        filled = shown = 0
+        for i in range(len(self.pages)):
+            f, n = self._page_fill(i)
+            filled += f
+            shown += n
+        self.progress.setValue(round(filled / shown * 100) if shown else 100)
+        self.nav.blockSignals(True)
+        self.nav.setCurrentRow(self.current_page)
+        self.nav.blockSignals(False)
+
+    # ---------------------------------------------------------- NAVIGATOR --
+    def _fill_nav(self) -> None:
+        self.nav.blockSignals(True)
+        self.nav.clear()
+        for i, spec in enumerate(PAGES):
+            item = QListWidgetItem(spec.get("title", f"Page {i + 1}"))
+            item.setData(Qt.ItemDataRole.UserRole, item.text())
+            self.nav.addItem(item)
+        self.nav.addItem(QListWidgetItem("Review & Submit"))
+        self.nav.blockSignals(False)
+
+    def _on_nav_row(self, row: int) -> None:
+        if row < 0 or row == self.current_page:
+            return
+        if row < len(self.pages):
+            self.go_to_page(row)
+        else:
+            self.go_to_review()
+
+    def _page_fill(self, index: int) -> Tuple[int, int]:
+        """(filled, shown) value fields; a page neither shown this session
+        nor changed from a new draft's defaults counts as empty."""
+        progress = self._progress[index]
+        if progress is None:
+            progress = page_progress(index, self.state, self.renderer.iterate_fields)
+            self._progress[index] = progress
+        if progress.started or index in self._visited:
+            return progress.filled, progress.shown
+        return 0, progress.shown
+
+    def _refresh_nav(self, check: bool = True) -> None:
+        """Redraw the badges from the per-page caches; with ``check``, stale
+        pages are also re-checked on a worker (results land in _issues)."""
+        if check:
+            self._start_form_check()
+        style = self.style()
+        done = style.standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)
+        warn = style.standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning)
+        for i in range(len(self.pages)):
+            item = self.nav.item(i)
+            filled, shown = self._page_fill(i)
+            issues = self._issues[i]
+            invalid = [x for x in issues or () if x.message != REQUIRED]
+            missing = sum(1 for x in issues or () if x.message == REQUIRED)
+            if invalid:
+                badge, icon = f"{len(invalid)} to fix", warn
+                tip = "\n".join(f"{x.label}: {x.message}" for x in invalid)
+            elif not filled:
+                badge, icon, tip = "", QIcon(), "Not started"
+            elif filled < shown:
+                badge, icon = f"{filled}/{shown}", QIcon()
+                tip = f"{missing} required field(s) left" if missing else "Optional fields left"
+            elif issues is None:
+                badge, icon, tip = "…", QIcon(), "Not checked yet"
+            else:
+                badge, icon, tip = "", done, "Complete"
+            item.setText(f"{item.data(Qt.ItemDataRole.UserRole)}  {badge}".rstrip())
+            item.setIcon(icon)
+            item.setToolTip(tip)
+        self.update_progress()
 
     # ------------------------------------------------------------- VALUES --
     def get_current_values(self, index: int) -> Dict[str, Any]:
+        """The page's values, read from the model (never from the widgets)."""
         meta = self.pages[index]
-        values: Dict[str, Any] = {}
-        for name, info in meta["inputs"].items():
-            ftype = info["type"]
-            if ftype == "radio":
-                btn = info["group"].checkedButton()
-                values[name] = btn.text() if btn else ""
-            elif ftype == "repeating_group":
-                values[name] = self.state.get(name, [])
-            elif ftype == "select":
-                values[name] = info["widget"].currentText()
-            elif ftype in ("text", "number"):
-                values[name] = info["widget"].text()
-            elif ftype == "date":
-                values[name] = info["widget"].date().toString("yyyy-MM-dd")
-            elif ftype == "textarea":
-                values[name] = info["widget"].toPlainText()
-            elif ftype == "checkbox":
-                values[name] = info["widget"].isChecked()
-        return values
+        return {name: self.model.get(name) for name in meta["inputs"]}
 
     # -------------------------------------------------------------- GROUPS --
-    def update_groups(self, index: int) -> None:
+    @timed("update_groups")
+    def update_groups(
+        self,
+        index: int,
+        values: Optional[Mapping[str, Any]] = None,
+        changed: Optional[str] = None,
+    ) -> None:
+        """Show/hide the page's conditional groups; with ``changed`` only the
+        conditions reading that field are re-evaluated."""
         meta = self.pages[index]
-        values = self.get_current_values(index)
-        for widget, cond in meta["groups"]:
-            name, expected = next(iter(cond.items()))
-            widget.setVisible(values.get(name, "") == expected)
+        if values is None:
+            values = self.state
+        meta["visibility"].update(values, changed)
 
     # ----------------------------------------------------------- VALIDATE --
-    def validate_current_page(self, index: int) -> bool:
+    @timed("validate_current_page")
+    def validate_current_page(self, index: int, values: Optional[Mapping[str, Any]] = None) -> bool:
         meta = self.pages[index]
-        values = self.get_current_values(index)
-        merged = dict(self.state)
-        merged.update(values)
+        if values is None:
+            values = self.state
         valid = True
+        pending = False
 
         for section in meta["spec"].get("sections", []):
-            for field in self.renderer.iterate_fields(section.get("fields", []), merged):
-                name = field.get("name")
-                rg = field.get("_rg")
-                if rg:
-                    grp = rg["name"]
-                    i = rg["index"]
-                    value = merged.get(grp, [])
-                    if isinstance(value, list) and i < len(value):
-                        value = value[i].get(name, "")
-                    else:
-                        value = ""
-                else:
-                    value = values.get(name, "")
+            for field in self.renderer.iterate_fields(section.get("fields", []), values):
+                value = field.value(values)
                 if field.get("required"):
                     if field["type"] == "checkbox":
                         if not value:
                             valid = False
                     elif not value:
                         valid = False
-                if valid and field.get("validate") and value not in ("", False):
-                    validator = VALIDATORS.get(field["validate"])
-                    if validator:
-                        try:
-                            if not validator(value, merged):
-                                valid = False
-                        except TypeError:
-                            if not validator(value):
-                                valid = False
+                if valid and value not in ("", False):
+                    for validator in field_validators(field):
+                        if validator.background:
+                            key = (index, field.group, field.index, field.name)
+                            ok = self._async_checks.status(key, validator, value, values)
+                            if ok is None:
+                                pending = True
+                                continue
+                        else:
+                            ok = validator(value, values)
+                        if not ok:
+                            valid = False
+                            break
                 if not valid:
                     break
             if not valid:
                 break
 
-        meta["next_btn"].setEnabled(valid)
-        return valid
+        self._set_next_state(meta, "invalid" if not valid else "pending" if pending else "valid")
+        return valid and not pending
+
+    def _set_next_state(self, meta: Dict[str, Any], state: str) -> None:
+        """Enable Next only when valid; while background checks run it
+        reads "Checking…" and is styled apart from a plain disabled button."""
+        btn = meta["next_btn"]
+        btn.setEnabled(state == "valid")
+        look = "pending" if state == "pending" else "neutral"
+        if (btn.property("validation") or "neutral") == look:
+            return
+        if look == "pending":
+            meta.setdefault("next_text", btn.text())
+            btn.setText("Checking…")
+            btn.setToolTip("Waiting for background checks to finish")
+        else:
+            btn.setText(meta.get("next_text", btn.text()))
+            btn.setToolTip("")
+        btn.setProperty("validation", look)
+        btn.style().unpolish(btn)
+        btn.style().polish(btn)
+
+    def _on_async_result(self) -> None:
+        index = self.current_page
+        if index < len(self.pages) and self.pages[index] is not None:
+            self.validate_current_page(index)
 
     # ------------------------------------------------------------- SIGNAL --
-    def handle_field_change(self) -> None:
-        self.state.update(self.get_current_values(self.current_page))
-        self.update_groups(self.current_page)
-        self.validate_current_page(self.current_page)
+    def handle_field_change(self, name: Optional[str] = None) -> None:
+        """The model's valueChanged: the value is already in self.state."""
+        if self.current_page >= len(self.pages) or self.pages[self.current_page] is None:
+            return  # fired while a page is still being built
+        self._invalidate_checks(self.current_page)
+        self.update_groups(self.current_page, self.state, changed=name)
+        self.validate_current_page(self.current_page, self.state)
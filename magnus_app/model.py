@@ -0,0 +1,139 @@
+"""Form model the page widgets bind to, two-way.
+
+The model wraps the state dict itself, so it is the single source of truth:
+every bound widget writes its typed value on change (``set``), and
+``valueChanged(name)`` fires only when that value actually differs.  Values
+set from code are pushed to the field's widgets, except the one that sent
+them.  Reading a page therefore costs a dict lookup per field instead of a
+Qt call per widget.
+
+Repeating groups are lists whose items their subfield widgets edit in
+place; the renderer calls :meth:`FormModel.touch` after such an edit.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .dates import date_value, set_date
+from .selects import select_signal, select_value, set_select
+
+_MISSING = object()
+
+Push = Callable[[Any], None]
+
+
+class FormModel(QObject):
+    # field name; for a repeating group, the group's name
+    valueChanged = pyqtSignal(str)
+
+    def __init__(self, data: Dict[str, Any], parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.data = data
+        self._views: Dict[str, List[Push]] = {}
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.data.get(name, default)
+
+    def set(self, name: str, value: Any, source: Optional[Push] = None) -> bool:
+        """Store ``value``; returns whether it changed (and was announced)."""
+        if self.data.get(name, _MISSING) == value:
+            return False
+        self.data[name] = value
+        for push in self._views.get(name, ()):
+            if push is not source:
+                push(value)
+        self.valueChanged.emit(name)
+        return True
+
+    def touch(self, name: str) -> None:
+        """Announce a change made in place (a repeating group's items)."""
+        self.valueChanged.emit(name)
+
+    def bind(self, name: str, info: Dict[str, Any]) -> None:
+        """Bind a rendered input (``{"type": .., "widget"|"group": ..}``).
+
+        The widget is set from the model when it holds a value; otherwise
+        it stays blank and nothing is stored until the user edits it.
+        """
+        ftype = info["type"]
+        signals = _SIGNALS.get(ftype)
+        if signals is None:
+            return
+
+        def push(value: Any) -> None:
+            write_widget(info, value)
+
+        value = self.data.get(name, _MISSING)
+        if value is not _MISSING:
+            write_widget(info, value)
+        self._views.setdefault(name, []).append(push)
+
+        def commit(*_: Any) -> None:
+            self.set(name, read_widget(info), source=push)
+
+        for signal in signals(info):
+            signal.connect(commit)
+
+    def unbind(self, names: Iterable[str]) -> None:
+        """Forget the widgets bound to ``names`` (their page is destroyed)."""
+        for name in names:
+            self._views.pop(name, None)
+
+
+# ------------------------------------------------------------ WIDGETS --
+def read_widget(info: Dict[str, Any]) -> Any:
+    ftype = info["type"]
+    if ftype == "radio":
+        btn = info["group"].checkedButton()
+        return btn.text() if btn else ""
+    if ftype == "select":
+        return select_value(info["widget"])
+    if ftype in ("text", "number"):
+        return info["widget"].text()
+    if ftype == "date":
+        return date_value(info["widget"])
+    if ftype == "textarea":
+        return info["widget"].toPlainText()
+    if ftype == "checkbox":
+        return info["widget"].isChecked()
+    return None
+
+
+def write_widget(info: Dict[str, Any], value: Any) -> None:
+    ftype = info["type"]
+    if ftype == "radio":
+        group = info["group"]
+        for btn in group.buttons():
+            if btn.text() == value:
+                btn.setChecked(True)
+                return
+        checked = group.checkedButton()
+        if checked is not None:  # no option matches: clear the row
+            group.setExclusive(False)
+            checked.setChecked(False)
+            group.setExclusive(True)
+    elif ftype == "select":
+        set_select(info["widget"], value)
+    elif ftype in ("text", "number"):
+        info["widget"].setText(value or "")
+    elif ftype == "date":
+        set_date(info["widget"], value)
+    elif ftype == "textarea":
+        widget = info["widget"]
+        if widget.toPlainText() != (value or ""):
+            widget.setPlainText(value or "")
+    elif ftype == "checkbox":
+        info["widget"].setChecked(bool(value))
+
+
+_SIGNALS: Dict[str, Callable[[Dict[str, Any]], List[Any]]] = {
+    "radio": lambda info: [btn.toggled for btn in info["group"].buttons()],
+    "select": lambda info: [select_signal(info["widget"])],
+    "text": lambda info: [info["widget"].textChanged],
+    "number": lambda info: [info["widget"].textChanged],
+    "date": lambda info: [info["widget"].dateChanged],
+    "textarea": lambda info: [info["widget"].textChanged],
+    "checkbox": lambda info: [info["widget"].stateChanged],
+}
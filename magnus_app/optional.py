@@ -0,0 +1,52 @@
+"""Heavy or optional modules that are imported on first use.
+
+``OptionalModule.load()`` imports once and caches either the module or the
+import error, so a missing dependency turns into a "feature unavailable"
+message instead of a crash.  ``prewarm()`` does the same import on a daemon
+thread once the window is up, so the first click does not pay for it.
+"""
+from __future__ import annotations
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Optional
+
+
+class OptionalModule:
+    def __init__(self, name: str, feature: str) -> None:
+        self.name = name
+        self.feature = feature
+        self._module: Optional[ModuleType] = None
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[ModuleType]:
+        with self._lock:
+            if self._module is None and self._error is None:
+                try:
+                    self._module = importlib.import_module(self.name)
+                except Exception as e:
+                    self._error = e
+                    from .app import _log
+
+                    _log(f"[OPTIONAL] {self.feature} unavailable: {e!r}")
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        return self._error
+
+    def unavailable_message(self) -> str:
+        return f"{self.feature} is not available on this installation.\n\n{self._error}"
+
+    def prewarm(self) -> None:
+        if self._module is not None or self._error is not None:
+            return
+        threading.Thread(
+            target=self.load, name=f"prewarm-{self.name}", daemon=True
+        ).start()
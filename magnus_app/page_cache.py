@@ -0,0 +1,124 @@
+"""Which built pages stay resident, for low-memory terminals.
+
+Every page the user visits keeps its whole widget tree in the window's
+stack.  With ``MAGNUS_RESIDENT_PAGES=N`` only the ``N`` most recently shown
+pages stay built; the window tears down the least recently used one (its
+values already live in the state through the form model) and rebuilds it
+from the spec when it is shown again.  Unset or 0 keeps every page.
+
+The counters, including the widgets released and the process's resident
+memory, appear under "Page cache" in Performance Diagnostics.  Freed
+widgets are not always handed back to the system, so the memory figure
+is the current total rather than a per-eviction saving.
+"""
+from __future__ import annotations
+
+import os
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from magnus_app.perf import register_stats
+
+RESIDENT_ENV = "MAGNUS_RESIDENT_PAGES"
+
+
+def rss_mb() -> Optional[float]:
+    """Resident memory of this process, where it is cheap to read."""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/statm", "r") as fh:
+                return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+        if os.name == "nt":
+            import ctypes
+            from ctypes import wintypes
+
+            class _Counters(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = _Counters()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / 2**20
+    except Exception:
+        pass
+    return None
+
+
+class ResidentPages:
+    def __init__(self, limit: int = 0) -> None:
+        # the page shown and the one being opened must both fit
+        self.limit = max(limit, 2) if limit > 0 else 0
+        self._order: "OrderedDict[int, None]" = OrderedDict()
+        self._evicted: set = set()
+        self.evictions = 0
+        self.rebuilds = 0
+        self.widgets_released = 0
+
+    @classmethod
+    def from_env(cls) -> "ResidentPages":
+        try:
+            limit = int(os.getenv(RESIDENT_ENV, "0"))
+        except ValueError:
+            limit = 0
+        return cls(limit)
+
+    def built(self, index: int) -> None:
+        if index in self._evicted:
+            self._evicted.discard(index)
+            self.rebuilds += 1
+
+    def touch(self, index: int) -> List[int]:
+        """Mark ``index`` as just used; returns the pages to tear down."""
+        self._order[index] = None
+        self._order.move_to_end(index)
+        if not self.limit:
+            return []
+        excess = len(self._order) - self.limit
+        return [i for i in self._order if i != index][:max(excess, 0)]
+
+    def full(self) -> bool:
+        return bool(self.limit) and len(self._order) >= self.limit
+
+    def evicted(self, index: int, widgets: int) -> None:
+        self._order.pop(index, None)
+        self._evicted.add(index)
+        self.evictions += 1
+        self.widgets_released += widgets
+
+    def clear(self) -> None:
+        """Forget every page (the specs were replaced)."""
+        self._order.clear()
+        self._evicted.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "resident pages": len(self._order),
+            "limit": self.limit or "all",
+            "evictions": self.evictions,
+            "rebuilds": self.rebuilds,
+            "widgets released": self.widgets_released,
+        }
+        rss = rss_mb()
+        if rss is not None:
+            out["process memory MB"] = rss
+        return out
+
+
+def resident_pages() -> ResidentPages:
+    """A tracker configured from the environment, shown in diagnostics."""
+    pages = ResidentPages.from_env()
+    register_stats("Page cache", pages.stats)
+    return pages
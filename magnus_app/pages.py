@@ -1,20 +1,7 @@
 from typing import Any, Dict, List
 
-ISO_COUNTRIES = [
-    'United States',
-    'Canada',
-    'Mexico',
-    'United Kingdom',
-    'Germany',
-    'France',
-    'Australia',
-    'Japan',
-    'China',
-    'India',
-    'Brazil',
-    'Italy',
-    'Spain',
-]
+from magnus_app.countries import ISO_COUNTRIES  # noqa: F401  (re-exported)
+
 
 PAGES: List[Dict[str, Any]] = [
     {
@@ -394,6 +381,7 @@ PAGES: List[Dict[str, Any]] = [
                                 'label': 'Allocation Percentage (%)',
                                 'required': False,
                                 'validate': 'pct_0_100_two_dec',
+                                'sum_to': 100,
                             },
                         ],
                     }
@@ -736,6 +724,7 @@ PAGES: List[Dict[str, Any]] = [
                                 'label': 'CRD #',
                                 'required': True,
                                 'validate': 'crd',
+                                'validate_async': 'crd_snapshot',
                             },
                             {
                                 'name': 'role_other',
@@ -819,6 +808,7 @@ PAGES: List[Dict[str, Any]] = [
                                 'label': 'CRD #',
                                 'required': False,
                                 'validate': 'crd',
+                                'validate_async': 'crd_snapshot',
                             },
                             {
                                 'name': 'sro_branch',
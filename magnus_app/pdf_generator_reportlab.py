@@ -9,30 +9,28 @@ pip install reportlab python-docx
 """
 
 import os
-import sys
 import traceback
 
-# Check for required packages
+# ReportLab is required for PDF output.  Raise instead of exiting so the UI,
+# which loads this module on first use, can report the feature as unavailable.
 try:
     from reportlab.lib.pagesizes import letter
     from reportlab.lib import colors
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
     from reportlab.lib.units import inch
-except ImportError:
-    print("ERROR: ReportLab is not installed. Please run: pip install reportlab")
-    sys.exit(1)
-
-try:
-    from docx import Document
-    from docx.shared import Inches
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-except ImportError:
-    print("ERROR: python-docx is not installed. Please run: pip install python-docx")
-    sys.exit(1)
+except ImportError as exc:
+    raise ImportError("ReportLab is not installed. Please run: pip install reportlab") from exc
 
 def save_draft_word(form_data, output_path):
     """Save form data as a Word document draft"""
+    # python-docx is only needed for Word drafts; load it on first use
+    try:
+        from docx import Document
+    except ImportError:
+        print("ERROR: python-docx is not installed. Please run: pip install python-docx")
+        return False
+
     try:
         # Create document
         doc = Document()
@@ -0,0 +1,204 @@
+"""Lightweight timing spans for the form's hot paths.
+
+Timing is off by default; set ``MAGNUS_PERF=1`` or tick "Record timings" in
+Help > Performance Diagnostics to turn it on.  While disabled, ``span()``
+hands back a shared no-op context manager and ``timed()`` wrappers call
+straight through, so instrumented call sites cost one flag check.
+
+Recorded spans are kept in a bounded per-operation window (for the p50/p95
+shown in the dialog) and appended as JSON lines to ``perf.jsonl`` next to
+the crash log.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .logrotate import LogRotator
+
+_SAMPLES_PER_OP = 512
+_FLUSH_EVERY = 64
+
+_enabled = os.getenv("MAGNUS_PERF", "") not in ("", "0")
+_lock = threading.Lock()
+_samples: Dict[str, Deque[float]] = {}
+_pending: List[str] = []
+_stats_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+_rotator: Optional[LogRotator] = None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(on: bool = True) -> None:
+    global _enabled
+    _enabled = bool(on)
+    if not _enabled:
+        flush()
+
+
+def timings_path() -> Path:
+    from .app import log_path
+
+    return log_path().with_name("perf.jsonl")
+
+
+# ---------------------------------------------------------------- SPANS --
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    """Context manager timing the enclosed block under ``name``."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def timed(name: str | None = None):
+    """Decorator timing every call of the wrapped function."""
+
+    def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
+        label = name or fn.__qualname__
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - start)
+
+        return wrapper
+
+    return deco
+
+
+def record(name: str, seconds: float) -> None:
+    ms = seconds * 1000.0
+    line = json.dumps(
+        {
+            "ts": round(time.time(), 3),
+            "op": name,
+            "ms": round(ms, 3),
+            "thread": threading.current_thread().name,
+        }
+    )
+    with _lock:
+        window = _samples.get(name)
+        if window is None:
+            window = _samples[name] = deque(maxlen=_SAMPLES_PER_OP)
+        window.append(ms)
+        _pending.append(line)
+        flush_now = len(_pending) >= _FLUSH_EVERY
+    if flush_now:
+        flush()
+
+
+def flush() -> None:
+    with _lock:
+        lines = list(_pending)
+        _pending.clear()
+    if not lines:
+        return
+    global _rotator
+    try:
+        path = timings_path()
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write("\n".join(lines))
+            fh.write("\n")
+            size = fh.tell()
+        if _rotator is None:
+            _rotator = LogRotator.from_env(path)
+        _rotator.after_write(size)
+    except Exception:
+        # never raise from instrumentation
+        pass
+
+
+atexit.register(flush)
+
+
+# ------------------------------------------------------------- SUMMARY --
+def _percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    # nearest-rank percentile
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summary() -> List[Tuple[str, int, float, float, float]]:
+    """Return ``(operation, count, p50_ms, p95_ms, max_ms)`` per operation."""
+    with _lock:
+        snapshot = {name: list(window) for name, window in _samples.items()}
+    rows = []
+    for name in sorted(snapshot):
+        ordered = sorted(snapshot[name])
+        rows.append(
+            (
+                name,
+                len(ordered),
+                _percentile(ordered, 50),
+                _percentile(ordered, 95),
+                ordered[-1] if ordered else 0.0,
+            )
+        )
+    return rows
+
+
+def reset() -> None:
+    with _lock:
+        _samples.clear()
+
+
+# --------------------------------------------------------------- STATS --
+def register_stats(label: str, provider: Callable[[], Dict[str, Any]]) -> None:
+    """Expose extra counters (cache hits, memory, ...) in the diagnostics dialog."""
+    _stats_providers[label] = provider
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for label, provider in list(_stats_providers.items()):
+        try:
+            out[label] = dict(provider())
+        except Exception as e:
+            out[label] = {"error": str(e)}
+    return out
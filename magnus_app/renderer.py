@@ -1,10 +1,8 @@
-from typing import Any, Callable, Dict, List, Tuple
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
-from PyQt6.QtCore import QDate
 from PyQt6.QtWidgets import (
     QCheckBox,
-    QComboBox,
-    QDateEdit,
     QGroupBox,
     QHBoxLayout,
     QLabel,
@@ -20,55 +18,83 @@ from PyQt6.QtWidgets import (
     QPushButton,
 )
 
-from magnus_app.pages import ISO_COUNTRIES, PAGES
+from magnus_app.pages import PAGES
+from magnus_app.conditions import compile_condition
+from magnus_app.dates import date_value, make_date_edit, set_date
+from magnus_app.item_pool import ItemEditor, ItemEditorPool
+from magnus_app.item_table import TABLE_MIN_ITEMS, ItemTable, ItemTableModel
+from magnus_app.model import FormModel
+from magnus_app.perf import timed
+from magnus_app.selects import make_select, select_signal, select_value, set_select
+from magnus_app.state import FieldRef, RunningTotal
+from magnus_app.validation import Validator
+from magnus_app.visibility import VisibilityEngine
 
 
 class PageRenderer:
     """Render pages and fields based on a specification."""
 
-    def __init__(self, state: Dict[str, Any], validators: Dict[str, Callable[..., bool]]):
-        self.state = state
+    def __init__(self, model: FormModel, validators: Dict[str, Validator]):
+        self.model = model
+        self.state = model.data
         self.validators = validators
+        # (repeating group, subfield) -> live total for 'sum_to' subfields
+        self.totals: Dict[Tuple[str, str], RunningTotal] = {}
+        # id(field spec) -> (spec, its FieldRef); for repeating groups
+        # (spec, one tuple of subfield refs per item seen so far).  The spec
+        # is held so its id cannot be reused by another object.
+        self._refs: Dict[int, Tuple[Dict[str, Any], FieldRef]] = {}
+        self._item_refs: Dict[int, Tuple[Dict[str, Any], List[Tuple[FieldRef, ...]]]] = {}
+        self._refs_lock = threading.Lock()  # the Review check iterates off-thread
 
     # -------------------------------------------------------------- ITERATE --
-    def iterate_fields(self, fields: List[Dict[str, Any]], values: Dict[str, Any]):
-        """Yield field specs that should be validated based on show_if rules."""
+    def iterate_fields(
+        self, fields: List[Dict[str, Any]], values: Mapping[str, Any]
+    ) -> Iterator[FieldRef]:
+        """Yield a FieldRef for each field that should be validated based on
+        show_if rules; the refs are cached, so a pass allocates nothing."""
         for fld in fields:
             ftype = fld.get("type")
+            cond = fld.get("show_if")
+            if cond and not compile_condition(cond)(values):
+                continue
             if ftype == "group":
-                cond = fld.get("show_if") or {}
-                if cond:
-                    name, val = next(iter(cond.items()))
-                    if values.get(name, "") != val:
-                        continue
                 yield from self.iterate_fields(fld.get("fields", []), values)
             elif ftype == "repeating_group":
-                cond = fld.get("show_if") or {}
-                if cond:
-                    name, val = next(iter(cond.items()))
-                    if values.get(name, "") != val:
-                        continue
                 name = fld.get("name")
                 items = values.get(name)
                 if not isinstance(items, list) or not items:
                     items = [{}]
+                rows = self._group_refs(fld, len(items))
                 for i, item_vals in enumerate(items):
-                    for sub in fld.get("fields", []):
-                        scond = sub.get("show_if")
-                        if scond:
-                            sname, sval = next(iter(scond.items()))
-                            if item_vals.get(sname, "") != sval:
-                                continue
-                        sub_spec = dict(sub)
-                        sub_spec["_rg"] = {"name": name, "index": i}
-                        yield sub_spec
+                    for ref in rows[i]:
+                        scond = ref.spec.get("show_if")
+                        if scond and not compile_condition(scond, item_scope=True)(values, item_vals):
+                            continue
+                        yield ref
             elif ftype != "label":
-                cond = fld.get("show_if")
-                if cond:
-                    name, val = next(iter(cond.items()))
-                    if values.get(name, "") != val:
-                        continue
-                yield fld
+                entry = self._refs.get(id(fld))
+                if entry is None or entry[0] is not fld:
+                    entry = (fld, FieldRef(fld))
+                    self._refs[id(fld)] = entry
+                yield entry[1]
+
+    def _group_refs(self, fld: Dict[str, Any], count: int) -> List[Tuple[FieldRef, ...]]:
+        """Subfield refs of a repeating group for at least ``count`` items."""
+        entry = self._item_refs.get(id(fld))
+        if entry is not None and entry[0] is fld and len(entry[1]) >= count:
+            return entry[1]
+        with self._refs_lock:
+            entry = self._item_refs.get(id(fld))
+            if entry is None or entry[0] is not fld:
+                entry = (fld, [])
+                self._item_refs[id(fld)] = entry
+            rows = entry[1]
+            name = fld.get("name")
+            subs = [sub for sub in fld.get("fields", []) if sub.get("type") != "label"]
+            while len(rows) < count:
+                rows.append(tuple(FieldRef(sub, name, len(rows)) for sub in subs))
+            return rows
 
     # -------------------------------------------------------------- RENDER --
     def render_fields(
@@ -77,7 +103,7 @@ class PageRenderer:
         layout: QVBoxLayout,
         inputs: Dict[str, Dict[str, Any]],
         groups: List[Tuple[QWidget, Dict[str, str]]],
-        on_change: Callable[[], None],
+        on_change: Callable[[Optional[str]], None],
     ) -> None:
         for field in fields:
             ftype = field.get("type")
@@ -100,54 +126,100 @@ class PageRenderer:
 
                 item_boxes: List[QGroupBox] = []
 
-                def renumber() -> None:
-                    for i, box in enumerate(item_boxes):
-                        box.setTitle(f"{field.get('item_label', 'Item')} {i + 1}")
+                # 'sum_to' subfields keep a running total shown above the items
+                totals: Dict[str, RunningTotal] = {}
+                total_labels: Dict[str, QLabel] = {}
+                for sub in field.get("fields", []):
+                    if "sum_to" in sub:
+                        totals[sub["name"]] = RunningTotal(sub["sum_to"])
+                        self.totals[(name, sub["name"])] = totals[sub["name"]]
+                        total_labels[sub["name"]] = QLabel()
+                        vbox.addWidget(total_labels[sub["name"]])
+
+                def show_totals() -> None:
+                    for sub_name, total in totals.items():
+                        lab = total_labels[sub_name]
+                        lab.setText(f"Total: {total.total:.2f}% / {total.target:g}%")
+                        if total.complete:
+                            look = "valid"
+                        elif total.total > total.target:
+                            look = "invalid"
+                        else:
+                            look = "neutral"
+                        if lab.property("validation") != look:
+                            lab.setProperty("validation", look)
+                            lab.style().unpolish(lab)
+                            lab.style().polish(lab)
+
+                if field.get("view") == "table" or len(items) >= TABLE_MIN_ITEMS:
+                    table = self._render_item_table(field, items, vbox, totals, show_totals, on_change)
+                    layout.addWidget(container)
+                    if field.get("show_if"):
+                        groups.append((container, field["show_if"]))
+                    inputs[name] = {"type": "repeating_group", "table": table}
+                    continue
+
+                editors: List[ItemEditor] = []
+                item_label = field.get("item_label", "Item")
+
+                def item_edited(editor: ItemEditor, sub_name: str, val: Any) -> None:
+                    editor.item[sub_name] = val
+                    total = totals.get(sub_name)
+                    if total is not None:
+                        total.set(id(editor.item), val)
+                        show_totals()
+                    on_change(name)
+
+                def do_remove(editor: ItemEditor) -> None:
+                    pos = editors.index(editor)
+                    for total in totals.values():
+                        total.discard(id(items[pos]))
+                    items.pop(pos)
+                    vbox.removeWidget(editor.box)
+                    editors.pop(pos)
+                    item_boxes.pop(pos)
+                    pool.release(editor)
+                    for i in range(pos, len(editors)):
+                        editors[i].box.setTitle(f"{item_label} {i + 1}")
+                    show_totals()
+                    on_change(name)
+
+                pool = ItemEditorPool(
+                    lambda: self._build_item_editor(field, item_edited, do_remove)
+                )
 
                 def add_item(prefill: Dict[str, Any] | None = None) -> None:
-                    idx = len(item_boxes)
+                    idx = len(editors)
                     if prefill is None:
                         prefill = {}
                     if idx >= len(items):
                         items.append(prefill)
-                    box = QGroupBox(f"{field.get('item_label', 'Item')} {idx + 1}")
-                    box_layout = QVBoxLayout(box)
-                    for sub in field.get("fields", []):
-                        self._render_repeating_subfield(name, idx, sub, box_layout, on_change)
-
-                    remove_btn = QPushButton(f"Remove {field.get('item_label', 'Item')}")
-                    remove_btn.setObjectName("btn-remove-item")
-
-                    def do_remove() -> None:
-                        pos = item_boxes.index(box)
-                        items.pop(pos)
-                        vbox.removeWidget(box)
-                        box.deleteLater()
-                        item_boxes.pop(pos)
-                        renumber()
-                        on_change()
-
-                    remove_btn.clicked.connect(do_remove)
-                    box_layout.addWidget(remove_btn)
-
-                    item_boxes.append(box)
-                    vbox.addWidget(box)
-                    on_change()
+                    for sub_name, total in totals.items():
+                        total.set(id(items[idx]), items[idx].get(sub_name))
+                    editor = pool.acquire()
+                    editor.load(items[idx], f"{item_label} {idx + 1}")
+                    editors.append(editor)
+                    item_boxes.append(editor.box)
+                    vbox.addWidget(editor.box)
+                    editor.box.show()
+                    show_totals()
+                    on_change(name)
 
                 if items:
                     for itm in list(items):
                         add_item(itm)
                 else:
                     add_item({})
+                pool.prewarm(2)
 
-                add_btn = QPushButton(f"Add Another {field.get('item_label', 'Item')}")
+                add_btn = QPushButton(f"Add Another {item_label}")
                 add_btn.clicked.connect(lambda: add_item({}))
                 vbox.addWidget(add_btn)
 
                 layout.addWidget(container)
                 if field.get("show_if"):
                     groups.append((container, field["show_if"]))
-                inputs[name] = {"type": "repeating_group"}
+                inputs[name] = {"type": "repeating_group", "boxes": item_boxes, "pool": pool}
                 continue
 
 
@@ -171,60 +243,36 @@ class PageRenderer:
                 group = QButtonGroup(container)
                 for opt in field.get("options", []):
                     rb = QRadioButton(opt)
-                    if self.state.get(name) == opt:
-                        rb.setChecked(True)
                     group.addButton(rb)
                     hl.addWidget(rb)
-                    rb.toggled.connect(on_change)
                 container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
                 inputs[name] = {"type": "radio", "group": group}
+                self.model.bind(name, inputs[name])
                 layout.addWidget(container)
                 continue
 
             if ftype == "select":
-                widget = QComboBox()
-                opts = field.get("options") or []
-                if opts == "ISO_COUNTRIES":
-                    opts = ISO_COUNTRIES
-                widget.addItems([""] + list(opts))
-                widget.setCurrentText(self.state.get(name, ""))
-                widget.currentTextChanged.connect(on_change)
+                widget = make_select(field)
                 widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
             elif ftype == "text":
                 widget = QLineEdit()
-                widget.setText(self.state.get(name, ""))
-                widget.textChanged.connect(on_change)
                 widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
             elif ftype == "number":
                 widget = QLineEdit()
-                widget.setText(self.state.get(name, ""))
-                widget.textChanged.connect(on_change)
                 widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
             elif ftype == "date":
-                widget = QDateEdit()
-                widget.setDisplayFormat("yyyy-MM-dd")
-                widget.setCalendarPopup(True)
-                val = self.state.get(name, "")
-                if val:
-                    dt = QDate.fromString(val, "yyyy-MM-dd")
-                    if dt.isValid():
-                        widget.setDate(dt)
-                widget.dateChanged.connect(on_change)
+                widget = make_date_edit()
                 widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
             elif ftype == "textarea":
                 widget = QTextEdit()
-                widget.setPlainText(self.state.get(name, ""))
-                widget.textChanged.connect(on_change)
                 widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
             elif ftype == "checkbox":
                 widget = QCheckBox(label_text)
-                widget.setChecked(bool(self.state.get(name, False)))
-                widget.stateChanged.connect(on_change)
                 label_text = ""  # label already used
             else:
                 continue
@@ -235,23 +283,84 @@ class PageRenderer:
                 layout.addWidget(lab)
             layout.addWidget(widget)
             inputs[name] = {"type": ftype, "widget": widget}
+            # the model sets the widget and takes its edits from here on
+            self.model.bind(name, inputs[name])
+
+    def _render_item_table(
+        self,
+        field: Dict[str, Any],
+        items: List[Dict[str, Any]],
+        layout: QVBoxLayout,
+        totals: Dict[str, RunningTotal],
+        show_totals: Callable[[], None],
+        on_change: Callable[[Optional[str]], None],
+    ) -> ItemTable:
+        """One table row per item instead of a group box per item."""
+        name = field.get("name")
+        if not items:
+            items.append({})
+        for item in items:
+            for sub_name, total in totals.items():
+                total.set(id(item), item.get(sub_name))
+
+        def edited(item: Dict[str, Any], sub_name: str) -> None:
+            total = totals.get(sub_name)
+            if total is not None:
+                total.set(id(item), item.get(sub_name))
+                show_totals()
+            on_change(name)
+
+        def rows_changed(removed: Optional[Dict[str, Any]]) -> None:
+            if removed is not None:
+                for total in totals.values():
+                    total.discard(id(removed))
+            show_totals()
+            on_change(name)
+
+        model = ItemTableModel(
+            items, field.get("fields", []), self.state, field.get("item_label", "Item"), edited
+        )
+        table = ItemTable(model, rows_changed)
+        layout.addWidget(table)
+        show_totals()
+        return table
+
+    def _build_item_editor(
+        self,
+        field: Dict[str, Any],
+        on_value: Callable[[ItemEditor, str, Any], None],
+        on_remove: Callable[[ItemEditor], None],
+    ) -> ItemEditor:
+        """A repeating-group item box, not yet bound to an item."""
+        box = QGroupBox()
+        box_layout = QVBoxLayout(box)
+        editor = ItemEditor(box)
+        for sub in field.get("fields", []):
+            sub_name = sub.get("name")
+            loader = self._render_repeating_subfield(
+                sub, box_layout,
+                lambda val, sub_name=sub_name: on_value(editor, sub_name, val),
+            )
+            if loader is not None:
+                editor.loaders[sub_name] = loader
+
+        remove_btn = QPushButton(f"Remove {field.get('item_label', 'Item')}")
+        remove_btn.setObjectName("btn-remove-item")
+        remove_btn.clicked.connect(lambda: on_remove(editor))
+        box_layout.addWidget(remove_btn)
+        return editor
 
     def _render_repeating_subfield(
         self,
-        group_name: str,
-        index: int,
         sub_spec: Dict[str, Any],
         layout: QVBoxLayout,
-        on_change: Callable[[], None],
-    ) -> None:
+        set_value: Callable[[Any], None],
+    ) -> Optional[Callable[[Any], None]]:
+        """Add a subfield's widgets; returns the loader that shows an item's
+        value in them without emitting their change signals."""
         sub_name = sub_spec.get("name")
         ftype = sub_spec.get("type")
         label_text = sub_spec.get("label", sub_name)
-        data = self.state[group_name][index]
-
-        def set_value(val: Any) -> None:
-            data[sub_name] = val
-            on_change()
 
         if ftype == "radio":
             container = QWidget()
@@ -262,76 +371,78 @@ class PageRenderer:
             group = QButtonGroup(container)
             for opt in sub_spec.get("options", []):
                 rb = QRadioButton(opt)
-                if data.get(sub_name) == opt:
-                    rb.setChecked(True)
                 group.addButton(rb)
                 hl.addWidget(rb)
                 rb.toggled.connect(lambda checked, opt=opt: set_value(opt) if checked else None)
             container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            container.setObjectName(sub_name)
             layout.addWidget(container)
-            return
 
-        if ftype == "select":
-            widget = QComboBox()
-            opts = sub_spec.get("options") or []
-            if opts == "ISO_COUNTRIES":
-                opts = ISO_COUNTRIES
-            widget.addItems([""] + list(opts))
-            widget.setCurrentText(data.get(sub_name, ""))
-            widget.currentTextChanged.connect(lambda val: set_value(val))
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            def load_radio(val: Any) -> None:
+                group.setExclusive(False)
+                for rb in group.buttons():
+                    rb.blockSignals(True)
+                    rb.setChecked(rb.text() == val)
+                    rb.blockSignals(False)
+                group.setExclusive(True)
 
-        elif ftype == "text":
-            widget = QLineEdit()
-            widget.setText(data.get(sub_name, ""))
-            widget.textChanged.connect(lambda val: set_value(val))
+            return load_radio
+
+        if ftype == "select":
+            widget = make_select(sub_spec)
+            select_signal(widget).connect(lambda *_: set_value(select_value(widget)))
             widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            load = lambda val: set_select(widget, val)
 
-        elif ftype == "number":
+        elif ftype in ("text", "number"):
             widget = QLineEdit()
-            widget.setText(data.get(sub_name, ""))
             widget.textChanged.connect(lambda val: set_value(val))
             widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            load = lambda val: widget.setText(val or "")
 
         elif ftype == "date":
-            widget = QDateEdit()
-            widget.setDisplayFormat("yyyy-MM-dd")
-            widget.setCalendarPopup(True)
-            val = data.get(sub_name, "")
-            if val:
-                dt = QDate.fromString(val, "yyyy-MM-dd")
-                if dt.isValid():
-                    widget.setDate(dt)
-            widget.dateChanged.connect(lambda dt: set_value(dt.toString("yyyy-MM-dd")))
+            widget = make_date_edit()
+            widget.dateChanged.connect(lambda _: set_value(date_value(widget)))
             widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            load = lambda val: set_date(widget, val)
 
         elif ftype == "textarea":
             widget = QTextEdit()
-            widget.setPlainText(data.get(sub_name, ""))
             widget.textChanged.connect(lambda: set_value(widget.toPlainText()))
             widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+            load = lambda val: widget.setPlainText(val or "")
 
         elif ftype == "checkbox":
             widget = QCheckBox(label_text)
-            widget.setChecked(bool(data.get(sub_name, False)))
             widget.stateChanged.connect(lambda state: set_value(bool(state)))
             label_text = ""
             widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+            load = lambda val: widget.setChecked(bool(val))
 
         else:
-            return
+            return None
 
+        widget.setObjectName(sub_name)
         if label_text:
             lab = QLabel(label_text)
             lab.setWordWrap(True)
             layout.addWidget(lab)
         layout.addWidget(widget)
 
+        def load_blocked(val: Any) -> None:
+            widget.blockSignals(True)
+            try:
+                load(val)
+            finally:
+                widget.blockSignals(False)
+
+        return load_blocked
+
+    @timed("render_page_from_spec")
     def render_page_from_spec(
         self,
         page_spec: Dict[str, Any],
         index: int,
-        on_change: Callable[[], None],
         on_next: Callable[[], None],
         on_back: Callable[[], None],
     ) -> Tuple[QWidget, Dict[str, Any]]:
@@ -354,7 +465,7 @@ class PageRenderer:
         for section in page_spec.get("sections", []):
             box = QGroupBox(section.get("title", ""))
             box_layout = QVBoxLayout(box)
-            self.render_fields(section.get("fields", []), box_layout, inputs, groups, on_change)
+            self.render_fields(section.get("fields", []), box_layout, inputs, groups, self.model.touch)
             content_layout.addWidget(box)
 
         content_layout.addItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
@@ -377,6 +488,8 @@ class PageRenderer:
             "spec": page_spec,
             "inputs": inputs,
             "groups": groups,
+            "visibility": VisibilityEngine(page, groups),
             "next_btn": next_btn,
+            "scroll": scroll,
         }
         return page, meta
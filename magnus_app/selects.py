@@ -0,0 +1,94 @@
+"""Combo boxes for ``select`` fields.
+
+A select whose options name a list in :data:`OPTION_LISTS` (``'ISO_COUNTRIES'``,
+``'US_STATES'``) does not copy the list: every such combo, on any page or
+repeating-group item, shows the one :class:`QStringListModel` built for it.
+Those combos are editable with a prefix completer over the same model; the
+list is sorted, so the completer binary-searches it.  Typed text is only
+committed when it names an entry exactly (ignoring case), as it does once
+picked from the completer; anything else, a bare prefix included, goes
+back to the committed value, so the form never stores a country the user
+did not choose.
+
+Because an editable combo's text changes while typing, use
+:func:`select_signal`/:func:`select_value`/:func:`set_select` rather than
+``currentTextChanged``/``currentText``/``setCurrentText``.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import QCoreApplication, QStringListModel, Qt
+from PyQt6.QtWidgets import QComboBox, QCompleter, QWidget
+
+from magnus_app.countries import OPTION_LISTS, entry_index
+
+_models: Dict[str, QStringListModel] = {}
+
+
+def shared_model(list_name: str) -> QStringListModel:
+    """The list's model; created on first use, once a QApplication exists."""
+    model = _models.get(list_name)
+    if model is None:
+        model = QStringListModel([""] + OPTION_LISTS[list_name], QCoreApplication.instance())
+        _models[list_name] = model
+    return model
+
+
+def make_select(spec: Dict[str, Any], parent: Optional[QWidget] = None) -> QComboBox:
+    opts = spec.get("options") or []
+    combo = QComboBox(parent)
+    if not (isinstance(opts, str) and opts in OPTION_LISTS):
+        combo.addItems([""] + list(opts))
+        return combo
+
+    combo.setModel(shared_model(opts))
+    combo.setEditable(True)
+    combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+    completer = QCompleter(combo.model(), combo)
+    completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+    completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+    completer.setModelSorting(QCompleter.ModelSorting.CaseInsensitivelySortedModel)
+    combo.setCompleter(completer)
+    combo.setProperty("option_list", opts)
+
+    def resolve() -> None:
+        text = combo.lineEdit().text()
+        if not text.strip():
+            combo.setCurrentIndex(0)
+            return
+        row = entry_index(opts, text)
+        if row is None:  # not an entry (maybe a prefix): keep the committed value
+            combo.lineEdit().setText(combo.itemText(combo.currentIndex()))
+            return
+        combo.setCurrentIndex(row + 1)  # row 0 is the blank entry
+        combo.lineEdit().setText(combo.itemText(row + 1))
+
+    combo.lineEdit().editingFinished.connect(resolve)
+    return combo
+
+
+def select_signal(combo: QComboBox) -> Any:
+    """Signal emitted when the committed value changes."""
+    if combo.property("option_list"):
+        return combo.currentIndexChanged
+    return combo.currentTextChanged
+
+
+def select_value(combo: QComboBox) -> str:
+    if combo.property("option_list"):
+        return combo.itemText(combo.currentIndex())
+    return combo.currentText()
+
+
+def set_select(combo: QComboBox, value: Any) -> None:
+    list_name = combo.property("option_list")
+    if not list_name:
+        combo.setCurrentText(value or "")
+        return
+    row = entry_index(list_name, value) if value else None
+    if row is not None and OPTION_LISTS[list_name][row] != value:
+        row = None  # stored values match exactly
+    index = 0 if row is None else row + 1
+    combo.setCurrentIndex(index)
+    combo.lineEdit().setText(combo.itemText(index))
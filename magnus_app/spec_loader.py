@@ -0,0 +1,303 @@
+"""Page specs loaded from JSON/YAML files instead of the built-in PAGES.
+
+Point ``MAGNUS_SPEC_DIR`` at a directory of ``*.json``/``*.yaml``/``*.yml``
+files.  Each file holds one page (``{key, title, sections}``) or a list of
+pages; files are read in name order, so prefix them (``01_personal.yaml``).
+Every page is checked against the schema below (field types, allowed keys,
+names, options, ``show_if`` syntax, and ``validate``/``validate_async``
+names, which must be registered, plugins included) before it replaces
+PAGES, and the first problem is reported with its file and path.
+
+The checked result is cached as JSON under a hash of the files' names and
+contents and of the registered validators, so a start with unchanged specs
+skips YAML parsing and checking.  Cache files are named after the spec
+directory too, so several directories (and running instances) share the
+cache folder without evicting each other's entries.
+The cache directory is user-writable, so the cache is read with
+:func:`json.loads`, never with an unsafe loader, and a cache that does not
+hold a list of pages is rebuilt.  ``MAGNUS_SPEC_DEV=1`` additionally watches the directory
+and rebuilds the form when a file changes.
+
+Command line::
+
+    python -m magnus_app.spec_loader check DIR   # validate, exit 1 on error
+    python -m magnus_app.spec_loader export DIR  # write built-in PAGES as JSON
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from magnus_app.conditions import ConditionError, clear_cache, compile_condition
+from magnus_app.countries import OPTION_LISTS
+from magnus_app.form_check import affected_pages
+from magnus_app.pages import PAGES
+from magnus_app.validation import PLUGINS_ENV, VALIDATORS, load_plugins
+
+SPEC_DIR_ENV = "MAGNUS_SPEC_DIR"
+SPEC_DEV_ENV = "MAGNUS_SPEC_DEV"
+SPEC_CACHE_ENV = "MAGNUS_SPEC_CACHE"
+
+# Bump when the checks or the cached layout change
+_FORMAT = 3
+
+# Stale cache files younger than this may belong to another instance
+_PRUNE_GRACE_SECONDS = 3600
+
+_SUFFIXES = (".json", ".yaml", ".yml")
+
+# ---------------------------------------------------------------- SCHEMA --
+PAGE_KEYS: Dict[str, Any] = {"key": str, "title": str, "sections": list}
+SECTION_KEYS: Dict[str, Any] = {"title": str, "fields": list}
+FIELD_KEYS: Dict[str, Any] = {
+    "type": str,
+    "name": str,
+    "label": str,
+    "required": bool,
+    "options": (list, str),
+    "validate": str,
+    "validate_async": str,
+    "fields": list,
+    "show_if": (dict, str),
+    "item_label": str,
+    "sum_to": (int, float),
+    "view": str,
+}
+VALUE_TYPES = {"text", "number", "date", "textarea", "checkbox", "radio", "select"}
+FIELD_TYPES = VALUE_TYPES | {"label", "group", "repeating_group"}
+
+
+class SpecError(ValueError):
+    """A spec file that cannot be read or does not match the schema."""
+
+
+def _check_keys(obj: Any, allowed: Dict[str, Any], required: Tuple[str, ...], where: str) -> None:
+    if not isinstance(obj, dict):
+        raise SpecError(f"{where}: expected an object, got {type(obj).__name__}")
+    for key in required:
+        if key not in obj:
+            raise SpecError(f"{where}: missing '{key}'")
+    for key, value in obj.items():
+        if key not in allowed:
+            raise SpecError(f"{where}: unknown key '{key}'")
+        expected = allowed[key]
+        if not isinstance(value, expected) or (expected is not bool and isinstance(value, bool)):
+            raise SpecError(f"{where}.{key}: wrong type {type(value).__name__}")
+
+
+def _check_fields(
+    fields: List[Any], where: str, names: Dict[str, str], in_group: bool = False
+) -> None:
+    for i, fld in enumerate(fields):
+        at = f"{where}.fields[{i}]"
+        _check_keys(fld, FIELD_KEYS, ("type",), at)
+        ftype = fld["type"]
+        if ftype not in FIELD_TYPES:
+            raise SpecError(f"{at}: unknown field type '{ftype}'")
+        if ftype in VALUE_TYPES or ftype == "repeating_group":
+            if not fld.get("name"):
+                raise SpecError(f"{at}: a {ftype} field needs a 'name'")
+            if not in_group:  # subfield names only need to be unique per item
+                if fld["name"] in names:
+                    raise SpecError(f"{at}: name '{fld['name']}' already used at {names[fld['name']]}")
+                names[fld["name"]] = at
+        if ftype in ("radio", "select"):
+            opts = fld.get("options")
+            if isinstance(opts, str) and opts not in OPTION_LISTS:
+                raise SpecError(f"{at}.options: unknown option list '{opts}'")
+            if opts is None or (isinstance(opts, list) and not all(isinstance(o, str) for o in opts)):
+                raise SpecError(f"{at}.options: expected a list of strings or an option list name")
+        for key in ("validate", "validate_async"):
+            if key in fld and fld[key] not in VALIDATORS:
+                raise SpecError(
+                    f"{at}.{key}: unknown validator '{fld[key]}'"
+                    f" (plugins are loaded from {PLUGINS_ENV})"
+                )
+        if "show_if" in fld:
+            try:
+                compile_condition(fld["show_if"], item_scope=in_group)
+            except ConditionError as e:
+                raise SpecError(f"{at}.show_if: {e}") from None
+        if ftype == "group":
+            if "show_if" not in fld or "fields" not in fld:
+                raise SpecError(f"{at}: a group needs 'show_if' and 'fields'")
+            _check_fields(fld["fields"], at, names, in_group)
+        elif ftype == "repeating_group":
+            if in_group:
+                raise SpecError(f"{at}: repeating groups cannot be nested")
+            _check_fields(fld.get("fields", []), at, {}, in_group=True)
+        elif "fields" in fld:
+            raise SpecError(f"{at}: only groups have 'fields'")
+
+
+def check_pages(pages: List[Any], sources: Optional[List[str]] = None) -> None:
+    """Raise SpecError for the first page that does not match the schema."""
+    if not pages:
+        raise SpecError("no pages found")
+    names: Dict[str, str] = {}
+    keys = set()
+    for i, page in enumerate(pages):
+        where = f"{sources[i]}: " if sources else ""
+        where += f"pages[{i}]"
+        _check_keys(page, PAGE_KEYS, ("key", "title", "sections"), where)
+        if page["key"] in keys:
+            raise SpecError(f"{where}: duplicate page key '{page['key']}'")
+        keys.add(page["key"])
+        for j, section in enumerate(page["sections"]):
+            at = f"{where}.sections[{j}]"
+            _check_keys(section, SECTION_KEYS, ("fields",), at)
+            _check_fields(section["fields"], at, names)
+
+
+# ---------------------------------------------------------------- LOADING --
+def spec_files(spec_dir: Path) -> List[Path]:
+    return sorted(p for p in spec_dir.iterdir() if p.is_file() and p.suffix.lower() in _SUFFIXES)
+
+
+def _parse(path: Path, raw: bytes) -> List[Any]:
+    if path.suffix.lower() == ".json":
+        try:
+            data = json.loads(raw.decode("utf-8"))
+        except ValueError as e:
+            raise SpecError(f"{path.name}: {e}") from None
+    else:
+        try:
+            import yaml
+        except ImportError as e:
+            raise SpecError(f"{path.name}: YAML specs need PyYAML ({e})") from None
+        try:
+            data = yaml.safe_load(raw.decode("utf-8"))
+        except yaml.YAMLError as e:
+            raise SpecError(f"{path.name}: {e}") from None
+    return data if isinstance(data, list) else [data]
+
+
+def _cache_dir() -> Path:
+    env = os.getenv(SPEC_CACHE_ENV)
+    if env:
+        return Path(env).expanduser()
+    if os.name == "nt":
+        base = Path(os.getenv("LOCALAPPDATA", Path.home()))
+        return base / "Magnus Client Intake" / "Cache"
+    base = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "Magnus Client Intake"
+
+
+def load_pages(spec_dir: Path, use_cache: bool = True) -> Tuple[List[Dict[str, Any]], bool]:
+    """Read and check the specs in ``spec_dir``; returns (pages, from_cache)."""
+    files = spec_files(spec_dir)
+    contents = [(p, p.read_bytes()) for p in files]
+    digest = hashlib.sha256(f"{_FORMAT}:{','.join(sorted(VALIDATORS))}".encode())
+    for path, raw in contents:
+        digest.update(path.name.encode() + b"\0" + raw + b"\0")
+    source = hashlib.sha256(str(spec_dir.resolve()).encode()).hexdigest()[:16]
+    cached = _cache_dir() / f"pages-{source}-{digest.hexdigest()[:32]}.json"
+
+    if use_cache:
+        try:
+            pages = json.loads(cached.read_bytes().decode("utf-8"))
+        except (OSError, ValueError):
+            pages = None  # missing or unreadable: rebuild it
+        if isinstance(pages, list) and pages and all(isinstance(p, dict) for p in pages):
+            return pages, True
+
+    pages: List[Any] = []
+    sources: List[str] = []
+    for path, raw in contents:
+        parsed = _parse(path, raw)
+        pages.extend(parsed)
+        sources.extend([path.name] * len(parsed))
+    check_pages(pages, sources)
+
+    if use_cache:
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(pages, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, cached)
+        except (OSError, TypeError, ValueError):
+            pass  # caching is best effort (YAML can hold values JSON cannot)
+        else:
+            _prune_cache(cached, f"pages-{source}-")
+    return pages, False
+
+
+def _prune_cache(keep: Path, prefix: str) -> None:
+    """Drop this spec directory's older cache files; recent ones may be in
+    use by another instance still on the previous specs."""
+    cutoff = time.time() - _PRUNE_GRACE_SECONDS
+    for old in keep.parent.glob(f"{prefix}*.json"):
+        try:
+            if old != keep and old.stat().st_mtime < cutoff:
+                old.unlink()
+        except OSError:
+            pass
+
+
+def install_pages(pages: List[Dict[str, Any]]) -> None:
+    """Replace PAGES in place, so every module holding it sees the new specs,
+    and drop what was derived from the old ones.
+
+    Call it on the GUI thread.  Worker checks are handed a copy of the page
+    list (see ``MagnusClientIntakeForm._start_form_check``) and never index
+    PAGES while it is swapped.
+    """
+    PAGES[:] = pages
+    clear_cache()
+    affected_pages.cache_clear()
+
+
+def spec_dir_from_env() -> Optional[Path]:
+    env = os.getenv(SPEC_DIR_ENV)
+    return Path(env).expanduser() if env else None
+
+
+def dev_mode() -> bool:
+    return os.getenv(SPEC_DEV_ENV, "") not in ("", "0")
+
+
+# ------------------------------------------------------------------- CLI --
+def export_pages(out_dir: Path) -> List[Path]:
+    """Write the current PAGES as one numbered JSON file per page."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for i, page in enumerate(PAGES, 1):
+        path = out_dir / f"{i:02d}_{page['key']}.json"
+        path.write_text(json.dumps(page, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        written.append(path)
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m magnus_app.spec_loader", description="Check or export page specs."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("check", help="validate the spec files in a directory").add_argument("dir", type=Path)
+    sub.add_parser("export", help="write the built-in pages as JSON files").add_argument("dir", type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        for path in export_pages(args.dir):
+            print(path)
+        return 0
+    for name, err in load_plugins().items():  # their names are valid in specs
+        if err is not None:
+            print(f"warning: validator plugin {name} failed to load: {err}", file=sys.stderr)
+    try:
+        pages, _ = load_pages(args.dir, use_cache=False)
+    except (SpecError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(f"{len(pages)} pages OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap
+from PyQt6.QtWidgets import QApplication, QSplashScreen
+
+
+class BootSplash(QSplashScreen):
+    """Splash shown while the first page is prepared.
+
+    Drawn in code so it needs no image file inside the one-file bundle.
+    """
+
+    def __init__(self) -> None:
+        pix = QPixmap(460, 220)
+        pix.fill(QColor("#1677ff"))
+        painter = QPainter(pix)
+        painter.setPen(QColor("#ffffff"))
+        font = QFont("Segoe UI", 20)
+        font.setWeight(QFont.Weight.DemiBold)
+        painter.setFont(font)
+        painter.drawText(
+            pix.rect().adjusted(24, 0, -24, -40),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            "Magnus Client Intake",
+        )
+        painter.end()
+        super().__init__(pix)
+
+    def step(self, message: str) -> None:
+        self.showMessage(
+            message,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+            QColor("#eff2f6"),
+        )
+        # Paint now; the event loop is not running yet during boot
+        QApplication.processEvents()
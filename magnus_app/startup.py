@@ -0,0 +1,176 @@
+"""Startup phase profiler.
+
+Boot phases are always recorded with monotonic offsets (they are a handful
+of ``perf_counter`` reads) so ``[BOOT]`` lines in the crash log carry
+timings.  Running with ``--profile-startup`` (or ``MAGNUS_PROFILE_STARTUP=1``)
+additionally times every import that loads new modules, importtime-style,
+and writes a ``startup-profile-*.txt`` report to the log folder once the
+window is up.
+
+This module must stay free of third-party imports: ``app.py`` loads it
+before PyQt6 so the import timings include Qt itself.
+"""
+from __future__ import annotations
+
+import builtins
+import datetime
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_T0 = time.perf_counter()
+FLAG = "--profile-startup"
+
+_phases: List[Tuple[str, float]] = []
+
+
+def requested() -> bool:
+    return FLAG in sys.argv or os.getenv("MAGNUS_PROFILE_STARTUP", "") not in ("", "0")
+
+
+def elapsed_ms() -> float:
+    return (time.perf_counter() - _T0) * 1000.0
+
+
+def mark(phase: str) -> float:
+    """Record ``phase`` as reached now; returns ms since the package was imported."""
+    at = elapsed_ms()
+    _phases.append((phase, at))
+    return at
+
+
+def phases() -> List[Tuple[str, float]]:
+    return list(_phases)
+
+
+# ------------------------------------------------------------- IMPORTS --
+class _ImportProfiler:
+    """Wrap ``builtins.__import__`` and time calls that load new modules.
+
+    Self time excludes nested imports, like ``python -X importtime``, which
+    cannot be switched on from inside a frozen executable.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[Tuple[str, float, float, int, str]] = []
+        self._orig = None
+        self._local = threading.local()
+
+    def install(self) -> None:
+        if self._orig is None:
+            self._orig = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self._orig is not None:
+            builtins.__import__ = self._orig
+            self._orig = None
+
+    @staticmethod
+    def _resolve(name: str, globals_: Optional[dict], level: int) -> str:
+        if not level or not globals_:
+            return name
+        package = globals_.get("__package__") or globals_.get("__name__", "")
+        parts = package.rsplit(".", level - 1) if level > 1 else [package]
+        base = parts[0]
+        return f"{base}.{name}" if name else base
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        before = len(sys.modules)
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._orig(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += total
+            if len(sys.modules) != before:
+                label = self._resolve(name, globals, level)
+                if fromlist and not name:
+                    label = f"{label} ({', '.join(fromlist)})"
+                self.records.append(
+                    (
+                        label,
+                        (total - nested) * 1000.0,
+                        total * 1000.0,
+                        len(stack),
+                        threading.current_thread().name,
+                    )
+                )
+
+
+_profiler: Optional[_ImportProfiler] = None
+
+
+def install_import_profiler() -> None:
+    global _profiler
+    if _profiler is None:
+        _profiler = _ImportProfiler()
+        _profiler.install()
+
+
+def is_profiling() -> bool:
+    return _profiler is not None
+
+
+# -------------------------------------------------------------- REPORT --
+def _root(label: str) -> str:
+    return label.split(" ", 1)[0].split(".", 1)[0]
+
+
+def report(top: int = 25) -> str:
+    lines = [
+        f"Magnus startup profile  {datetime.datetime.now().isoformat(timespec='seconds')}",
+        f"Frozen: {getattr(sys, 'frozen', False)}",
+        "",
+        "Boot phases (ms since package import)",
+        f"{'at':>10}  {'delta':>10}  phase",
+    ]
+    prev = 0.0
+    for phase, at in _phases:
+        lines.append(f"{at:10.1f}  {at - prev:10.1f}  {phase}")
+        prev = at
+
+    records = list(_profiler.records) if _profiler else []
+    if records:
+        by_root: Dict[str, float] = {}
+        for label, self_ms, _cum, _depth, _thread in records:
+            by_root[_root(label)] = by_root.get(_root(label), 0.0) + self_ms
+        lines += ["", "Top packages by import self time", f"{'self ms':>10}  package"]
+        for root, ms in sorted(by_root.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+            lines.append(f"{ms:10.1f}  {root}")
+
+        lines += [
+            "",
+            f"Top {top} imports by self time",
+            f"{'self ms':>10}  {'cumul ms':>10}  thread / import",
+        ]
+        for label, self_ms, cum, depth, thread in sorted(
+            records, key=lambda r: r[1], reverse=True
+        )[:top]:
+            lines.append(f"{self_ms:10.1f}  {cum:10.1f}  [{thread}] {'  ' * depth}{label}")
+    elif not is_profiling():
+        lines += ["", f"Import timings not collected (run with {FLAG})."]
+    return "\n".join(lines) + "\n"
+
+
+def write_report(log_dir: Path) -> Optional[Path]:
+    """Write the report to ``log_dir`` and stop timing imports."""
+    text = report()
+    if _profiler is not None:
+        _profiler.uninstall()
+    ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = Path(log_dir) / f"startup-profile-{ts}.txt"
+    try:
+        path.write_text(text, encoding="utf-8")
+    except Exception:
+        return None
+    return path
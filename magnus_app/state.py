@@ -1,11 +1,110 @@
 import json
 import os
-from typing import Any, Dict
+from collections.abc import Mapping
+from typing import Any, Dict, Hashable, Optional
 
 from magnus_app.pages import PAGES
+from magnus_app.perf import timed
+from magnus_app.validation import pct_0_100_two_dec
 
 STATE_FILE = "state.json"
 
+
+class FieldRef:
+    """A field yielded by ``PageRenderer.iterate_fields``.
+
+    ``spec`` is the PAGES field itself, never a copy; inside a repeating
+    group ``group`` and ``index`` name the item.  The renderer creates one
+    per (field, item) and hands the same objects out on every pass.  Spec
+    keys read through ``get``/``[]``/``in`` like the spec dict.
+    """
+
+    __slots__ = ("spec", "group", "index")
+
+    def __init__(self, spec: Dict[str, Any], group: Optional[str] = None, index: Optional[int] = None):
+        self.spec = spec
+        self.group = group
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self.spec.get("name")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.spec.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.spec[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.spec
+
+    def value(self, data: Mapping[str, Any]) -> Any:
+        """The field's value in ``data``; "" when unset or the item is gone."""
+        if self.group is None:
+            return data.get(self.spec.get("name"), "")
+        items = data.get(self.group, [])
+        if isinstance(items, list) and self.index < len(items):
+            return items[self.index].get(self.spec.get("name"), "")
+        return ""
+
+    def __repr__(self) -> str:
+        where = f", {self.group!r}[{self.index}]" if self.group is not None else ""
+        return f"FieldRef({self.name!r}{where})"
+
+
+class RunningTotal:
+    """Sum of one numeric subfield across a repeating group's items.
+
+    Each item's part is replaced or dropped as it changes, so the total is
+    kept in O(1) per edit instead of rescanning every item.  Parts are held
+    in hundredths so adding and removing never drifts.  Values that are not
+    a valid percentage are left out, as the whole-form check leaves them out.
+    """
+
+    __slots__ = ("target", "_parts", "_hundredths")
+
+    def __init__(self, target: float):
+        self.target = target
+        self._parts: Dict[Hashable, int] = {}
+        self._hundredths = 0
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if value in ("", None) or not pct_0_100_two_dec(str(value)):
+            self.discard(key)  # reported by the field's own check
+            return
+        part = int(round(float(value) * 100))
+        self._hundredths += part - self._parts.get(key, 0)
+        self._parts[key] = part
+
+    def discard(self, key: Hashable) -> None:
+        self._hundredths -= self._parts.pop(key, 0)
+
+    @property
+    def total(self) -> float:
+        return self._hundredths / 100
+
+    @property
+    def complete(self) -> bool:
+        return self._hundredths == round(self.target * 100)
+
+    def __len__(self) -> int:
+        """Number of items contributing a value."""
+        return len(self._parts)
+
+
+def default_value(fld: Mapping[str, Any]) -> Any:
+    """What a new draft holds for a value field."""
+    ftype = fld.get("type")
+    if ftype == "repeating_group":
+        return []
+    if ftype == "radio":
+        return "No"
+    if ftype == "checkbox":
+        return False
+    return ""
+
+
 def build_default_state() -> Dict[str, Any]:
     state: Dict[str, Any] = {}
 
@@ -15,18 +114,9 @@ def build_default_state() -> Dict[str, Any]:
             if ftype == "group":
                 walk(fld.get("fields", []))
                 continue
-            if ftype == "repeating_group":
-                state[fld.get("name")] = []
-                continue
             if ftype == "label":
                 continue
-            name = fld.get("name")
-            if ftype == "radio":
-                state[name] = "No"
-            elif ftype == "checkbox":
-                state[name] = False
-            else:
-                state[name] = ""
+            state[fld.get("name")] = default_value(fld)
 
     for page in PAGES:
         for section in page.get("sections", []):
@@ -59,6 +149,7 @@ def load_state(path: str) -> Dict[str, Any]:
         pass
     return migrate_state(state)
 
+@timed("save_state")
 def save_state(path: str, state: Dict[str, Any]) -> None:
     try:
         with open(path, "w", encoding="utf-8") as fh:
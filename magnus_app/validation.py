@@ -4,27 +4,242 @@ Enhanced Validation Module for Magnus Client Intake Form
 Provides comprehensive validation with real-time feedback
 """
 
+import importlib
+import os
 import re
-from typing import Dict, List, Any, Tuple, Optional, Callable
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Mapping, Tuple, Optional, Callable, Union
 from datetime import datetime, date
 
+from magnus_app.perf import register_stats
 
-# Standalone validators for the dynamic form system
 
+# Compiled once; unanchored so they work with fullmatch() here and can be
+# wrapped for whole-column scans in batch_validation.
+TICKER_RE = re.compile(r"[A-Z.]{1,5}")
+PCT_RE = re.compile(r"\d{1,3}(?:\.\d{1,2})?")
+CRD_RE = re.compile(r"\d{4,8}")
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+NON_DIGIT_RE = re.compile(r"[^\d]")
+INVALID_SSNS = frozenset({
+    '000000000', '111111111', '222222222', '333333333',
+    '444444444', '555555555', '666666666', '777777777',
+    '888888888', '999999999', '123456789'
+})
+
+
+class _ResultCache:
+    """Bounded LRU of validator outcomes.
+
+    Keyed by (validator name, value) plus, for cross-field validators, the
+    values of their declared deps, so an unchanged field on a page costs a
+    dict lookup instead of a regex or date parse.  Shared with the worker
+    thread that runs the Review check, hence the lock.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[tuple, bool]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[bool]:
+        with self._lock:
+            ok = self._data.get(key)
+            if ok is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return ok
+
+    def put(self, key: tuple, ok: bool) -> None:
+        with self._lock:
+            self._data[key] = ok
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit rate %": 100.0 * self.hits / calls if calls else 0.0,
+            "entries": len(self._data),
+        }
+
+
+RESULT_CACHE = _ResultCache()
+register_stats("Validator cache", RESULT_CACHE.stats)
+
+# Value types that can be part of a cache key
+_KEYABLE = (str, int, float, bool, type(None))
+
+
+# Standalone validators for the dynamic form system.
+#
+# Each one is registered under the name PAGES uses in a field's "validate"
+# key.  Cross-field validators declare the other fields they read as
+# ``deps`` and are called as ``func(value, data)``; all others are called as
+# ``func(value)``.  Dispatch is decided once, at registration.
+
+class Validator:
+    """A registered spec validator; call as ``validator(value, data)``."""
+
+    __slots__ = ("name", "func", "deps", "message", "background")
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., bool],
+        deps: Tuple[str, ...] = (),
+        message: str = "",
+        background: bool = False,
+    ):
+        self.name = name
+        self.func = func
+        self.deps = deps
+        self.message = message or f"Failed the '{name}' check"
+        # Too slow for the GUI thread (file or dataset lookups); the window
+        # runs these through AsyncChecks instead of calling them inline
+        self.background = background
+
+    @property
+    def arity(self) -> int:
+        return 2 if self.deps else 1
+
+    def __call__(self, value: Any, data: Optional[Mapping[str, Any]] = None) -> bool:
+        if self.deps:
+            if data is None:
+                data = {}
+            key = (self.name, value, *(data.get(dep) for dep in self.deps))
+        else:
+            key = (self.name, value)
+        if not all(isinstance(part, _KEYABLE) for part in key):
+            return self._run(value, data)
+        ok = RESULT_CACHE.get(key)
+        if ok is None:
+            ok = self._run(value, data)
+            RESULT_CACHE.put(key, ok)
+        return ok
+
+    def _run(self, value: Any, data: Optional[Mapping[str, Any]]) -> bool:
+        if self.deps:
+            return bool(self.func(value, data))
+        return bool(self.func(value))
+
+    def __repr__(self) -> str:
+        return f"Validator({self.name!r}, deps={self.deps!r})"
+
+
+# Exported validator registry
+VALIDATORS: Dict[str, Validator] = {}
+
+
+def register(
+    name: str, deps: Tuple[str, ...] = (), message: str = "", background: bool = False
+) -> Callable[[Callable[..., bool]], Callable[..., bool]]:
+    """Decorator adding ``func`` to VALIDATORS under ``name``.
+
+    ``message`` is what the user is told when a value fails.  Pass
+    ``background=True`` for checks that may block (I/O, large lookups).
+    """
+
+    def deco(func: Callable[..., bool]) -> Callable[..., bool]:
+        if name in VALIDATORS:
+            raise ValueError(f"Validator {name!r} is already registered")
+        VALIDATORS[name] = Validator(name, func, tuple(deps), message, background)
+        return func
+
+    return deco
+
+
+def field_validators(field: Mapping[str, Any]) -> List[Validator]:
+    """Registered validators named by a spec field.
+
+    ``validate`` holds the synchronous format check and ``validate_async``
+    an optional background one; names nobody registered are ignored, so a
+    spec can mention a plugin check that is not installed.
+    """
+    out = []
+    for key in ("validate", "validate_async"):
+        validator = VALIDATORS.get(field.get(key) or "")
+        if validator is not None:
+            out.append(validator)
+    return out
+
+
+PLUGINS_ENV = "MAGNUS_VALIDATOR_PLUGINS"
+
+
+def load_plugins(spec: Optional[str] = None) -> Dict[str, Optional[BaseException]]:
+    """Import the comma-separated modules in ``MAGNUS_VALIDATOR_PLUGINS``.
+
+    Plugin modules register their validators with ``@register`` on import.
+    Returns each module name with the error it raised, or None.
+    """
+    if spec is None:
+        spec = os.getenv(PLUGINS_ENV, "")
+    loaded: Dict[str, Optional[BaseException]] = {}
+    for name in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            importlib.import_module(name)
+            loaded[name] = None
+        except Exception as e:
+            loaded[name] = e
+    return loaded
+
+
+def parse_iso_date(value: Any) -> Optional[date]:
+    """Parse YYYY-MM-DD into a date, or None if it is not one.
+
+    The form's date widgets always produce the fixed-width shape, so that is
+    read by slicing; anything else (e.g. "2024-1-5") goes through strptime
+    so the accepted inputs are unchanged.  Parses are cached because the
+    same handful of dates is re-checked on every keystroke.
+    """
+    if not isinstance(value, str):
+        return None
+    return _parse_iso_date(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(value: str) -> Optional[date]:
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        y, m, d = value[:4], value[5:7], value[8:]
+        if y.isdigit() and m.isdigit() and d.isdigit():
+            try:
+                return date(int(y), int(m), int(d))
+            except ValueError:
+                return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+@register("iso_date", message="Please enter a valid date (YYYY-MM-DD)")
 def iso_date(value: str) -> bool:
     """Validate an ISO formatted date (YYYY-MM-DD)."""
-    try:
-        datetime.strptime(value, "%Y-%m-%d")
-        return True
-    except Exception:
-        return False
+    return parse_iso_date(value) is not None
 
 
+@register("ticker", message="Ticker must be 1-5 capital letters or periods")
 def ticker(value: str) -> bool:
     """Validate stock ticker symbols (1-5 uppercase letters or periods)."""
-    return bool(re.fullmatch(r"^[A-Z\.]{1,5}$", value or ""))
+    return TICKER_RE.fullmatch(value or "") is not None
 
 
+@register("pct_0_100_two_dec", message="Percentage must be 0-100 with at most two decimals")
 def pct_0_100_two_dec(value: str) -> bool:
     """Validate percentage 0-100 inclusive with up to two decimals."""
     try:
@@ -34,539 +249,497 @@ def pct_0_100_two_dec(value: str) -> bool:
     if num < 0 or num > 100:
         return False
     # Ensure at most two decimal places
-    return re.fullmatch(r"^\d{1,3}(?:\.\d{1,2})?$", value or "") is not None
+    return PCT_RE.fullmatch(value or "") is not None
 
 
+@register("crd", message="CRD must be 4-8 digits")
 def crd(value: str) -> bool:
     """Validate CRD number: digits only, length 4-8."""
-    return bool(re.fullmatch(r"^\d{4,8}$", value or ""))
+    return CRD_RE.fullmatch(value or "") is not None
 
 
 def iso_date_gte(date_a: str, date_b: str) -> bool:
     """Return True if ISO date_a >= ISO date_b."""
-    try:
-        a = datetime.strptime(date_a, "%Y-%m-%d")
-        b = datetime.strptime(date_b, "%Y-%m-%d")
-    except Exception:
-        return False
-    return a >= b
+    a = parse_iso_date(date_a)
+    b = parse_iso_date(date_b)
+    return a is not None and b is not None and a >= b
 
 
-def iso_date_gte_pep_start(value: str, data: Dict[str, Any]) -> bool:
+@register(
+    "iso_date>=pep_start",
+    deps=("pep_start",),
+    message="End date must be a valid date on or after the start date",
+)
+def iso_date_gte_pep_start(value: str, data: Mapping[str, Any]) -> bool:
     """Validate that value is an ISO date >= pep_start in data."""
     start = data.get("pep_start")
-    if not start or not iso_date(value) or not iso_date(start):
-        return False
-    return iso_date_gte(value, start)
-
+    # both parses come from the cache once either field has been checked
+    return bool(start) and iso_date_gte(value, start)
 
-# Exported validator registry
-VALIDATORS: Dict[str, Callable[..., bool]] = {
-    "iso_date": iso_date,
-    "ticker": ticker,
-    "pct_0_100_two_dec": pct_0_100_two_dec,
-    "crd": crd,
-    "iso_date>=pep_start": iso_date_gte_pep_start,
-}
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
 
-class FormValidator:
-    """Comprehensive form validation class"""
-    
-    def __init__(self):
-        self.errors = {}
-        self.warnings = {}
-    
-    def clear_errors(self):
-        """Clear all validation errors and warnings"""
-        self.errors.clear()
-        self.warnings.clear()
-    
-    def add_error(self, field: str, message: str):
-        """Add a validation error for a specific field"""
-        if field not in self.errors:
-            self.errors[field] = []
-        self.errors[field].append(message)
-    
-    def add_warning(self, field: str, message: str):
-        """Add a validation warning for a specific field"""
-        if field not in self.warnings:
-            self.warnings[field] = []
-        self.warnings[field].append(message)
-    
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """Outcome of a single field check; truthy when the value passed."""
+
+    field: str
+    errors: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
+def _passed(field: str) -> ValidationResult:
+    return ValidationResult(field)
+
+
+def _failed(field: str, message: str) -> ValidationResult:
+    return ValidationResult(field, errors=(message,))
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    """Findings of a section or whole-form check; truthy when error-free.
+
+    Only results carrying errors or warnings are kept.
+    """
+
+    results: Tuple[ValidationResult, ...] = ()
+
+    @classmethod
+    def collect(cls, *items: Union[ValidationResult, "ValidationReport"]) -> "ValidationReport":
+        found: List[ValidationResult] = []
+        for item in items:
+            if isinstance(item, ValidationReport):
+                found.extend(item.results)
+            elif item.errors or item.warnings:
+                found.append(item)
+        return cls(tuple(found))
+
+    @property
+    def ok(self) -> bool:
+        return not self.has_errors()
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    @property
+    def errors(self) -> Dict[str, List[str]]:
+        out: Dict[str, List[str]] = {}
+        for r in self.results:
+            if r.errors:
+                out.setdefault(r.field, []).extend(r.errors)
+        return out
+
+    @property
+    def warnings(self) -> Dict[str, List[str]]:
+        out: Dict[str, List[str]] = {}
+        for r in self.results:
+            if r.warnings:
+                out.setdefault(r.field, []).extend(r.warnings)
+        return out
+
     def has_errors(self) -> bool:
         """Check if there are any validation errors"""
-        return len(self.errors) > 0
-    
+        return any(r.errors for r in self.results)
+
     def has_warnings(self) -> bool:
         """Check if there are any validation warnings"""
-        return len(self.warnings) > 0
-    
+        return any(r.warnings for r in self.results)
+
     def get_error_summary(self) -> str:
         """Get a formatted summary of all errors"""
         if not self.has_errors():
             return ""
-        
+
         summary = "Please correct the following errors:\n\n"
         for field, messages in self.errors.items():
             summary += f"• {field}: {', '.join(messages)}\n"
         return summary
-    
+
     def get_warning_summary(self) -> str:
         """Get a formatted summary of all warnings"""
         if not self.has_warnings():
             return ""
-        
+
         summary = "Please review the following warnings:\n\n"
         for field, messages in self.warnings.items():
             summary += f"• {field}: {', '.join(messages)}\n"
         return summary
-    
+
+
+class FormValidator:
+    """Comprehensive form validation class.
+
+    Stateless: field checks return a ``ValidationResult`` and section
+    checks a ``ValidationReport``, so one instance can be shared freely,
+    including across worker threads.
+    """
+
     # Field-specific validation methods
-    
-    def validate_required_field(self, field_name: str, value: str) -> bool:
+
+    def validate_required_field(self, field_name: str, value: str) -> ValidationResult:
         """Validate that a required field is not empty"""
         if not value or value.strip() == "":
-            self.add_error(field_name, "This field is required")
-            return False
-        return True
-    
-    def validate_email(self, field_name: str, email: str) -> bool:
+            return _failed(field_name, "This field is required")
+        return _passed(field_name)
+
+    def validate_email(self, field_name: str, email: str) -> ValidationResult:
         """Validate email format"""
         if not email:
-            return True  # Allow empty emails unless required
-        
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
-            self.add_error(field_name, "Please enter a valid email address")
-            return False
-        return True
-    
-    def validate_ssn(self, field_name: str, ssn: str) -> bool:
+            return _passed(field_name)  # Allow empty emails unless required
+
+        if not EMAIL_RE.fullmatch(email):
+            return _failed(field_name, "Please enter a valid email address")
+        return _passed(field_name)
+
+    def validate_ssn(self, field_name: str, ssn: str) -> ValidationResult:
         """Validate Social Security Number format"""
         if not ssn:
-            return True  # Allow empty unless required
-        
+            return _passed(field_name)  # Allow empty unless required
+
         # Remove any formatting
-        clean_ssn = re.sub(r'[^\d]', '', ssn)
-        
+        clean_ssn = NON_DIGIT_RE.sub('', ssn)
+
         if len(clean_ssn) != 9:
-            self.add_error(field_name, "SSN must be 9 digits")
-            return False
-        
+            return _failed(field_name, "SSN must be 9 digits")
+
         # Check for invalid patterns
-        invalid_patterns = [
-            '000000000', '111111111', '222222222', '333333333',
-            '444444444', '555555555', '666666666', '777777777',
-            '888888888', '999999999', '123456789'
-        ]
-        
-        if clean_ssn in invalid_patterns:
-            self.add_error(field_name, "Please enter a valid SSN")
-            return False
-        
-        return True
-    
-    def validate_phone(self, field_name: str, phone: str) -> bool:
+        if clean_ssn in INVALID_SSNS:
+            return _failed(field_name, "Please enter a valid SSN")
+
+        return _passed(field_name)
+
+    def validate_phone(self, field_name: str, phone: str) -> ValidationResult:
         """Validate phone number format"""
         if not phone:
-            return True  # Allow empty unless required
-        
+            return _passed(field_name)  # Allow empty unless required
+
         # Remove formatting
-        clean_phone = re.sub(r'[^\d]', '', phone)
-        
+        clean_phone = NON_DIGIT_RE.sub('', phone)
+
         if len(clean_phone) != 10:
-            self.add_error(field_name, "Phone number must be 10 digits")
-            return False
-        
-        return True
-    
-    def validate_date(self, field_name: str, date_str: str, min_age: int = None, max_age: int = None) -> bool:
+            return _failed(field_name, "Phone number must be 10 digits")
+
+        return _passed(field_name)
+
+    def validate_date(self, field_name: str, date_str: str, min_age: int = None, max_age: int = None) -> ValidationResult:
         """Validate date and optionally check age constraints"""
         if not date_str:
-            return True  # Allow empty unless required
-        
+            return _passed(field_name)  # Allow empty unless required
+
         try:
             # Parse date (assuming MM/dd/yyyy format)
             date_obj = datetime.strptime(date_str, "%m/%d/%Y").date()
-            
-            # Check if date is in the future
-            if date_obj > date.today():
-                self.add_error(field_name, "Date cannot be in the future")
-                return False
-            
-            # Check age constraints if provided
-            if min_age or max_age:
-                today = date.today()
-                age = today.year - date_obj.year - ((today.month, today.day) < (date_obj.month, date_obj.day))
-                
-                if min_age and age < min_age:
-                    self.add_error(field_name, f"Age must be at least {min_age} years")
-                    return False
-                
-                if max_age and age > max_age:
-                    self.add_error(field_name, f"Age cannot exceed {max_age} years")
-                    return False
-            
-            return True
-            
         except ValueError:
-            self.add_error(field_name, "Please enter a valid date (MM/DD/YYYY)")
-            return False
-    
-    def validate_percentage_total(self, field_name: str, percentages: List[float], expected_total: float = 100.0) -> bool:
+            return _failed(field_name, "Please enter a valid date (MM/DD/YYYY)")
+
+        # Check if date is in the future
+        if date_obj > date.today():
+            return _failed(field_name, "Date cannot be in the future")
+
+        # Check age constraints if provided
+        if min_age or max_age:
+            today = date.today()
+            age = today.year - date_obj.year - ((today.month, today.day) < (date_obj.month, date_obj.day))
+
+            if min_age and age < min_age:
+                return _failed(field_name, f"Age must be at least {min_age} years")
+
+            if max_age and age > max_age:
+                return _failed(field_name, f"Age cannot exceed {max_age} years")
+
+        return _passed(field_name)
+
+    def validate_percentage_total(self, field_name: str, percentages: List[float], expected_total: float = 100.0) -> ValidationResult:
         """Validate that percentages add up to expected total"""
         total = sum(percentages)
-        
+
         if abs(total - expected_total) > 0.01:  # Allow small floating point differences
-            self.add_error(field_name, f"Percentages must total {expected_total}% (currently {total}%)")
-            return False
-        
-        return True
-    
-    def validate_numeric_range(self, field_name: str, value: float, min_val: float = None, max_val: float = None) -> bool:
+            return _failed(field_name, f"Percentages must total {expected_total}% (currently {total}%)")
+
+        return _passed(field_name)
+
+    def validate_numeric_range(self, field_name: str, value: float, min_val: float = None, max_val: float = None) -> ValidationResult:
         """Validate numeric value is within specified range"""
         if min_val is not None and value < min_val:
-            self.add_error(field_name, f"Value must be at least {min_val}")
-            return False
-        
+            return _failed(field_name, f"Value must be at least {min_val}")
+
         if max_val is not None and value > max_val:
-            self.add_error(field_name, f"Value cannot exceed {max_val}")
-            return False
-        
-        return True
-    
-    def validate_personal_info(self, data: Dict) -> bool:
+            return _failed(field_name, f"Value cannot exceed {max_val}")
+
+        return _passed(field_name)
+
+    def validate_personal_info(self, data: Dict) -> ValidationReport:
         """Validate personal information section"""
-        valid = True
-        
-        # Required fields
-        if not self.validate_required_field("Full Name", data.get("full_name", "")):
-            valid = False
-        
-        if not self.validate_required_field("Date of Birth", data.get("dob", "")):
-            valid = False
-        else:
+        results = [self.validate_required_field("Full Name", data.get("full_name", ""))]
+
+        dob = self.validate_required_field("Date of Birth", data.get("dob", ""))
+        results.append(dob)
+        if dob:
             # Validate age (must be at least 18, not more than 120)
-            if not self.validate_date("Date of Birth", data.get("dob", ""), min_age=18, max_age=120):
-                valid = False
-        
-        if not self.validate_required_field("Citizenship", data.get("citizenship", "")):
-            valid = False
-        
+            results.append(self.validate_date("Date of Birth", data.get("dob", ""), min_age=18, max_age=120))
+
+        results.append(self.validate_required_field("Citizenship", data.get("citizenship", "")))
+
         # SSN validation
-        if not self.validate_ssn("Social Security Number", data.get("ssn", "")):
-            valid = False
-        
-        return valid
-    
-    def validate_contact_info(self, data: Dict) -> bool:
+        results.append(self.validate_ssn("Social Security Number", data.get("ssn", "")))
+
+        return ValidationReport.collect(*results)
+
+    def validate_contact_info(self, data: Dict) -> ValidationReport:
         """Validate contact information section"""
-        valid = True
-        
-        # Required fields
-        if not self.validate_required_field("Residential Address", data.get("residential_address", "")):
-            valid = False
-        
-        # Email validation
-        if not self.validate_email("Email Address", data.get("email", "")):
-            valid = False
-        
+        results = [
+            # Required fields
+            self.validate_required_field("Residential Address", data.get("residential_address", "")),
+            # Email validation
+            self.validate_email("Email Address", data.get("email", "")),
+        ]
+
         # Phone validation (at least one phone number required)
         home_phone = data.get("home_phone", "")
         work_phone = data.get("work_phone", "")
         mobile_phone = data.get("mobile_phone", "")
-        
+
         if not home_phone and not work_phone and not mobile_phone:
-            self.add_error("Phone Numbers", "At least one phone number is required")
-            valid = False
+            results.append(_failed("Phone Numbers", "At least one phone number is required"))
         else:
             # Validate individual phone numbers
-            if home_phone and not self.validate_phone("Home Phone", home_phone):
-                valid = False
-            if work_phone and not self.validate_phone("Work Phone", work_phone):
-                valid = False
-            if mobile_phone and not self.validate_phone("Mobile Phone", mobile_phone):
-                valid = False
-        
-        return valid
-    
-    def validate_employment_info(self, data: Dict) -> bool:
+            if home_phone:
+                results.append(self.validate_phone("Home Phone", home_phone))
+            if work_phone:
+                results.append(self.validate_phone("Work Phone", work_phone))
+            if mobile_phone:
+                results.append(self.validate_phone("Mobile Phone", mobile_phone))
+
+        return ValidationReport.collect(*results)
+
+    def validate_employment_info(self, data: Dict) -> ValidationReport:
         """Validate employment information section"""
-        valid = True
-        
+        results = []
+
         employment_status = data.get("employment_status", "")
-        
+
         # If employed, require employer information
         if employment_status in ["Employed", "Self-Employed"]:
-            if not self.validate_required_field("Employer Name", data.get("employer_name", "")):
-                valid = False
-            if not self.validate_required_field("Occupation/Title", data.get("occupation", "")):
-                valid = False
-        
+            results.append(self.validate_required_field("Employer Name", data.get("employer_name", "")))
+            results.append(self.validate_required_field("Occupation/Title", data.get("occupation", "")))
+
         # Validate years employed
         years_employed = data.get("years_employed", 0)
-        if not self.validate_numeric_range("Years Employed", years_employed, min_val=0, max_val=70):
-            valid = False
-        
-        return valid
-    
-    def validate_beneficiaries(self, beneficiaries: List[Dict]) -> bool:
+        results.append(self.validate_numeric_range("Years Employed", years_employed, min_val=0, max_val=70))
+
+        return ValidationReport.collect(*results)
+
+    def validate_beneficiaries(self, beneficiaries: List[Dict]) -> ValidationReport:
         """Validate beneficiaries information"""
-        valid = True
-        
         if not beneficiaries:
-            self.add_warning("Beneficiaries", "No beneficiaries specified")
-            return True
-        
+            return ValidationReport.collect(
+                ValidationResult("Beneficiaries", warnings=("No beneficiaries specified",))
+            )
+
         # Validate individual beneficiaries
+        results = []
         total_percentage = 0
         for i, beneficiary in enumerate(beneficiaries):
             field_prefix = f"Beneficiary {i+1}"
-            
-            if not self.validate_required_field(f"{field_prefix} Name", beneficiary.get("name", "")):
-                valid = False
-            
-            if not self.validate_required_field(f"{field_prefix} Relationship", beneficiary.get("relationship", "")):
-                valid = False
-            
+
+            results.append(self.validate_required_field(f"{field_prefix} Name", beneficiary.get("name", "")))
+            results.append(self.validate_required_field(f"{field_prefix} Relationship", beneficiary.get("relationship", "")))
+
             percentage = beneficiary.get("percentage", 0)
-            if not self.validate_numeric_range(f"{field_prefix} Percentage", percentage, min_val=0, max_val=100):
-                valid = False
-            
+            results.append(self.validate_numeric_range(f"{field_prefix} Percentage", percentage, min_val=0, max_val=100))
+
             total_percentage += percentage
-        
+
         # Validate total percentage
-        if not self.validate_percentage_total("Beneficiaries Total", [total_percentage]):
-            valid = False
-        
-        return valid
-    
-    def validate_assets(self, data: Dict) -> bool:
+        results.append(self.validate_percentage_total("Beneficiaries Total", [total_percentage]))
+
+        return ValidationReport.collect(*results)
+
+    def validate_assets(self, data: Dict) -> ValidationReport:
         """Validate assets and investment information"""
-        valid = True
-        
+        results = []
+
         # Validate numeric fields
         net_worth = data.get("net_worth", "")
         if net_worth and not net_worth.replace(",", "").replace(".", "").isdigit():
-            self.add_error("Net Worth", "Please enter a valid numeric value")
-            valid = False
-        
+            results.append(_failed("Net Worth", "Please enter a valid numeric value"))
+
         liquid_net_worth = data.get("liquid_net_worth", "")
         if liquid_net_worth and not liquid_net_worth.replace(",", "").replace(".", "").isdigit():
-            self.add_error("Liquid Net Worth", "Please enter a valid numeric value")
-            valid = False
-        
+            results.append(_failed("Liquid Net Worth", "Please enter a valid numeric value"))
+
         # Validate asset breakdown if included
         if data.get("include_breakdown", False):
             breakdown = data.get("asset_breakdown", {})
             if breakdown:
                 percentages = [v for v in breakdown.values() if isinstance(v, (int, float))]
-                if not self.validate_percentage_total("Asset Breakdown", percentages):
-                    valid = False
-        
-        return valid
+                results.append(self.validate_percentage_total("Asset Breakdown", percentages))
+
+        return ValidationReport.collect(*results)
 
-    def validate_annual_income(self, field_name: str, income: str) -> bool:
+    def validate_annual_income(self, field_name: str, income: str) -> ValidationResult:
         """Validate annual income format and range"""
         if not income:
-            return True  # Allow empty unless required
-        
+            return _passed(field_name)  # Allow empty unless required
+
         # Remove formatting (commas, dollar signs)
         clean_income = re.sub(r'[^\d.]', '', income)
-        
+
         try:
             income_value = float(clean_income)
-            if income_value < 0:
-                self.add_error(field_name, "Annual income cannot be negative")
-                return False
-            if income_value > 100000000:  # 100 million cap for reasonableness
-                self.add_error(field_name, "Annual income seems unreasonably high")
-                return False
-            return True
         except ValueError:
-            self.add_error(field_name, "Please enter a valid annual income amount")
-            return False
-    
-    def validate_tax_bracket(self, field_name: str, bracket: str) -> bool:
+            return _failed(field_name, "Please enter a valid annual income amount")
+        if income_value < 0:
+            return _failed(field_name, "Annual income cannot be negative")
+        if income_value > 100000000:  # 100 million cap for reasonableness
+            return _failed(field_name, "Annual income seems unreasonably high")
+        return _passed(field_name)
+
+    def validate_tax_bracket(self, field_name: str, bracket: str) -> ValidationResult:
         """Validate US tax bracket selection"""
         if not bracket:
-            return True  # Allow empty unless required
-        
+            return _passed(field_name)  # Allow empty unless required
+
         valid_brackets = [
-            "0-15%", "15%-32%", "32%+", 
+            "0-15%", "15%-32%", "32%+",
             "Not sure", "Prefer not to answer"
         ]
-        
+
         if bracket not in valid_brackets:
-            self.add_error(field_name, "Please select a valid tax bracket")
-            return False
-        
-        return True
-    
-    def validate_education_status(self, field_name: str, education: str) -> bool:
+            return _failed(field_name, "Please select a valid tax bracket")
+
+        return _passed(field_name)
+
+    def validate_education_status(self, field_name: str, education: str) -> ValidationResult:
         """Validate education status selection"""
         if not education:
-            return True  # Allow empty unless required
-        
+            return _passed(field_name)  # Allow empty unless required
+
         valid_education = [
-            "High School", "Some College", "Associate Degree", 
+            "High School", "Some College", "Associate Degree",
             "Bachelor's Degree", "Master's Degree", "Doctoral Degree",
             "Professional Degree", "Other", "Prefer not to answer"
         ]
-        
+
         if education not in valid_education:
-            self.add_error(field_name, "Please select a valid education level")
-            return False
-        
-        return True
-    
-    def validate_risk_tolerance(self, field_name: str, risk_tolerance: str) -> bool:
+            return _failed(field_name, "Please select a valid education level")
+
+        return _passed(field_name)
+
+    def validate_risk_tolerance(self, field_name: str, risk_tolerance: str) -> ValidationResult:
         """Validate risk tolerance selection"""
         if not risk_tolerance:
-            return True  # Allow empty unless required
-        
+            return _passed(field_name)  # Allow empty unless required
+
         valid_risk_levels = [
             "Conservative", "Moderate", "Moderate Aggressive", "Aggressive"
         ]
-        
+
         if risk_tolerance not in valid_risk_levels:
-            self.add_error(field_name, "Please select a valid risk tolerance level")
-            return False
-        
-        return True
-    
-    def validate_investment_objectives(self, field_name: str, objectives: str) -> bool:
+            return _failed(field_name, "Please select a valid risk tolerance level")
+
+        return _passed(field_name)
+
+    def validate_investment_objectives(self, field_name: str, objectives: str) -> ValidationResult:
         """Validate investment objectives selection"""
         if not objectives:
-            return True  # Allow empty unless required
-        
+            return _passed(field_name)  # Allow empty unless required
+
         valid_objectives = [
             "Income", "Growth and Income", "Capital Appreciation", "Speculation"
         ]
-        
+
         if objectives not in valid_objectives:
-            self.add_error(field_name, "Please select a valid investment objective")
-            return False
-        
-        return True
-    
-    def validate_trusted_contact_info(self, data: Dict) -> bool:
+            return _failed(field_name, "Please select a valid investment objective")
+
+        return _passed(field_name)
+
+    def validate_trusted_contact_info(self, data: Dict) -> ValidationReport:
         """Validate trusted contact information if opted in"""
-        valid = True
-        
         if not data.get("trusted_contact_opt_in", False):
-            return True  # Skip validation if not opted in
-        
-        # Required fields for trusted contact
-        if not self.validate_required_field("Trusted Contact Name", data.get("trusted_contact_name", "")):
-            valid = False
-        
-        if not self.validate_required_field("Trusted Contact Relationship", data.get("trusted_contact_relationship", "")):
-            valid = False
-        
-        # Phone number validation
-        if not self.validate_phone("Trusted Contact Phone", data.get("trusted_contact_phone", "")):
-            valid = False
-        
+            return ValidationReport()  # Skip validation if not opted in
+
+        results = [
+            # Required fields for trusted contact
+            self.validate_required_field("Trusted Contact Name", data.get("trusted_contact_name", "")),
+            self.validate_required_field("Trusted Contact Relationship", data.get("trusted_contact_relationship", "")),
+            # Phone number validation
+            self.validate_phone("Trusted Contact Phone", data.get("trusted_contact_phone", "")),
+        ]
+
         # Email validation (optional but if provided must be valid)
         trusted_email = data.get("trusted_contact_email", "")
-        if trusted_email and not self.validate_email("Trusted Contact Email", trusted_email):
-            valid = False
-        
-        return valid
-    
-    def validate_retirement_info(self, data: Dict) -> bool:
+        if trusted_email:
+            results.append(self.validate_email("Trusted Contact Email", trusted_email))
+
+        return ValidationReport.collect(*results)
+
+    def validate_retirement_info(self, data: Dict) -> ValidationReport:
         """Validate retirement-specific information"""
-        valid = True
-        
         employment_status = data.get("employment_status", "")
         if employment_status != "Retired":
-            return True  # Skip validation if not retired
-        
+            return ValidationReport()  # Skip validation if not retired
+
         # Required fields for retired individuals
-        if not self.validate_required_field("Former Employer", data.get("former_employer", "")):
-            valid = False
-        
-        if not self.validate_required_field("Source of Income", data.get("retirement_income_source", "")):
-            valid = False
-        
-        return valid
-    
-    def validate_expanded_asset_experience(self, data: Dict) -> bool:
+        return ValidationReport.collect(
+            self.validate_required_field("Former Employer", data.get("former_employer", "")),
+            self.validate_required_field("Source of Income", data.get("retirement_income_source", "")),
+        )
+
+    def validate_expanded_asset_experience(self, data: Dict) -> ValidationReport:
         """Validate expanded asset experience information"""
-        valid = True
-        
+        results = []
+
         # List of all asset types
         asset_types = [
-            "Stocks/Bonds", "Mutual Funds", "UITs", "Annuities Fixed", 
-            "Annuities Variable", "Options", "Commodities", 
+            "Stocks/Bonds", "Mutual Funds", "UITs", "Annuities Fixed",
+            "Annuities Variable", "Options", "Commodities",
             "Alternative Investments", "Limited Partnerships", "Variable Contracts"
         ]
-        
+
         asset_experience = data.get("expanded_asset_experience", {})
-        
+
         for asset in asset_types:
-            asset_key = asset.lower().replace("/", "_").replace(" ", "_")
             experience_data = asset_experience.get(asset, {})
-            
+
             # Validate year started if provided
             year_started = experience_data.get("year_started", "")
             if year_started:
                 try:
                     year = int(year_started)
-                    current_year = datetime.now().year
-                    if year < 1950 or year > current_year:
-                        self.add_error(f"{asset} Experience Year", 
-                                     f"Year must be between 1950 and {current_year}")
-                        valid = False
                 except ValueError:
-                    self.add_error(f"{asset} Experience Year", "Please enter a valid year")
-                    valid = False
-        
-        return valid
-    
-    def validate_financial_info_extended(self, data: Dict) -> bool:
+                    results.append(_failed(f"{asset} Experience Year", "Please enter a valid year"))
+                    continue
+                current_year = datetime.now().year
+                if year < 1950 or year > current_year:
+                    results.append(_failed(f"{asset} Experience Year",
+                                           f"Year must be between 1950 and {current_year}"))
+
+        return ValidationReport.collect(*results)
+
+    def validate_financial_info_extended(self, data: Dict) -> ValidationReport:
         """Validate extended financial information"""
-        valid = True
-        
-        # Validate annual income
-        if not self.validate_annual_income("Annual Income", data.get("annual_income", "")):
-            valid = False
-        
-        # Validate tax bracket
-        if not self.validate_tax_bracket("Tax Bracket", data.get("tax_bracket", "")):
-            valid = False
-        
-        # Validate education status
-        if not self.validate_education_status("Education Status", data.get("education_status", "")):
-            valid = False
-        
-        # Validate risk tolerance
-        if not self.validate_risk_tolerance("Risk Tolerance", data.get("risk_tolerance", "")):
-            valid = False
-        
-        # Validate investment objectives
-        if not self.validate_investment_objectives("Investment Objectives", data.get("investment_objectives", "")):
-            valid = False
-        
-        # Validate trusted contact info
-        if not self.validate_trusted_contact_info(data):
-            valid = False
-        
-        # Validate retirement info
-        if not self.validate_retirement_info(data):
-            valid = False
-        
-        # Validate expanded asset experience
-        if not self.validate_expanded_asset_experience(data):
-            valid = False
-        
-        return valid
-
-# Global validator instance
-form_validator = FormValidator()
+        return ValidationReport.collect(
+            self.validate_annual_income("Annual Income", data.get("annual_income", "")),
+            self.validate_tax_bracket("Tax Bracket", data.get("tax_bracket", "")),
+            self.validate_education_status("Education Status", data.get("education_status", "")),
+            self.validate_risk_tolerance("Risk Tolerance", data.get("risk_tolerance", "")),
+            self.validate_investment_objectives("Investment Objectives", data.get("investment_objectives", "")),
+            self.validate_trusted_contact_info(data),
+            self.validate_retirement_info(data),
+            self.validate_expanded_asset_experience(data),
+        )
 
+# Global validator instance (stateless, safe to share)
+form_validator = FormValidator()
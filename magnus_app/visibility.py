@@ -0,0 +1,55 @@
+"""Show/hide bookkeeping for a page's conditional (``show_if``) containers.
+
+The engine remembers whether each container is currently shown and which
+fields its condition reads.  ``update(values, changed)`` re-evaluates only
+the conditions that read ``changed`` (all of them when it is None) and
+calls ``setVisible`` only for containers that actually flip, all inside one
+``setUpdatesEnabled(False)`` batch so the page lays out once.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from PyQt6.QtWidgets import QWidget
+
+from .conditions import Condition, compile_condition
+
+
+class VisibilityEngine:
+    def __init__(
+        self, root: QWidget, groups: List[Tuple[QWidget, Union[str, Mapping[str, Any]]]]
+    ) -> None:
+        self.root = root
+        self._widgets: List[QWidget] = []
+        self._conditions: List[Condition] = []
+        self._shown: List[Optional[bool]] = []  # None until first evaluated
+        self._by_field: Dict[str, List[int]] = {}
+        for i, (widget, cond) in enumerate(groups):
+            condition = compile_condition(cond)
+            self._widgets.append(widget)
+            self._conditions.append(condition)
+            self._shown.append(None)
+            for dep in condition.deps:
+                self._by_field.setdefault(dep, []).append(i)
+
+    def update(self, values: Mapping[str, Any], changed: Optional[str] = None) -> int:
+        """Apply visibility for ``values``; returns how many containers flipped."""
+        if changed is None:
+            candidates = range(len(self._widgets))
+        else:
+            candidates = self._by_field.get(changed, ())
+        flips = []
+        for i in candidates:
+            shown = self._conditions[i](values)
+            if shown != self._shown[i]:
+                flips.append((i, shown))
+        if not flips:
+            return 0
+        self.root.setUpdatesEnabled(False)
+        try:
+            for i, shown in flips:
+                self._widgets[i].setVisible(shown)
+                self._shown[i] = shown
+        finally:
+            self.root.setUpdatesEnabled(True)
+        return len(flips)
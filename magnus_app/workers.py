@@ -0,0 +1,48 @@
+"""Background work for the window, with results delivered on the GUI thread.
+
+``workers().submit(fn, *args, on_done=callback)`` runs ``fn`` on a small
+thread pool; ``callback(future)`` is then invoked on the GUI thread through
+a queued signal, so it may touch widgets.  The pool is created on first use.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+
+class Workers(QObject):
+    # (callback, future); emitted from pool threads, handled on the GUI thread
+    _finished = pyqtSignal(object, object)
+
+    def __init__(self, max_workers: int = 2) -> None:
+        super().__init__()
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._finished.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, on_done: Optional[Callable[[Future], None]] = None
+    ) -> Future:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="magnus-worker")
+        future = self._pool.submit(fn, *args)
+        if on_done is not None:
+            future.add_done_callback(lambda f: self._finished.emit(on_done, f))
+        return future
+
+    @staticmethod
+    def _deliver(callback: Callable[[Future], None], future: Future) -> None:
+        callback(future)
+
+
+_WORKERS: Optional[Workers] = None
+
+
+def workers() -> Workers:
+    """The shared instance; call once a QApplication exists."""
+    global _WORKERS
+    if _WORKERS is None:
+        _WORKERS = Workers()
+    return _WORKERS
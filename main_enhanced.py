@@ -2,9 +2,9 @@
 
 This script allows running the app directly or packaging it with PyInstaller.
 """
-from magnus_app.app import _log, log_path, main
+from magnus_app.app import _boot, _log, log_path, main
 
-_log("[BOOT] Entry script started")
+_boot("entry script started")
 
 
 if __name__ == "__main__":
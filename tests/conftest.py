@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Run from a checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Keep the crash log (written when a validator raises) out of the user's folder
+os.environ.setdefault("MAGNUS_LOG_DIR", tempfile.mkdtemp(prefix="magnus-test-logs-"))
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from magnus_app import batch_validation
+from magnus_app.batch_validation import RULES, checked_fields, load_columns, scan_column, validate_drafts
+from magnus_app.validation import VALIDATORS
+
+
+@pytest.mark.parametrize(
+    "rule, values, bad",
+    [
+        ("crd", ["1234", "", "12", "12345678", "123456789"], [2, 4]),
+        ("ticker", ["AAPL", "BRK.B", "aapl", "TOOLONG"], [2, 3]),
+        ("pct_0_100_two_dec", ["0", "99.99", "100", "100.01", "5.123", "abc"], [3, 4, 5]),
+        ("iso_date", ["2024-02-29", "2023-02-29", "2024-13-01", "24-1-1x", ""], [1, 2, 3]),
+        ("ssn", ["123-45-6780", "123456789", "12345678", "000-00-0000"], [1, 2, 3]),
+        ("phone", ["(555) 123-4567", "555-1234", ""], [1]),
+        ("email", ["a@b.co", "not an email", "x@y"], [1, 2]),
+    ],
+)
+def test_scan_flags_the_failing_positions(rule, values, bad):
+    assert [pos for pos, _ in scan_column(values, RULES[rule])] == bad
+
+
+@pytest.mark.parametrize("rule", ["crd", "ticker", "pct_0_100_two_dec", "iso_date"])
+def test_scan_agrees_with_the_form(rule):
+    values = ["1234", "AAPL", "50.5", "100.5", "2024-01-31", "2024-02-30", "x", "12345678901"]
+    expected = [pos for pos, v in enumerate(values) if not VALIDATORS[rule](v, {})]
+    assert [pos for pos, _ in scan_column(values, RULES[rule])] == expected
+
+
+def test_multiline_value_keeps_rows_aligned():
+    values = ["1234", "1234\n5678", "5678", "12"]
+    assert [pos for pos, _ in scan_column(values, RULES["crd"])] == [1, 3]
+
+
+def test_marker_character_in_a_value_fails():
+    values = ["\x01", "1234", "12\x0134"]
+    assert [pos for pos, _ in scan_column(values, RULES["crd"])] == [0, 2]
+
+
+def test_confirm_rejections_use_their_own_message():
+    failed = scan_column(["111-11-1111", "1234"], RULES["ssn"])
+    assert failed == [(0, "Please enter a valid SSN"), (1, "SSN must be 9 digits")]
+
+
+def test_empty_column():
+    assert scan_column([], RULES["crd"]) == []
+
+
+PAGES = [
+    {
+        "key": "p",
+        "sections": [
+            {
+                "fields": [
+                    {"type": "text", "name": "rep_crd", "validate": "crd"},
+                    {"type": "text", "name": "home_phone"},
+                    {"type": "text", "name": "nickname"},
+                    {
+                        "type": "repeating_group",
+                        "name": "holdings",
+                        "fields": [
+                            {"type": "text", "name": "ticker", "validate": "ticker"},
+                            {"type": "text", "name": "pct", "validate": "pct_0_100_two_dec"},
+                        ],
+                    },
+                ]
+            }
+        ],
+    }
+]
+
+
+def test_checked_fields():
+    assert checked_fields(PAGES) == {
+        (None, "rep_crd"): "crd",
+        (None, "home_phone"): "phone",
+        ("holdings", "ticker"): "ticker",
+        ("holdings", "pct"): "pct_0_100_two_dec",
+    }
+
+
+def test_load_columns_tracks_rows_and_items():
+    drafts = [{"holdings": [{"ticker": "A"}, "junk", {"ticker": "B"}]}, {"holdings": None}, {"holdings": [{"ticker": 0}]}]
+    col = load_columns(drafts, [("holdings", "ticker")])[("holdings", "ticker")]
+    assert col.values == ["A", "B", ""]
+    assert [col.row(i) for i in range(3)] == [0, 0, 2]
+    assert [col.item(i) for i in range(3)] == [0, 2, 0]
+
+
+def test_validate_drafts_reports_draft_field_and_item():
+    drafts = [
+        {"rep_crd": "1234", "home_phone": "555-123-4567", "holdings": [{"ticker": "AAPL", "pct": "40"}]},
+        {"rep_crd": "12", "nickname": "??", "holdings": [{"ticker": "MSFT"}, {"ticker": "bad", "pct": "101"}]},
+    ]
+    violations = validate_drafts(drafts, ["a.json", "b.json"], PAGES)
+    assert [(v.draft, v.field, v.item, v.value) for v in violations] == [
+        ("b.json", "holdings.pct", 1, "101"),
+        ("b.json", "holdings.ticker", 1, "bad"),
+        ("b.json", "rep_crd", None, "12"),
+    ]
+
+
+def test_cli_exit_status_and_report(tmp_path):
+    (tmp_path / "good.json").write_text(json.dumps({}))
+    (tmp_path / "broken.json").write_text("{")
+    report = tmp_path / "report.json"
+    assert batch_validation.main([str(tmp_path), "--json", str(report)]) == 1
+    data = json.loads(report.read_text())
+    assert data["checked"] == 1 and data["violations"] == []
+    assert data["unreadable"][0].endswith("broken.json")
@@ -0,0 +1,66 @@
+import pytest
+
+from magnus_app.conditions import ConditionError, clear_cache, compile_condition
+
+
+@pytest.mark.parametrize(
+    "expr, values, expected",
+    [
+        ("age == 30", {"age": "30"}, True),
+        ("age == 30.0", {"age": "30"}, True),
+        ("age != 30", {"age": "30"}, False),
+        ("age >= 30", {"age": "30"}, True),
+        ("age < 30", {"age": "29.5"}, True),
+        ("age == 30", {"age": "abc"}, False),
+        ("age != 30", {"age": ""}, True),
+        ("age > 1", {"age": ""}, False),
+        ("age in (30, 40)", {"age": "40"}, True),
+        ("age not in (30, 40)", {"age": "41"}, True),
+        ("kind in ('A', 1)", {"kind": "A"}, True),
+        ("consent == true", {"consent": True}, True),
+        ("consent == 1", {"consent": True}, False),
+        ("employee_this_bd == 'Yes' and not no_spouse", {"employee_this_bd": "Yes"}, True),
+        ("employee_this_bd == 'Yes' and not no_spouse", {"employee_this_bd": "Yes", "no_spouse": True}, False),
+        ("a == 'x' or (b == 'y' and c)", {"b": "y", "c": "z"}, True),
+        ("name", {"name": ""}, False),
+    ],
+)
+def test_expressions(expr, values, expected):
+    assert compile_condition(expr)(values) is expected
+
+
+def test_item_scope_reads_the_item():
+    cond = compile_condition("item.relationship != 'Spouse' and item.share >= 10", item_scope=True)
+    assert cond({}, {"relationship": "Child", "share": "25"})
+    assert not cond({}, {"relationship": "Spouse", "share": "25"})
+    assert cond.item_deps == {"relationship", "share"}
+    assert cond.deps == frozenset()
+
+
+def test_mapping_form():
+    cond = compile_condition({"sro_member": "Yes"})
+    assert cond({"sro_member": "Yes"})
+    assert not cond({})
+    assert cond.deps == {"sro_member"}
+    # on a repeating-group subfield the mapping reads the item
+    item_cond = compile_condition({"kind": "Trust"}, item_scope=True)
+    assert item_cond({"kind": "Other"}, {"kind": "Trust"})
+
+
+def test_dependencies():
+    cond = compile_condition("membership_type in ('FINRA', 'NYSE') or sro_member == 'Yes'")
+    assert cond.deps == {"membership_type", "sro_member"}
+
+
+@pytest.mark.parametrize("expr", ["age ==", "(a == 'x'", "a not b", "foo.bar == 1", "a == 'x' b"])
+def test_syntax_errors(expr):
+    with pytest.raises(ConditionError):
+        compile_condition(expr)
+
+
+def test_compiled_once_per_spec_object():
+    spec = {"show_if": "a == 'x'"}
+    first = compile_condition(spec["show_if"])
+    assert compile_condition(spec["show_if"]) is first
+    clear_cache()
+    assert compile_condition(spec["show_if"]) is not first
@@ -0,0 +1,156 @@
+import pytest
+
+from magnus_app.form_check import REQUIRED, Issue, check_page, check_pages, page_progress, snapshot
+from magnus_app.state import FieldRef
+from magnus_app.validation import VALIDATORS, Validator
+
+
+def iterate(fields, data):
+    """Every field visible; repeating groups expanded per item."""
+    for field in fields:
+        if field.get("type") == "repeating_group":
+            for i, _item in enumerate(data.get(field["name"], [])):
+                for sub in field["fields"]:
+                    yield FieldRef(sub, field["name"], i)
+        elif field.get("type") != "label":
+            yield FieldRef(field)
+
+
+HOLDINGS = {
+    "type": "repeating_group",
+    "name": "holdings",
+    "fields": [
+        {"type": "text", "name": "ticker", "label": "Ticker", "validate": "ticker"},
+        {"type": "text", "name": "pct", "label": "Allocation", "sum_to": 100},
+    ],
+}
+
+PAGES = [
+    {
+        "key": "client",
+        "sections": [
+            {
+                "fields": [
+                    {"type": "label", "text": "Client"},
+                    {"type": "text", "name": "full_name", "label": "Full name", "required": True},
+                    {"type": "checkbox", "name": "agree", "label": "Agree", "required": True},
+                    {"type": "text", "name": "rep_crd", "label": "Rep CRD", "validate": "crd"},
+                    {"type": "text", "name": "client_ssn", "label": "SSN"},
+                ]
+            }
+        ],
+    },
+    {"key": "holdings", "sections": [{"fields": [HOLDINGS]}]},
+]
+
+
+def _check(index, data, **kwargs):
+    return check_page(index, data, iterate, pages=PAGES, **kwargs)
+
+
+def test_clean_page():
+    data = {"full_name": "Ada", "agree": True, "rep_crd": "1234", "client_ssn": "123-45-6780"}
+    assert _check(0, data) == ()
+
+
+def test_required_validate_and_format_checks():
+    data = {"full_name": "", "agree": False, "rep_crd": "12", "client_ssn": "111-11-1111"}
+    issues = _check(0, data)
+    assert [(i.name, i.message == REQUIRED) for i in issues] == [
+        ("full_name", True),
+        ("agree", True),
+        ("rep_crd", False),
+        ("client_ssn", False),
+    ]
+    assert all(i.page == 0 and i.group is None and i.item is None for i in issues)
+
+
+def test_group_items_are_labelled_and_only_first_failure_counts():
+    data = {"holdings": [{"ticker": "AAPL", "pct": "60"}, {"ticker": "bad", "pct": "40"}]}
+    (issue,) = _check(1, data)
+    assert issue[:4] == (1, "ticker", "holdings", 1)
+    assert issue.label == "Ticker (#2)"
+
+
+@pytest.mark.parametrize(
+    "pcts, ok",
+    [(["60", "40"], True), (["60", "30"], False), (["33.33", "33.33", "33.34"], True), (["100", "x"], True)],
+)
+def test_sum_to_totals_from_data(pcts, ok):
+    data = {"holdings": [{"ticker": "A", "pct": p} for p in pcts]}
+    issues = _check(1, data)
+    assert (issues == ()) is ok
+    if not ok:
+        (issue,) = issues
+        assert issue.label == "Allocation (total)" and issue.item is None
+
+
+def test_sum_to_skipped_without_values():
+    assert _check(1, {"holdings": [{"ticker": "A"}]}) == ()
+
+
+def test_passed_totals_win_over_the_data():
+    data = {"holdings": [{"ticker": "A", "pct": "60"}, {"ticker": "B", "pct": "40"}]}
+    assert _check(1, data, totals={("holdings", "pct"): (90.0, 2)}) != ()
+    bad = {"holdings": [{"ticker": "A", "pct": "10"}]}
+    assert _check(1, bad, totals={("holdings", "pct"): (100.0, 1)}) == ()
+
+
+def test_check_pages_and_snapshot():
+    state = {"full_name": "Ada", "agree": True, "holdings": [{"ticker": "A", "pct": "100"}]}
+    copy = snapshot(state)
+    state["holdings"][0]["pct"] = "50"
+    result = check_pages(range(2), copy, iterate, pages=PAGES)
+    assert result == {0: (), 1: ()}
+    assert isinstance(check_pages([1], state, iterate, pages=PAGES)[1][0], Issue)
+
+
+def test_page_progress(monkeypatch):
+    monkeypatch.setattr("magnus_app.form_check.PAGES", PAGES)
+    progress = page_progress(0, {"full_name": "Ada"}, iterate)
+    assert (progress.filled, progress.shown, progress.started) == (1, 4, True)
+    assert not page_progress(0, {}, iterate).started
+
+
+# ------------------------------------------------ background validators --
+@pytest.fixture
+def slow_check(monkeypatch):
+    calls = []
+
+    def lookup(value):
+        calls.append(value)
+        return value != "9999"
+
+    monkeypatch.setitem(VALIDATORS, "t_lookup", Validator("t_lookup", lookup, message="Blocked", background=True))
+    return calls
+
+
+def _async_page():
+    field = {"type": "text", "name": "rep_crd", "validate": "crd", "validate_async": "t_lookup"}
+    return [{"key": "p", "sections": [{"fields": [field]}]}]
+
+
+def test_background_validators_skipped_on_the_gui_thread(slow_check):
+    assert check_page(0, {"rep_crd": "9999"}, iterate, pages=_async_page()) == ()
+    assert slow_check == []
+
+
+def test_background_validators_run_on_a_worker(slow_check):
+    (issue,) = check_page(0, {"rep_crd": "9999"}, iterate, background=True, pages=_async_page())
+    assert issue.message == "Blocked" and slow_check == ["9999"]
+
+
+def test_format_failure_stops_before_the_background_check(slow_check):
+    (issue,) = check_page(0, {"rep_crd": "x"}, iterate, background=True, pages=_async_page())
+    assert issue.message == VALIDATORS["crd"].message and slow_check == []
+
+
+def test_raising_validator_is_logged_and_passes(monkeypatch):
+    def broken(value):
+        raise OSError("dataset missing")
+
+    logged = []
+    monkeypatch.setitem(VALIDATORS, "t_lookup", Validator("t_lookup", broken, background=True))
+    monkeypatch.setattr("magnus_app.app._log", logged.append)
+    assert check_page(0, {"rep_crd": "1234"}, iterate, background=True, pages=_async_page()) == ()
+    assert len(logged) == 1 and "t_lookup" in logged[0] and "dataset missing" in logged[0]
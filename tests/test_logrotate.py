@@ -0,0 +1,90 @@
+import gzip
+import os
+import sys
+import time
+
+from magnus_app.logrotate import LogRotator
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def _archives(log):
+    return sorted(log.parent.glob(f"{log.stem}-*{log.suffix}.gz"))
+
+
+def test_size_rotation_compresses_off_thread(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("x" * 200)
+    rot = LogRotator(log, max_bytes=100)
+    rot.after_write(50)
+    assert log.exists()
+
+    rot.after_write(200)
+    assert not log.exists()
+    assert _wait_for(lambda: len(_archives(log)) == 1)
+    with gzip.open(_archives(log)[0], "rt") as f:
+        assert f.read() == "x" * 200
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_start_time_survives_restarts(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("old\n")
+    LogRotator(log)
+    started = float((tmp_path / "app.log.started").read_text())
+
+    # appending keeps the mtime fresh; the age must still come from the sidecar
+    os.utime(log, None)
+    assert LogRotator(log)._started == started
+
+
+def test_age_rotation_uses_the_sidecar(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("old\n")
+    (tmp_path / "app.log.started").write_text(repr(time.time() - 10 * 86400))
+    rot = LogRotator(log, max_age_seconds=7 * 86400)
+    rot.start()
+    assert not log.exists()
+    assert time.time() - float((tmp_path / "app.log.started").read_text()) < 60
+    assert _wait_for(lambda: len(_archives(log)) == 1)
+
+
+def test_bad_leftover_does_not_block_the_others(tmp_path, capsys, monkeypatch):
+    monkeypatch.delitem(sys.modules, "magnus_app.app", raising=False)  # report to stderr
+    log = tmp_path / "app.log"
+    (tmp_path / "app-20240101-000000.log").mkdir()  # cannot be opened for reading
+    (tmp_path / "app-20240102-000000.log").write_text("left over\n")
+    rot = LogRotator(log)
+    rot.start()
+    assert _wait_for(lambda: len(_archives(log)) == 1)
+    assert _wait_for(lambda: "could not compress app-20240101-000000.log" in capsys.readouterr().err)
+
+
+def test_prune_keeps_newest_and_caps_total(tmp_path):
+    log = tmp_path / "app.log"
+    now = time.time()
+    for day in range(5):
+        path = tmp_path / f"app-2024010{day + 1}-000000.log.gz"
+        path.write_bytes(b"z" * 100)
+        os.utime(path, (now - (5 - day) * 86400,) * 2)
+
+    LogRotator(log, keep=3)._prune()
+    assert [p.name[:12] for p in _archives(log)] == ["app-20240103", "app-20240104", "app-20240105"]
+
+    LogRotator(log, keep=3, max_total_bytes=250)._prune()
+    assert [p.name[:12] for p in _archives(log)] == ["app-20240104", "app-20240105"]
+
+
+def test_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("MAGNUS_LOG_MAX_MB", "1")
+    monkeypatch.setenv("MAGNUS_LOG_KEEP", "not a number")
+    rot = LogRotator.from_env(tmp_path / "app.log")
+    assert rot.max_bytes == 1024 * 1024
+    assert rot.keep == 10
@@ -0,0 +1,51 @@
+from magnus_app.state import RunningTotal
+
+
+def test_sums_in_hundredths_without_drift():
+    total = RunningTotal(100)
+    for key in range(10):
+        total.set(key, "10.1")
+    for key in range(10):
+        total.discard(key)
+    assert total.total == 0
+    total.set("a", "33.33")
+    total.set("b", "33.33")
+    total.set("c", "33.34")
+    assert total.total == 100
+    assert total.complete
+    assert len(total) == 3
+
+
+def test_replacing_an_items_value():
+    total = RunningTotal(100)
+    total.set("a", "60")
+    total.set("b", "40")
+    total.set("b", "30")
+    assert total.total == 90
+    assert not total.complete
+
+
+def test_empty_value_drops_the_item():
+    total = RunningTotal(100)
+    total.set("a", "60")
+    total.set("a", "")
+    assert total.total == 0
+    assert len(total) == 0
+
+
+def test_invalid_percentages_are_left_out():
+    total = RunningTotal(100)
+    total.set("a", "150")
+    total.set("b", "-50")
+    assert total.total == 0
+    assert len(total) == 0
+    assert not total.complete
+
+    total.set("a", "60")
+    total.set("b", "40")
+    assert total.complete
+    total.set("b", "abc")  # an invalid edit takes the old part out too
+    assert total.total == 60
+    assert len(total) == 1
+    total.set("a", "12.345")  # more than two decimals
+    assert total.total == 0
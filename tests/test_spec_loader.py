@@ -0,0 +1,140 @@
+import copy
+import json
+import os
+import time
+
+import pytest
+
+from magnus_app import spec_loader
+from magnus_app.form_check import affected_pages
+from magnus_app.pages import PAGES
+from magnus_app.spec_loader import SpecError, check_pages, install_pages, load_pages
+
+
+def _page(key="p1", fields=None):
+    return {
+        "key": key,
+        "title": key.upper(),
+        "sections": [{"title": "S", "fields": fields if fields is not None else [
+            {"type": "text", "name": f"{key}_name", "label": "Name", "validate": "crd"},
+            {"type": "select", "name": f"{key}_country", "options": "ISO_COUNTRIES"},
+        ]}],
+    }
+
+
+def _write(spec_dir, name, pages):
+    spec_dir.mkdir(exist_ok=True)
+    (spec_dir / name).write_text(json.dumps(pages), encoding="utf-8")
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv(spec_loader.SPEC_CACHE_ENV, str(path))
+    return path
+
+
+@pytest.fixture
+def restore_pages():
+    saved = copy.deepcopy(PAGES)
+    yield
+    install_pages(saved)
+
+
+# ---------------------------------------------------------------- schema --
+def test_builtin_pages_pass(monkeypatch):
+    monkeypatch.setattr(spec_loader, "VALIDATORS", {**spec_loader.VALIDATORS, "crd_snapshot": None})
+    check_pages(PAGES)
+
+
+@pytest.mark.parametrize(
+    "field, message",
+    [
+        ({"type": "text", "name": "a", "colour": "red"}, "unknown key 'colour'"),
+        ({"type": "text", "name": "a", "required": "yes"}, "wrong type"),
+        ({"type": "slider", "name": "a"}, "unknown field type"),
+        ({"type": "text"}, "needs a 'name'"),
+        ({"type": "select", "name": "a", "options": "PLANETS"}, "unknown option list"),
+        ({"type": "text", "name": "a", "show_if": "b =="}, "show_if"),
+        ({"type": "text", "name": "a", "validate": "crd "}, "unknown validator 'crd '"),
+        ({"type": "text", "name": "a", "validate_async": "nope"}, "unknown validator 'nope'"),
+        ({"type": "group", "fields": []}, "needs 'show_if' and 'fields'"),
+    ],
+)
+def test_schema_errors(field, message):
+    with pytest.raises(SpecError, match=message):
+        check_pages([_page(fields=[field])], ["01.json"])
+
+
+def test_duplicate_names_across_pages():
+    with pytest.raises(SpecError, match="already used"):
+        check_pages([_page("a", [{"type": "text", "name": "x"}]), _page("b", [{"type": "text", "name": "x"}])])
+
+
+def test_subfield_names_only_unique_per_item():
+    group = {"type": "repeating_group", "name": "kids", "fields": [{"type": "text", "name": "x"}]}
+    check_pages([_page(fields=[{"type": "text", "name": "x"}, group])])
+
+
+def test_error_names_the_file(tmp_path, cache_dir):
+    _write(tmp_path / "specs", "01_a.json", _page(fields=[{"type": "nope", "name": "a"}]))
+    with pytest.raises(SpecError, match="01_a.json"):
+        load_pages(tmp_path / "specs")
+
+
+# ----------------------------------------------------------------- cache --
+def test_cache_hit_and_content_key(tmp_path, cache_dir):
+    specs = tmp_path / "specs"
+    _write(specs, "01_a.json", [_page("a"), _page("b")])
+    pages, cached = load_pages(specs)
+    assert not cached and [p["key"] for p in pages] == ["a", "b"]
+    assert load_pages(specs) == (pages, True)
+
+    _write(specs, "01_a.json", [_page("a")])
+    pages, cached = load_pages(specs)
+    assert not cached and len(pages) == 1
+    assert len(list(cache_dir.glob("*.json"))) == 2  # the old one is within the grace period
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path, cache_dir):
+    specs = tmp_path / "specs"
+    _write(specs, "01_a.json", _page("a"))
+    load_pages(specs)
+    (cache_file,) = cache_dir.glob("*.json")
+    cache_file.write_text('{"not": "pages"}')
+    pages, cached = load_pages(specs)
+    assert not cached and pages[0]["key"] == "a"
+
+
+def test_prunes_only_its_own_stale_entries(tmp_path, cache_dir):
+    first, second = tmp_path / "one", tmp_path / "two"
+    _write(first, "01.json", _page("a"))
+    _write(second, "01.json", _page("b"))
+    load_pages(first)
+    load_pages(second)
+    old = time.time() - 2 * spec_loader._PRUNE_GRACE_SECONDS
+    for path in cache_dir.glob("*.json"):
+        os.utime(path, (old, old))
+
+    _write(first, "01.json", _page("c"))
+    load_pages(first)
+    names = sorted(p.name for p in cache_dir.glob("*.json"))
+    assert len(names) == 2  # first's new entry and second's untouched one
+    assert load_pages(second)[1]
+
+
+def test_validator_names_are_part_of_the_key(tmp_path, cache_dir, monkeypatch):
+    specs = tmp_path / "specs"
+    _write(specs, "01.json", _page("a"))
+    load_pages(specs)
+    monkeypatch.setattr(spec_loader, "VALIDATORS", {"crd": spec_loader.VALIDATORS["crd"]})
+    assert not load_pages(specs)[1]
+
+
+# --------------------------------------------------------------- install --
+def test_install_replaces_pages_in_place(restore_pages):
+    holder = PAGES
+    affected_pages(0)
+    install_pages([_page("a"), _page("b")])
+    assert holder is PAGES and [p["key"] for p in PAGES] == ["a", "b"]
+    assert affected_pages.cache_info().currsize == 0
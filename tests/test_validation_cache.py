@@ -0,0 +1,94 @@
+import pytest
+
+from magnus_app.validation import RESULT_CACHE, VALIDATORS, Validator, _ResultCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    RESULT_CACHE.clear()
+    yield
+    RESULT_CACHE.clear()
+
+
+def _counting(result=True):
+    calls = []
+
+    def func(value, data=None):
+        calls.append((value, dict(data) if data else None))
+        return result
+
+    return func, calls
+
+
+def test_lru_evicts_least_recently_used():
+    cache = _ResultCache(maxsize=2)
+    cache.put(("a",), True)
+    cache.put(("b",), False)
+    assert cache.get(("a",)) is True  # now "b" is the oldest
+    cache.put(("c",), True)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is True and cache.get(("c",)) is True
+    assert cache.stats()["entries"] == 2
+
+
+def test_false_results_are_hits():
+    cache = _ResultCache()
+    cache.put(("x",), False)
+    assert cache.get(("x",)) is False
+    assert cache.get(("y",)) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit rate %"]) == (1, 1, 50.0)
+
+
+def test_clear_resets_counters():
+    cache = _ResultCache()
+    cache.put(("x",), True)
+    cache.get(("x",))
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "hit rate %": 0.0, "entries": 0}
+
+
+def test_single_field_validator_runs_once_per_value():
+    func, calls = _counting(result=False)
+    check = Validator("t_single", func)
+    assert check("a") is False
+    assert check("a", {"other": 1}) is False
+    check("b")
+    assert [value for value, _ in calls] == ["a", "b"]
+
+
+def test_dependency_values_are_part_of_the_key():
+    func, calls = _counting()
+    check = Validator("t_cross", func, deps=("start",))
+    check("2024-02-01", {"start": "2024-01-01", "unrelated": 1})
+    check("2024-02-01", {"start": "2024-01-01", "unrelated": 2})
+    assert len(calls) == 1
+    check("2024-02-01", {"start": "2024-03-01"})
+    check("2024-02-01", {})
+    assert len(calls) == 3
+
+
+def test_unhashable_values_bypass_the_cache():
+    func, calls = _counting()
+    check = Validator("t_list", func, deps=("rows",))
+    check("x", {"rows": [1, 2]})
+    check("x", {"rows": [1, 2]})
+    assert len(calls) == 2
+    assert RESULT_CACHE.stats()["entries"] == 0
+
+
+def test_validators_do_not_share_entries():
+    ok, _ = _counting(result=True)
+    bad, _ = _counting(result=False)
+    assert Validator("t_ok", ok)("v") is True
+    assert Validator("t_bad", bad)("v") is False
+
+
+def test_registered_cross_field_validator():
+    cross = [v for v in VALIDATORS.values() if v.deps]
+    assert cross, "expected at least one cross-field validator in the registry"
+    check = cross[0]
+    data = {dep: "" for dep in check.deps}
+    first = check("2024-01-01", data)
+    assert check("2024-01-01", data) is first
+    assert RESULT_CACHE.stats()["hits"] == 1
@@ -82,20 +82,7 @@ def create_page(form):
 
         for exp_type in experience_types:
             group_box = QGroupBox(exp_type)
-            group_box.setStyleSheet("""
-                QGroupBox {
-                    font-weight: bold;
-                    border: 1px solid #bdc3c7;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px 0 5px;
-                }
-            """)
+            group_box.setProperty("panel", True)
             group_box_layout = QHBoxLayout(group_box)
 
             year_label = QLabel("Year Started:")
@@ -103,25 +90,11 @@ def create_page(form):
             year_input.setObjectName(f"asset_experience_{exp_type.lower().replace(' ', '_').replace('(', '').replace(')', '')}_year")
             year_input.setPlaceholderText("YYYY")
             year_input.setMaximumWidth(80)
-            year_input.setStyleSheet("""
-                QLineEdit {
-                    padding: 5px;
-                    border: 1px solid #bdc3c7;
-                    border-radius: 3px;
-                }
-            """)
 
             level_label = QLabel("Level:")
             level_combo = QComboBox()
             level_combo.setObjectName(f"asset_experience_{exp_type.lower().replace(' ', '_').replace('(', '').replace(')', '')}_level")
             level_combo.addItems(["", "None", "Limited", "Good", "Extensive"])
-            level_combo.setStyleSheet("""
-                QComboBox {
-                    padding: 5px;
-                    border: 1px solid #bdc3c7;
-                    border-radius: 3px;
-                }
-            """)
 
             group_box_layout.addWidget(year_label)
             group_box_layout.addWidget(year_input)
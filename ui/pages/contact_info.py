@@ -20,14 +20,6 @@ def create_page(form):
     address_input.setObjectName("residential_address")
     address_input.setMaximumHeight(80)
     address_input.setPlaceholderText("Street Address\nCity, State ZIP Code")
-    address_input.setStyleSheet("""
-        QTextEdit {
-            padding: 8px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            font-size: 12px;
-        }
-    """)
     layout.addWidget(address_input)
 
     # Email
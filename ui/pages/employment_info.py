@@ -22,14 +22,6 @@ def create_page(form):
             "", "Employed", "Self-Employed", "Unemployed", "Retired", 
             "Student", "Homemaker", "Disabled"
         ])
-        employment_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
         employment_combo.currentTextChanged.connect(form.on_employment_status_changed)
         layout.addWidget(employment_combo)
 
@@ -48,14 +40,6 @@ def create_page(form):
         years_employed_input = QSpinBox()
         years_employed_input.setObjectName("years_employed")
         years_employed_input.setRange(0, 50)
-        years_employed_input.setStyleSheet("""
-            QSpinBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
         layout.addWidget(years_employed_input)
 
         # Annual Income
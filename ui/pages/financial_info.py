@@ -31,14 +31,6 @@ def create_page(form):
         "", "High School", "Some College", "Associate Degree", 
         "Bachelor's Degree", "Master's Degree", "Doctorate", "Other"
     ])
-    education_combo.setStyleSheet("""
-        QComboBox {
-            padding: 8px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            font-size: 12px;
-        }
-    """)
     layout.addWidget(education_combo)
 
     # Tax Bracket
@@ -48,14 +40,6 @@ def create_page(form):
     tax_bracket_combo.addItems([
         "", "0-15%", "15%-32%", "32%+"
     ])
-    tax_bracket_combo.setStyleSheet("""
-        QComboBox {
-            padding: 8px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            font-size: 12px;
-        }
-    """)
     layout.addWidget(tax_bracket_combo)
 
     # Risk Tolerance
@@ -65,14 +49,6 @@ def create_page(form):
     risk_combo.addItems([
         "", "Conservative", "Moderate", "Moderately Aggressive", "Aggressive"
     ])
-    risk_combo.setStyleSheet("""
-        QComboBox {
-            padding: 8px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            font-size: 12px;
-        }
-    """)
     layout.addWidget(risk_combo)
 
     # Investment Purpose
@@ -81,30 +57,7 @@ def create_page(form):
     layout.addWidget(purpose_label)
 
     purpose_group = QGroupBox()
-    purpose_group.setStyleSheet("""
-        QGroupBox {
-            border: 2px solid #bdc3c7;
-            border-radius: 5px;
-            margin-top: 5px;
-            padding: 10px;
-            background-color: #f8f9fa;
-        }
-        QCheckBox {
-            spacing: 8px;
-            font-size: 12px;
-            padding: 5px;
-        }
-        QCheckBox::indicator {
-            width: 20px;
-            height: 20px;
-            border: 2px solid #bdc3c7;
-            border-radius: 3px;
-        }
-        QCheckBox::indicator:checked {
-            background-color: #28a745;
-            border-color: #28a745;
-        }
-    """)
+    purpose_group.setProperty("panel", True)
     purpose_layout = QVBoxLayout(purpose_group)
 
     purpose_options = ["Income", "Growth and Income", "Capital Appreciation", "Speculation"]
@@ -124,26 +77,7 @@ def create_page(form):
     layout.addWidget(objectives_label)
 
     objectives_group = QGroupBox()
-    objectives_group.setStyleSheet("""
-        QGroupBox {
-            border: 2px solid #bdc3c7;
-            border-radius: 5px;
-            margin-top: 5px;
-            padding: 10px;
-            background-color: #f8f9fa;
-        }
-        QSpinBox {
-            padding: 8px;
-            border: 2px solid #bdc3c7;
-            border-radius: 4px;
-            min-width: 80px;
-            font-size: 12px;
-        }
-        QLabel {
-            font-size: 12px;
-            padding: 5px;
-        }
-    """)
+    objectives_group.setProperty("panel", True)
     objectives_layout = QVBoxLayout(objectives_group)
 
     objectives = [
@@ -160,13 +94,6 @@ def create_page(form):
         spinbox.setObjectName(f"investment_objective_{objective.lower().replace(' ', '_')}")
         spinbox.setRange(1, 5)
         spinbox.setValue(3)  # Default to middle priority
-        spinbox.setStyleSheet("""
-            QSpinBox {
-                padding: 8px;
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-            }
-        """)
 
         form.objective_spinboxes[objective] = spinbox
         h_layout.addWidget(label)
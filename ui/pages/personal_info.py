@@ -25,14 +25,6 @@ def create_page(form):
     dob_input.setObjectName("dob")
     dob_input.setDate(QDate.currentDate().addYears(-30))
     dob_input.setCalendarPopup(True)
-    dob_input.setStyleSheet("""
-        QDateEdit {
-            padding: 8px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            font-size: 12px;
-        }
-    """)
     layout.addWidget(dob_input)
 
     layout.addWidget(QLabel("Social Security Number:"))
@@ -45,28 +37,12 @@ def create_page(form):
     citizenship_combo = QComboBox()
     citizenship_combo.setObjectName("citizenship")
     citizenship_combo.addItems(["", "US Citizen", "Permanent Resident", "Non-Resident Alien", "Other"])
-    citizenship_combo.setStyleSheet("""
-        QComboBox {
-            padding: 8px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            font-size: 12px;
-        }
-    """)
     layout.addWidget(citizenship_combo)
 
     layout.addWidget(QLabel("Marital Status:"))
     marital_combo = QComboBox()
     marital_combo.setObjectName("marital_status")
     marital_combo.addItems(["", "Single", "Married", "Divorced", "Widowed", "Separated"])
-    marital_combo.setStyleSheet("""
-        QComboBox {
-            padding: 8px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            font-size: 12px;
-        }
-    """)
     layout.addWidget(marital_combo)
 
     layout.addStretch()
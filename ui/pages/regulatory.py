@@ -43,21 +43,6 @@ def create_page(form):
         parent_layout.addLayout(btn_layout)
         return group
 
-    groupbox_style = """
-        QGroupBox {
-            border: 2px solid #bdc3c7;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding: 10px;
-            background-color: #f8f9fa;
-        }
-        QRadioButton {
-            spacing: 8px;
-            font-size: 12px;
-            padding: 5px;
-        }
-    """
-
     # Page title
     title = QLabel("Regulatory Consent")
     title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
@@ -109,7 +94,7 @@ def create_page(form):
 
     # Broker-Dealer Relationships
     broker_group = QGroupBox("Broker-Dealer Relationships")
-    broker_group.setStyleSheet(groupbox_style)
+    broker_group.setProperty("panel", True)
     broker_layout = QVBoxLayout(broker_group)
     add_yes_no_question(
         broker_layout,
@@ -135,7 +120,7 @@ def create_page(form):
 
     # Regulatory Affiliations
     reg_aff_group = QGroupBox("Regulatory Affiliations")
-    reg_aff_group.setStyleSheet(groupbox_style)
+    reg_aff_group.setProperty("panel", True)
     reg_aff_layout = QVBoxLayout(reg_aff_group)
     add_yes_no_question(
         reg_aff_layout,
@@ -151,7 +136,7 @@ def create_page(form):
 
     # Foreign Financial Accounts
     foreign_group = QGroupBox("Foreign Financial Accounts")
-    foreign_group.setStyleSheet(groupbox_style)
+    foreign_group.setProperty("panel", True)
     foreign_layout = QVBoxLayout(foreign_group)
     add_yes_no_question(
         foreign_layout,
@@ -172,7 +157,7 @@ def create_page(form):
 
     # Politically Exposed Persons
     pep_group = QGroupBox("Politically Exposed Persons")
-    pep_group.setStyleSheet(groupbox_style)
+    pep_group.setProperty("panel", True)
     pep_layout = QVBoxLayout(pep_group)
     add_yes_no_question(
         pep_layout,
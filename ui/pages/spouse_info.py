@@ -32,14 +32,6 @@ def create_page(form):
         spouse_dob_input.setObjectName("spouse_dob")
         spouse_dob_input.setDate(QDate.currentDate().addYears(-30))
         spouse_dob_input.setCalendarPopup(True)
-        spouse_dob_input.setStyleSheet("""
-            QDateEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
         layout.addWidget(spouse_dob_input)
 
         # Spouse SSN
@@ -57,14 +49,6 @@ def create_page(form):
             "", "Employed", "Self-Employed", "Unemployed", "Retired", 
             "Student", "Homemaker", "Disabled"
         ])
-        spouse_employment_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-        """)
         layout.addWidget(spouse_employment_combo)
 
         # Spouse Employer Information
@@ -1,75 +1,49 @@
 from PyQt6.QtWidgets import QLineEdit
-from validation import form_validator
+from magnus_app.validation import form_validator
 
 class EnhancedLineEdit(QLineEdit):
-    """Enhanced QLineEdit with validation feedback"""
+    """Enhanced QLineEdit with validation feedback.
+
+    The look comes from the ``validation`` dynamic property ("neutral",
+    "valid" or "invalid") matched by selectors in theme.qss.
+    """
 
     def __init__(self, field_name: str, parent=None):
         super().__init__(parent)
         self.field_name = field_name
-        self.setStyleSheet(
-            """
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border-color: #4CAF50;
-            }
-            """
-        )
+        self.setProperty("validation", "neutral")
+
+    def set_validation_state(self, state: str) -> None:
+        """Switch the validation property, re-polishing only on a change."""
+        if self.property("validation") == state:
+            return
+        self.setProperty("validation", state)
+        # Property selectors are only re-evaluated when the widget is polished
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
 
     def validate_field(self) -> bool:
         """Validate field content and update styling"""
         text = self.text().strip()
 
-        # Basic validation based on field name
+        # Basic validation based on field name; results are per call, so
+        # nothing accumulates across keystrokes
         if "email" in self.field_name.lower():
-            valid = form_validator.validate_email(self.field_name, text)
+            valid = form_validator.validate_email(self.field_name, text).ok
         elif "ssn" in self.field_name.lower():
-            valid = form_validator.validate_ssn(self.field_name, text)
+            valid = form_validator.validate_ssn(self.field_name, text).ok
         elif "phone" in self.field_name.lower():
-            valid = form_validator.validate_phone(self.field_name, text)
+            valid = form_validator.validate_phone(self.field_name, text).ok
         else:
             valid = len(text) > 0 if text else True
 
         # Update styling based on validation
         if text and not valid:
-            self.setStyleSheet(
-                """
-                QLineEdit {
-                    padding: 8px;
-                    border: 2px solid #f44336;
-                    border-radius: 4px;
-                    font-size: 12px;
-                    background-color: #ffebee;
-                }
-                """
-            )
+            self.set_validation_state("invalid")
         elif text and valid:
-            self.setStyleSheet(
-                """
-                QLineEdit {
-                    padding: 8px;
-                    border: 2px solid #4CAF50;
-                    border-radius: 4px;
-                    font-size: 12px;
-                    background-color: #e8f5e8;
-                }
-                """
-            )
+            self.set_validation_state("valid")
         else:
-            self.setStyleSheet(
-                """
-                QLineEdit {
-                    padding: 8px;
-                    border: 2px solid #ddd;
-                    border-radius: 4px;
-                    font-size: 12px;
-                }
-                """
-            )
+            self.set_validation_state("neutral")
 
         return valid